@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark methodology explorer latency on large directories
+
+Usage: python benchmark_explorer.py [entries ...]   (default: 1000 5000)
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from emergence_engine.core import MethodologyExplorer
+
+
+def build_tree(root: Path, entries: int):
+    """Create one directory with `entries` files and a few subdirectories"""
+    big = root / "big"
+    big.mkdir()
+    for i in range(entries):
+        (big / f"{i:05d}_Document.md").write_text(f"# Document {i}\n")
+    for i in range(10):
+        (big / f"zz_section_{i}").mkdir()
+
+
+def time_calls(func, repeat: int) -> float:
+    """Mean latency of func() in microseconds"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def bench_directory(entries: int, repeat: int = 200):
+    """Compare cold (cache cleared every call) and warm explorer listings"""
+    with tempfile.TemporaryDirectory() as tmp:
+        build_tree(Path(tmp), entries)
+        explorer = MethodologyExplorer(tmp)
+        explorer.read_path("big")
+        last_page = (entries + 10 + explorer._page_size - 1) // explorer._page_size
+
+        def cold_page():
+            explorer.invalidate_cache()
+            explorer.explore(page=last_page)
+
+        def warm_page():
+            explorer.explore(page=last_page)
+
+        def warm_select():
+            explorer.explore(selection=entries)
+
+        cold = time_calls(cold_page, repeat)
+        warm = time_calls(warm_page, repeat)
+        select = time_calls(warm_select, repeat)
+
+        print(f"{entries:>7} entries | listing cold {cold:9.1f}us | listing cached {warm:7.1f}us "
+              f"| speedup {cold / warm:6.1f}x | select+read cached {select:7.1f}us")
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1000, 5000]
+    print("📊 Methodology explorer latency (mean per call)")
+    print("=" * 50)
+    for size in sizes:
+        bench_directory(size)
@@ -1,13 +1,50 @@
 # Detailed Agent Implementations
 
 ```python
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterable, List, Optional, Any, Set, Tuple
 from pydantic import BaseModel, Field, validator
 from datetime import datetime
 from enum import Enum
 import json
+import bisect
+import hashlib
+import heapq
+import random
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter, OrderedDict, deque
+from array import array
+from collections.abc import Mapping
 from dataclasses import dataclass
 
+try:
+    import numpy as np
+except ImportError:  # Columnar analytics fall back to loops over the packed arrays
+    np = None
+
+# Memory IDs
+class MemoryIdGenerator:
+    """
+    Monotonic memory IDs of the form mem_<hex>.
+    
+    The number is the current time in nanoseconds, bumped past the last ID
+    issued, so memories created in a tight loop never share an ID and IDs
+    sort in creation order across restarts.
+    """
+    def __init__(self, prefix: str = "mem_"):
+        self.prefix = prefix
+        self._last = 0
+        self._lock = threading.Lock()
+    
+    def __call__(self) -> str:
+        with self._lock:
+            self._last = max(time.time_ns(), self._last + 1)
+            return f"{self.prefix}{self._last:x}"
+
+next_memory_id = MemoryIdGenerator()
+
 # Enhanced Memory Model with validation
 class MemoryType(str, Enum):
     MILESTONE = "milestone"
@@ -20,7 +57,7 @@ class MemoryType(str, Enum):
 
 class Memory(BaseModel):
     """Enhanced memory model with richer metadata"""
-    id: str = Field(default_factory=lambda: f"mem_{datetime.now().timestamp()}")
+    id: str = Field(default_factory=next_memory_id)
     content: str = Field(..., min_length=10, description="The memory description")
     memory_type: MemoryType = Field(..., description="Type of memory")
     year: Optional[int] = Field(None, ge=1900, le=2024, description="Year when this occurred")
@@ -46,56 +83,1183 @@ class Memory(BaseModel):
                 continue
         return [e.lower() for e in v]
 
+# Packed Index Storage
+_KEY_TYPE = 'I'  # Unsigned 32-bit memory keys in packed index lists
+
+class _PackedIndexView(Mapping):
+    """Read-only name -> memory IDs view over an index of packed memory keys"""
+    def __init__(self, index: Dict[str, array], ids: Dict[int, str], registered: Optional[Dict[str, Any]] = None):
+        self._index = index
+        self._ids = ids
+        self._registered = registered  # Names that exist even with no memories
+    
+    def __getitem__(self, name: str) -> List[str]:
+        keys = self._index.get(name)
+        if keys is None:
+            if self._registered is None or name not in self._registered:
+                raise KeyError(name)
+            return []
+        return [self._ids[key] for key in keys]
+    
+    def __iter__(self):
+        return iter(self._index)
+    
+    def __len__(self) -> int:
+        return len(self._index)
+
+# Chronological Index
+class TimelineIndex:
+    """
+    Memory keys ordered by (year, insertion order); undated memories come last.
+    
+    Each year keeps a packed bucket of keys in insertion order and the bucket
+    years are kept sorted, so inserts are O(1) (plus a bisect when a new year
+    appears) and a period query is two bisects plus a slice of the matching
+    buckets.
+    """
+    def __init__(self):
+        self._years: List[int] = []  # Sorted distinct years
+        self._buckets: Dict[int, array] = {}  # Year -> Memory keys in insertion order
+        self._undated = array(_KEY_TYPE)
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __iter__(self):
+        for year in self._years:
+            yield from self._buckets[year]
+        yield from self._undated
+    
+    def insert(self, key: int, year: Optional[int]):
+        """Add a memory after all others with the same year"""
+        if year is None:
+            self._undated.append(key)
+        else:
+            bucket = self._buckets.get(year)
+            if bucket is None:
+                bisect.insort(self._years, year)
+                bucket = self._buckets[year] = array(_KEY_TYPE)
+            bucket.append(key)
+        self._size += 1
+    
+    def remove(self, key: int, year: Optional[int]):
+        """Drop a memory previously inserted with this year"""
+        bucket = self._undated if year is None else self._buckets[year]
+        bucket.remove(key)
+        if year is not None and not bucket:
+            del self._buckets[year]
+            del self._years[bisect.bisect_left(self._years, year)]
+        self._size -= 1
+    
+    def range(self, start_year: int, end_year: int) -> List[int]:
+        """Memory keys dated within [start_year, end_year], in timeline order"""
+        lo = bisect.bisect_left(self._years, start_year)
+        hi = bisect.bisect_right(self._years, end_year)
+        return [key for year in self._years[lo:hi] for key in self._buckets[year]]
+
+# Life-Phase Segmentation
+LIFE_STAGES: List[Tuple[int, int, str]] = [
+    (0, 12, "childhood"),
+    (13, 18, "adolescence"),
+    (19, 25, "young_adulthood"),
+    (26, 40, "early_career"),
+    (41, 60, "midlife"),
+    (61, 100, "later_years")
+]
+TIMELINE_GAP_YEARS = 5  # Consecutive dated years further apart than this are a gap
+
+def _life_phase(name: str, count: int, start_year: int, end_year: int) -> LifePhase:
+    span = max(end_year - start_year + 1, 1)
+    return LifePhase(
+        name=name,
+        start_year=start_year,
+        end_year=end_year,
+        description=f"Phase containing {count} memories ({count / span:.1f} per year)",
+        key_themes=[]
+    )
+
+def _bump(counts: Dict[int, int], key: int, delta: int):
+    count = counts.get(key, 0) + delta
+    if count:
+        counts[key] = count
+    else:
+        del counts[key]
+
+class TimelineSegmenter:
+    """
+    Life phases, timeline gaps and coverage density, kept current per store.
+    
+    Tracks memories per year (with the distinct years kept sorted), per life
+    stage (by age) and per stage year, plus the gaps between consecutive
+    dated years. Adding or removing a memory is a bisect and a few dict
+    updates, and reading the segmentation never touches the memories.
+    
+    A stage with no dated memories is placed using the birth year most
+    memories agree on (year - age), falling back to 1900-2024.
+    """
+    def __init__(self, stages: List[Tuple[int, int, str]] = LIFE_STAGES, gap_years: int = TIMELINE_GAP_YEARS):
+        self.stages = stages
+        self.gap_years = gap_years
+        self._stage_starts = [start_age for start_age, _, _ in stages]
+        self._stage_counts = [0] * len(stages)
+        self._stage_years: List[Dict[int, int]] = [{} for _ in stages]  # Stage -> Year -> Memories
+        self._year_counts: Dict[int, int] = {}
+        self._years: List[int] = []  # Sorted distinct years
+        self._gaps: Dict[int, int] = {}  # Earlier year -> later year, for gaps only
+        self._birth_years: Dict[int, int] = {}  # year - age -> Memories agreeing
+        self.undated = 0
+    
+    @classmethod
+    def from_memories(cls, memories: List[Memory], **options) -> "TimelineSegmenter":
+        segmenter = cls(**options)
+        for memory in memories:
+            segmenter.add(memory.year, memory.age)
+        return segmenter
+    
+    def __len__(self) -> int:
+        return sum(self._year_counts.values()) + self.undated
+    
+    def add(self, year: Optional[int], age: Optional[int]):
+        """Count one memory"""
+        self._update(year, age, 1)
+    
+    def remove(self, year: Optional[int], age: Optional[int]):
+        """Forget one memory previously added with this year and age"""
+        self._update(year, age, -1)
+    
+    def _update(self, year: Optional[int], age: Optional[int], delta: int):
+        if year is None:
+            self.undated += delta
+        else:
+            count = self._year_counts.get(year, 0) + delta
+            if count:
+                self._year_counts[year] = count
+                if count == delta:
+                    self._insert_year(year)
+            else:
+                del self._year_counts[year]
+                self._remove_year(year)
+        if age is None:
+            return
+        stage = bisect.bisect_right(self._stage_starts, age) - 1
+        if stage >= 0 and age <= self.stages[stage][1]:
+            self._stage_counts[stage] += delta
+            if year is not None:
+                _bump(self._stage_years[stage], year, delta)
+        if year is not None:
+            _bump(self._birth_years, year - age, delta)
+    
+    def _insert_year(self, year: int):
+        i = bisect.bisect_left(self._years, year)
+        earlier = self._years[i - 1] if i else None
+        later = self._years[i] if i < len(self._years) else None
+        if earlier is not None:
+            self._gaps.pop(earlier, None)
+            if year - earlier > self.gap_years:
+                self._gaps[earlier] = year
+        if later is not None and later - year > self.gap_years:
+            self._gaps[year] = later
+        self._years.insert(i, year)
+    
+    def _remove_year(self, year: int):
+        i = bisect.bisect_left(self._years, year)
+        del self._years[i]
+        self._gaps.pop(year, None)
+        if i:
+            earlier = self._years[i - 1]
+            self._gaps.pop(earlier, None)
+            if i < len(self._years) and self._years[i] - earlier > self.gap_years:
+                self._gaps[earlier] = self._years[i]
+    
+    def birth_year(self) -> Optional[int]:
+        """Birth year implied by most dated memories with an age"""
+        if not self._birth_years:
+            return None
+        return max(self._birth_years.items(), key=lambda item: (item[1], -item[0]))[0]
+    
+    def phases(self) -> List[LifePhase]:
+        """Life stages with at least one memory, spanning their dated memories"""
+        birth_year = self.birth_year()
+        phases = []
+        for (start_age, end_age, name), count, years in zip(self.stages, self._stage_counts, self._stage_years):
+            if not count:
+                continue
+            if years:
+                start_year, end_year = min(years), max(years)
+            elif birth_year is not None:
+                start_year, end_year = birth_year + start_age, birth_year + end_age
+            else:
+                start_year, end_year = 1900, 2024
+            phases.append(_life_phase(name, count, start_year, end_year))
+        return phases
+    
+    def gaps(self) -> List[Tuple[int, int]]:
+        """(earlier, later) pairs of consecutive dated years more than gap_years apart"""
+        return sorted(self._gaps.items())
+    
+    def coverage(self) -> Dict[str, Any]:
+        """How densely the dated memories cover the years they span"""
+        if not self._years:
+            return {'first_year': None, 'last_year': None, 'dated': 0, 'undated': self.undated,
+                    'years_covered': 0, 'density': 0.0, 'memories_per_year': 0.0}
+        first_year, last_year = self._years[0], self._years[-1]
+        span = last_year - first_year + 1
+        dated = sum(self._year_counts.values())
+        return {
+            'first_year': first_year,
+            'last_year': last_year,
+            'dated': dated,
+            'undated': self.undated,
+            'years_covered': len(self._years),
+            'density': len(self._years) / span,  # Share of spanned years with a memory
+            'memories_per_year': dated / span
+        }
+    
+    def segment(self) -> Dict[str, Any]:
+        """Phases, gaps and coverage together"""
+        return {'phases': self.phases(), 'gaps': self.gaps(), 'coverage': self.coverage()}
+
+# Relationship Graph
+class PeopleGraph:
+    """
+    Weighted co-occurrence graph of the people in stored memories.
+    
+    Two people are linked once per memory they share. Adjacency is sparse
+    (person -> {neighbour: shared memories}) with per-pair year counts, so
+    storing a memory costs O(people^2) for its own people and relationship
+    queries read only the graph, never the memories.
+    """
+    def __init__(self):
+        self._adjacency: Dict[str, Dict[str, int]] = {}  # Person -> Neighbour -> Shared memories
+        self._pair_years: Dict[Tuple[str, str], Dict[int, int]] = {}  # Sorted pair -> Year -> Shared memories
+        self.appearances: Dict[str, int] = {}  # Person -> Memories they appear in
+        self._clusters: Optional[List[List[str]]] = None  # Cached until the graph changes
+    
+    @classmethod
+    def from_memories(cls, memories: List[Memory]) -> "PeopleGraph":
+        graph = cls()
+        for memory in memories:
+            graph.add(memory.people, memory.year)
+        return graph
+    
+    @staticmethod
+    def _pair(a: str, b: str) -> Tuple[str, str]:
+        return (a, b) if a < b else (b, a)
+    
+    def add(self, people: List[str], year: Optional[int]):
+        """Record one memory shared by these people"""
+        self._update(list(dict.fromkeys(people)), year, 1)
+    
+    def remove(self, people: List[str], year: Optional[int]):
+        """Forget one memory previously added with these people and year"""
+        self._update(list(dict.fromkeys(people)), year, -1)
+    
+    def _update(self, people: List[str], year: Optional[int], delta: int):
+        if not people:
+            return
+        self._clusters = None
+        for person in people:
+            count = self.appearances.get(person, 0) + delta
+            if count:
+                self.appearances[person] = count
+                self._adjacency.setdefault(person, {})
+            else:
+                del self.appearances[person]
+                del self._adjacency[person]
+        for i, a in enumerate(people):
+            for b in people[i + 1:]:
+                for x, y in ((a, b), (b, a)):
+                    if x in self._adjacency:
+                        weight = self._adjacency[x].get(y, 0) + delta
+                        if weight:
+                            self._adjacency[x][y] = weight
+                        else:
+                            self._adjacency[x].pop(y, None)
+                if year is not None:
+                    years = self._pair_years.setdefault(self._pair(a, b), {})
+                    years[year] = years.get(year, 0) + delta
+                    if not years[year]:
+                        del years[year]
+                        if not years:
+                            del self._pair_years[self._pair(a, b)]
+    
+    def weight(self, a: str, b: str) -> int:
+        """Memories shared by two people"""
+        return self._adjacency.get(a, {}).get(b, 0)
+    
+    def top_relationships(self, person: str, k: int = 5) -> List[Tuple[str, int]]:
+        """A person's k strongest ties as (person, shared memories)"""
+        neighbours = self._adjacency.get(person, {})
+        return heapq.nlargest(k, neighbours.items(), key=lambda item: (item[1], item[0]))
+    
+    def relationship_timeline(self, a: str, b: str) -> List[Tuple[int, int]]:
+        """(year, shared memories) for two people, oldest first; undated memories are not counted"""
+        return sorted(self._pair_years.get(self._pair(a, b), {}).items())
+    
+    def clusters(self, min_size: int = 2) -> List[List[str]]:
+        """Connected groups of people, largest first"""
+        if self._clusters is None:
+            seen: Set[str] = set()
+            clusters = []
+            for start in self._adjacency:
+                if start in seen:
+                    continue
+                seen.add(start)
+                component, frontier = [start], [start]
+                while frontier:
+                    for neighbour in self._adjacency[frontier.pop()]:
+                        if neighbour not in seen:
+                            seen.add(neighbour)
+                            component.append(neighbour)
+                            frontier.append(neighbour)
+                clusters.append(sorted(component))
+            clusters.sort(key=lambda c: (-len(c), c[0]))
+            self._clusters = clusters
+        return [cluster for cluster in self._clusters if len(cluster) >= min_size]
+
+# Columnar Analytics Store
+MEMORY_TYPE_CODES: Dict[MemoryType, int] = {t: code for code, t in enumerate(MemoryType)}
+_UNKNOWN = -1  # Stored for a missing year or age
+
+class MemoryColumns:
+    """
+    Packed per-memory columns for analytics passes, one row per store.
+    
+    Year, age, type code and emotion count are kept in typed arrays, and
+    people as integer ids in a flat array with per-row offsets, so timeline
+    and phase analytics never touch Memory objects. With NumPy the arrays
+    are viewed without copying and filtered with vector operations; without
+    it the same queries loop over the packed arrays. Re-stored memories
+    leave a dead row behind, masked out by the live column.
+    """
+    def __init__(self):
+        self.ids: List[str] = []
+        self.year = array('h')
+        self.age = array('b')
+        self.type_code = array('b')
+        self.emotion_count = array('H')
+        self.live = bytearray()
+        self.person_offsets = array('L', [0])  # Row i's people are person_ids[offsets[i]:offsets[i + 1]]
+        self.person_ids = array('L')
+        self.person_names: List[str] = []
+        self._person_codes: Dict[str, int] = {}
+        self._rows: Dict[str, int] = {}  # Memory ID -> live row
+    
+    @classmethod
+    def from_memories(cls, memories: List[Memory]) -> "MemoryColumns":
+        columns = cls()
+        for memory in memories:
+            columns.append(memory)
+        return columns
+    
+    def __len__(self) -> int:
+        return len(self._rows)
+    
+    def append(self, memory: Memory):
+        """Add a memory's row, replacing any earlier row for the same ID"""
+        self.append_values(memory.id, memory.year, memory.age, MEMORY_TYPE_CODES[memory.memory_type],
+                           len(memory.emotions), memory.people)
+    
+    def append_values(self, memory_id: str, year: Optional[int], age: Optional[int],
+                      type_code: int, emotion_count: int, people: List[str]):
+        self.discard(memory_id)
+        self._rows[memory_id] = len(self.ids)
+        self.ids.append(memory_id)
+        self.year.append(_UNKNOWN if year is None else year)
+        self.age.append(_UNKNOWN if age is None else age)
+        self.type_code.append(type_code)
+        self.emotion_count.append(emotion_count)
+        self.live.append(1)
+        for person in people:
+            code = self._person_codes.get(person)
+            if code is None:
+                code = self._person_codes[person] = len(self.person_names)
+                self.person_names.append(person)
+            self.person_ids.append(code)
+        self.person_offsets.append(len(self.person_ids))
+    
+    def discard(self, memory_id: str):
+        row = self._rows.pop(memory_id, None)
+        if row is not None:
+            self.live[row] = 0
+    
+    def _vectors(self, *names: str):
+        """Zero-copy NumPy views of the named columns (plus the live mask)"""
+        live = np.frombuffer(self.live, dtype=np.uint8).astype(bool)
+        return [live] + [np.frombuffer(getattr(self, name), dtype=getattr(self, name).typecode) for name in names]
+    
+    def year_span(self) -> Optional[Tuple[int, int]]:
+        """Earliest and latest known year"""
+        if np is not None:
+            live, year = self._vectors('year')
+            dated = year[live & (year != _UNKNOWN)]
+            return (int(dated.min()), int(dated.max())) if dated.size else None
+        dated = [y for y, alive in zip(self.year, self.live) if alive and y != _UNKNOWN]
+        return (min(dated), max(dated)) if dated else None
+    
+    def dated_years(self) -> List[int]:
+        """Distinct known years, ascending"""
+        if np is not None:
+            live, year = self._vectors('year')
+            return np.unique(year[live & (year != _UNKNOWN)]).tolist()
+        return sorted({y for y, alive in zip(self.year, self.live) if alive and y != _UNKNOWN})
+    
+    def age_bracket_stats(self, brackets: List[Tuple[int, int]]) -> List[Tuple[int, Optional[int], Optional[int]]]:
+        """(memory count, earliest year, latest year) per inclusive age bracket"""
+        stats = []
+        if np is not None:
+            live, age, year = self._vectors('age', 'year')
+            for start_age, end_age in brackets:
+                in_bracket = live & (age >= start_age) & (age <= end_age)
+                dated = year[in_bracket & (year != _UNKNOWN)]
+                stats.append((int(in_bracket.sum()),
+                              int(dated.min()) if dated.size else None,
+                              int(dated.max()) if dated.size else None))
+            return stats
+        for start_age, end_age in brackets:
+            count, dated = 0, []
+            for a, y, alive in zip(self.age, self.year, self.live):
+                if alive and a != _UNKNOWN and start_age <= a <= end_age:
+                    count += 1
+                    if y != _UNKNOWN:
+                        dated.append(y)
+            stats.append((count, min(dated) if dated else None, max(dated) if dated else None))
+        return stats
+    
+    def type_counts(self) -> Dict[MemoryType, int]:
+        """Live memories per memory type"""
+        types = list(MemoryType)
+        if np is not None:
+            live, type_code = self._vectors('type_code')
+            counts = np.bincount(type_code[live], minlength=len(types))
+            return {t: int(counts[code]) for code, t in enumerate(types)}
+        counts = [0] * len(types)
+        for code, alive in zip(self.type_code, self.live):
+            if alive:
+                counts[code] += 1
+        return {t: counts[code] for code, t in enumerate(types)}
+    
+    def emotion_intensity(self) -> Dict[int, float]:
+        """Mean emotion count per known year"""
+        if np is not None:
+            live, year, emotions = self._vectors('year', 'emotion_count')
+            dated = live & (year != _UNKNOWN)
+            years, inverse, counts = np.unique(year[dated], return_inverse=True, return_counts=True)
+            totals = np.bincount(inverse, weights=emotions[dated], minlength=len(years))
+            return {int(y): float(t / c) for y, t, c in zip(years, totals, counts)}
+        totals: Dict[int, List[int]] = {}
+        for y, e, alive in zip(self.year, self.emotion_count, self.live):
+            if alive and y != _UNKNOWN:
+                entry = totals.setdefault(y, [0, 0])
+                entry[0] += e
+                entry[1] += 1
+        return {y: total / count for y, (total, count) in sorted(totals.items())}
+    
+    def people_counts(self) -> Dict[str, int]:
+        """Live memories per person"""
+        if np is not None:
+            live, offsets, person_ids = self._vectors('person_offsets', 'person_ids')
+            row_live = np.repeat(live, np.diff(offsets.astype(np.int64)))
+            counts = np.bincount(person_ids[row_live], minlength=len(self.person_names))
+            return {name: int(counts[code]) for code, name in enumerate(self.person_names) if counts[code]}
+        counts = [0] * len(self.person_names)
+        for row, alive in enumerate(self.live):
+            if alive:
+                for code in self.person_ids[self.person_offsets[row]:self.person_offsets[row + 1]]:
+                    counts[code] += 1
+        return {name: counts[code] for code, name in enumerate(self.person_names) if counts[code]}
+
+# Near-Duplicate Detection
+class NearDuplicateIndex:
+    """
+    MinHash/LSH index for spotting retellings of a stored memory.
+    
+    Each text is reduced to a MinHash signature over word shingles: 64-bit
+    blake2b shingle hashes, each permutation a seeded XOR mask. Signatures
+    are split into bands, and a lookup only compares memories that share a
+    band bucket, so its cost depends on the number of near matches rather
+    than the size of the bank. Band count and width are chosen so the LSH
+    collision threshold approximates the similarity threshold. Entries are
+    integer keys: MemoryBank's store keys or SQLiteMemoryBank's row seqs.
+    """
+    def __init__(self, threshold: float = 0.8, num_perm: int = 64, shingle_size: int = 2, seed: int = 1):
+        if not 0 < threshold <= 1:
+            raise ValueError(f"threshold must be in (0, 1], got {threshold}")
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        rng = random.Random(seed)
+        self._masks = [rng.getrandbits(64) for _ in range(num_perm)]
+        # Collision probability of a pair with similarity s is 1 - (1 - s^rows)^bands,
+        # which rises steeply around (1 / bands) ** (1 / rows)
+        self.bands, self.rows = min(
+            ((num_perm // rows, rows) for rows in range(1, num_perm + 1) if num_perm % rows == 0),
+            key=lambda br: abs((1 / br[0]) ** (1 / br[1]) - threshold)
+        )
+        self._buckets: List[Dict[int, List[int]]] = [{} for _ in range(self.bands)]  # Band hash -> Keys
+        self._signatures: Dict[int, Tuple[int, ...]] = {}  # Key -> Signature
+    
+    def signature(self, text: str) -> Tuple[int, ...]:
+        words = re.findall(r"\w+", text.lower())
+        k = min(self.shingle_size, len(words)) or 1
+        hashes = {
+            int.from_bytes(hashlib.blake2b(' '.join(words[i:i + k]).encode(), digest_size=8).digest(), 'little')
+            for i in range(max(len(words) - k + 1, 1))
+        }
+        return tuple(min(map(mask.__xor__, hashes)) for mask in self._masks)
+    
+    def _band_hashes(self, signature: Tuple[int, ...]):
+        for band in range(self.bands):
+            yield band, hash(signature[band * self.rows:(band + 1) * self.rows])
+    
+    @staticmethod
+    def similarity(a: Tuple[int, ...], b: Tuple[int, ...]) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        return sum(x == y for x, y in zip(a, b)) / len(a)
+    
+    def find(self, signature: Tuple[int, ...]) -> Optional[int]:
+        """Key of the most similar indexed memory at or above the threshold"""
+        candidates: Set[int] = set()
+        for band, band_hash in self._band_hashes(signature):
+            candidates.update(self._buckets[band].get(band_hash, ()))
+        best, best_similarity = None, self.threshold
+        for key in candidates:
+            similarity = self.similarity(signature, self._signatures[key])
+            if similarity >= best_similarity:
+                best, best_similarity = key, similarity
+        return best
+    
+    def add(self, key: int, signature: Tuple[int, ...]):
+        self.remove(key)
+        self._signatures[key] = signature
+        for band, band_hash in self._band_hashes(signature):
+            self._buckets[band].setdefault(band_hash, []).append(key)
+    
+    def remove(self, key: int):
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        for band, band_hash in self._band_hashes(signature):
+            bucket = self._buckets[band][band_hash]
+            bucket.remove(key)
+            if not bucket:
+                del self._buckets[band][band_hash]
+
+def _merge_duplicate(original: Memory, duplicate: Memory) -> Memory:
+    """The original memory with a retelling's people, emotions and missing details folded in"""
+    return original.model_copy(update={
+        'year': original.year if original.year is not None else duplicate.year,
+        'age': original.age if original.age is not None else duplicate.age,
+        'season': original.season or duplicate.season,
+        'location': original.location or duplicate.location,
+        'people': original.people + [p for p in duplicate.people if p not in original.people],
+        'emotions': original.emotions + [e for e in duplicate.emotions if e not in original.emotions],
+        'sensory_details': {**duplicate.sensory_details, **original.sensory_details},
+        'related_memories': original.related_memories + [
+            mid for mid in duplicate.related_memories
+            if mid not in original.related_memories and mid != original.id
+        ],
+    })
+
 # Memory Storage System
 class MemoryBank:
-    """Centralized storage for all memories"""
-    def __init__(self):
+    """
+    Centralized storage for all memories.
+    
+    Memories are addressed by their string IDs, but every store is given a
+    compact integer key (its store position) and the indices hold packed
+    arrays of keys. Re-storing an ID gives it a new key and releases the old
+    one, so key order is store order and only live keys are held.
+    
+    Near-duplicate detection is opt-in. By default every memory is stored.
+    With duplicate_threshold set, a new memory whose estimated Jaccard
+    similarity of word shingles to a stored one is at or above the threshold
+    is not inserted. With duplicate_policy "merge" its people, emotions and
+    missing details are folded into the stored memory; with "link" it is
+    only recorded as an alias. Either way store() returns the stored ID.
+    """
+    DUPLICATE_POLICIES = ("merge", "link")
+    
+    def __init__(self, duplicate_threshold: Optional[float] = None, duplicate_policy: str = "merge"):
+        if duplicate_policy not in self.DUPLICATE_POLICIES:
+            raise ValueError(f"duplicate_policy must be one of {self.DUPLICATE_POLICIES}, got '{duplicate_policy}'")
         self.memories: Dict[str, Memory] = {}
-        self.timeline: List[str] = []  # Ordered memory IDs
-        self.theme_index: Dict[str, List[str]] = {}  # Theme -> Memory IDs
-        self.people_index: Dict[str, List[str]] = {}  # Person -> Memory IDs
+        self._ids: Dict[int, str] = {}  # Live memory key -> Memory ID
+        self._next_key = 0
+        self._keys: Dict[str, int] = {}  # Memory ID -> Current key
+        self.timeline_index = TimelineIndex()
+        self.segmenter = TimelineSegmenter()
+        self.columns = MemoryColumns()
+        self.theme_vocabulary: Dict[str, List[str]] = {}  # Theme -> Keywords
+        self.theme_matcher: Optional[ThemeMatcher] = None  # Automaton over the whole vocabulary
+        # Index lists are dropped when they empty; a registered theme still reads as []
+        self._themes: Dict[str, array] = {}  # Theme -> Memory keys
+        self._theme_timelines: Dict[str, TimelineIndex] = {}  # Theme -> Memory keys in timeline order
+        self._people: Dict[str, array] = {}  # Person -> Memory keys
+        self.theme_index = _PackedIndexView(self._themes, self._ids, self.theme_vocabulary)  # Theme -> Memory IDs in store order
+        self.people_index = _PackedIndexView(self._people, self._ids)  # Person -> Memory IDs in store order
+        self.people_graph = PeopleGraph()
+        self._memory_themes: Dict[int, Tuple[str, ...]] = {}  # Memory key -> Themes it belongs to
+        self._token_index: Dict[str, Set[int]] = {}  # Lowercased word -> Memory keys containing it
+        self.duplicates = NearDuplicateIndex(duplicate_threshold) if duplicate_threshold is not None else None
+        self.duplicate_policy = duplicate_policy
+        self.duplicate_of: Dict[str, str] = {}  # Duplicate memory ID -> ID of the memory it repeats
+    
+    @property
+    def timeline(self) -> List[str]:
+        """Ordered memory IDs"""
+        return [self._ids[key] for key in self.timeline_index]
+    
+    def _memory(self, key: int) -> Memory:
+        return self.memories[self._ids[key]]
     
     def store(self, memory: Memory) -> str:
-        """Store a memory and update indices"""
+        """
+        Store a memory and update indices.
+        
+        Returns the ID the memory is stored under: its own, or for a
+        near-duplicate the ID of the memory it repeats.
+        """
+        signature = None
+        if self.duplicates is not None and memory.id not in self.memories:
+            signature = self.duplicates.signature(memory.content)
+            original_key = self.duplicates.find(signature)
+            if original_key is not None:
+                return self._absorb_duplicate(self._memory(original_key), memory)
+        return self._store(memory, signature)
+    
+    def resolve(self, memory_id: str) -> str:
+        """ID of the stored memory for an ID that may have been absorbed as a duplicate"""
+        return self.duplicate_of.get(memory_id, memory_id)
+    
+    def _absorb_duplicate(self, original: Memory, duplicate: Memory) -> str:
+        self.duplicate_of[duplicate.id] = original.id
+        if self.duplicate_policy == "merge":
+            self._store(_merge_duplicate(original, duplicate))
+        return original.id
+    
+    def _store(self, memory: Memory, signature: Optional[Tuple[int, ...]] = None) -> str:
+        previous = self.memories.get(memory.id)
+        if previous is not None:
+            previous_key = self._keys[previous.id]
+            self.timeline_index.remove(previous_key, previous.year)
+            self.segmenter.remove(previous.year, previous.age)
+            self._unindex_themes(previous_key, previous)
+            for person in dict.fromkeys(previous.people):
+                keys = self._people[person]
+                keys.remove(previous_key)
+                if not keys:
+                    del self._people[person]
+            self.people_graph.remove(previous.people, previous.year)
+            if self.duplicates is not None:
+                self.duplicates.remove(previous_key)
+            del self._ids[previous_key]
+        
+        key = self._next_key
+        self._next_key += 1
+        self._ids[key] = memory.id
+        self._keys[memory.id] = key
         self.memories[memory.id] = memory
         
         # Update timeline
-        self._insert_chronologically(memory)
+        self.timeline_index.insert(key, memory.year)
+        self.segmenter.add(memory.year, memory.age)
+        self.columns.append(memory)
         
         # Update people index
-        for person in memory.people:
-            if person not in self.people_index:
-                self.people_index[person] = []
-            self.people_index[person].append(memory.id)
+        for person in dict.fromkeys(memory.people):
+            self._people.setdefault(person, array(_KEY_TYPE)).append(key)
+        self.people_graph.add(memory.people, memory.year)
+        
+        # Update theme index against the registered vocabulary
+        self._index_themes(key, memory)
+        
+        if self.duplicates is not None:
+            self.duplicates.add(key, signature or self.duplicates.signature(memory.content))
         
         return memory.id
     
-    def _insert_chronologically(self, memory: Memory):
-        """Insert memory in chronological order"""
-        if not memory.year:
-            self.timeline.append(memory.id)
-            return
-            
-        # Find insertion point
-        insert_pos = len(self.timeline)
-        for i, mem_id in enumerate(self.timeline):
-            existing = self.memories[mem_id]
-            if existing.year and existing.year > memory.year:
-                insert_pos = i
-                break
+    def _index_themes(self, key: int, memory: Memory):
+        for token in set(memory.content.lower().split()):
+            self._token_index.setdefault(token, set()).add(key)
+        themes = tuple(self.theme_matcher.scan(memory.content)) if self.theme_matcher else ()
+        for theme in themes:
+            self._themes.setdefault(theme, array(_KEY_TYPE)).append(key)
+            self._theme_timelines.setdefault(theme, TimelineIndex()).insert(key, memory.year)
+        self._memory_themes[key] = themes
+    
+    def _unindex_themes(self, key: int, memory: Memory):
+        for token in set(memory.content.lower().split()):
+            postings = self._token_index.get(token)
+            if postings is not None:
+                postings.discard(key)
+                if not postings:
+                    del self._token_index[token]
+        for theme in self._memory_themes.pop(key, ()):
+            keys = self._themes[theme]
+            keys.remove(key)
+            timeline = self._theme_timelines[theme]
+            timeline.remove(key, memory.year)
+            if not keys:
+                del self._themes[theme]
+                del self._theme_timelines[theme]
+    
+    def register_theme(self, theme: str, keywords: Optional[List[str]] = None) -> int:
+        """
+        Add (or redefine) a theme and index the memories that mention it.
+        
+        Only memories containing a word that could hold one of the keywords are
+        scanned, found by one pass over the word vocabulary rather than by
+        reading every memory. Returns the number of memories in the theme.
+        """
+        keywords = [k.lower() for k in (keywords or [theme.replace('_', ' ')]) if k.strip()]
+        for key in self._themes.get(theme, ()):
+            self._memory_themes[key] = tuple(t for t in self._memory_themes[key] if t != theme)
         
-        self.timeline.insert(insert_pos, memory.id)
+        self.theme_vocabulary[theme] = keywords
+        self.theme_matcher = ThemeMatcher(self.theme_vocabulary)
+        
+        theme_only = ThemeMatcher({theme: keywords})
+        members = array(_KEY_TYPE, (key for key in self._theme_candidates(keywords)
+                                    if theme_only.scan(self._memory(key).content)))
+        self._themes.pop(theme, None)
+        self._theme_timelines.pop(theme, None)
+        if members:
+            self._themes[theme] = members
+            timeline = self._theme_timelines[theme] = TimelineIndex()
+            for key in members:
+                self._memory_themes[key] += (theme,)
+                timeline.insert(key, self._memory(key).year)
+        return len(members)
+    
+    def _theme_candidates(self, keywords: List[str]) -> List[int]:
+        """Memory keys, in store order, with a word containing some keyword's longest word"""
+        # Any occurrence of a keyword puts its longest word inside one of the memory's words,
+        # so one automaton pass over the vocabulary finds every word that could hold one
+        pieces = {piece: [piece] for piece in (max(keyword.split(), key=len) for keyword in keywords)}
+        matcher = ThemeMatcher(pieces)
+        candidates: Set[int] = set()
+        for word, keys in self._token_index.items():
+            if matcher.scan(word):
+                candidates |= keys
+        return sorted(candidates)
     
     def get_by_period(self, start_year: int, end_year: int) -> List[Memory]:
         """Get memories within a time period"""
-        return [
-            self.memories[mid] for mid in self.timeline
-            if self.memories[mid].year and start_year <= self.memories[mid].year <= end_year
-        ]
+        return [self._memory(key) for key in self.timeline_index.range(start_year, end_year)]
     
     def get_by_person(self, person: str) -> List[Memory]:
         """Get all memories involving a person"""
-        return [self.memories[mid] for mid in self.people_index.get(person, [])]
+        return [self._memory(key) for key in self._people.get(person, ())]
+    
+    def get_by_theme(self, theme: str) -> List[Memory]:
+        """Get all memories in a registered theme, in store order"""
+        return [self._memory(key) for key in self._themes.get(theme, ())]
+    
+    def theme_timeline(self, theme: str) -> List[Memory]:
+        """Get a theme's memories in timeline order (by year, undated last)"""
+        return [self._memory(key) for key in self._theme_timelines.get(theme, ())]
+
+# Persistent Memory Storage
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS memories (
+    seq INTEGER PRIMARY KEY,        -- store order
+    id TEXT NOT NULL UNIQUE,
+    year INTEGER,
+    content TEXT NOT NULL,
+    significance TEXT NOT NULL,
+    data TEXT NOT NULL              -- full Memory as JSON
+);
+CREATE INDEX IF NOT EXISTS memories_by_year ON memories(year, seq);
+CREATE TABLE IF NOT EXISTS people (
+    person TEXT NOT NULL,
+    memory_seq INTEGER NOT NULL,
+    PRIMARY KEY (person, memory_seq)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS people_by_memory ON people(memory_seq);
+CREATE TABLE IF NOT EXISTS themes (
+    theme TEXT PRIMARY KEY,
+    keywords TEXT NOT NULL          -- JSON list
+);
+CREATE TABLE IF NOT EXISTS memory_themes (
+    theme TEXT NOT NULL,
+    memory_seq INTEGER NOT NULL,
+    PRIMARY KEY (theme, memory_seq)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS memory_themes_by_memory ON memory_themes(memory_seq);
+CREATE TABLE IF NOT EXISTS duplicates (
+    id TEXT PRIMARY KEY,            -- ID of a near-duplicate that was not inserted
+    original TEXT NOT NULL          -- ID of the memory it repeats
+) WITHOUT ROWID;
+"""
+
+_SQLITE_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(
+    content, significance, content='memories', content_rowid='seq'
+);
+CREATE TRIGGER IF NOT EXISTS memories_fts_insert AFTER INSERT ON memories BEGIN
+    INSERT INTO memories_fts(rowid, content, significance) VALUES (new.seq, new.content, new.significance);
+END;
+CREATE TRIGGER IF NOT EXISTS memories_fts_delete AFTER DELETE ON memories BEGIN
+    INSERT INTO memories_fts(memories_fts, rowid, content, significance)
+    VALUES ('delete', old.seq, old.content, old.significance);
+END;
+"""
+
+# Trigram index over content, so theme keywords (matched as substrings) find their rows without a scan
+_SQLITE_TRIGRAM_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS memories_grams USING fts5(
+    content, content='memories', content_rowid='seq', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS memories_grams_insert AFTER INSERT ON memories BEGIN
+    INSERT INTO memories_grams(rowid, content) VALUES (new.seq, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS memories_grams_delete AFTER DELETE ON memories BEGIN
+    INSERT INTO memories_grams(memories_grams, rowid, content) VALUES ('delete', old.seq, old.content);
+END;
+"""
+
+class _StoredMemories(Mapping):
+    """Read-only view of a SQLiteMemoryBank's memories by ID, loaded on access"""
+    def __init__(self, bank: "SQLiteMemoryBank"):
+        self._bank = bank
+    
+    def __getitem__(self, memory_id: str) -> Memory:
+        memory = self._bank._load(memory_id)
+        if memory is None:
+            raise KeyError(memory_id)
+        return memory
+    
+    def __contains__(self, memory_id) -> bool:
+        return self._bank._conn.execute("SELECT 1 FROM memories WHERE id = ?", (memory_id,)).fetchone() is not None
+    
+    def __iter__(self):
+        for (memory_id,) in self._bank._conn.execute("SELECT id FROM memories ORDER BY seq"):
+            yield memory_id
+    
+    def __len__(self) -> int:
+        return self._bank._conn.execute("SELECT COUNT(*) FROM memories").fetchone()[0]
+    
+    def values(self):
+        """Stream every memory in store order with one query"""
+        for (data,) in self._bank._conn.execute("SELECT data FROM memories ORDER BY seq"):
+            yield Memory.model_validate_json(data)
+
+class _StoredMembership(Mapping):
+    """Read-only view of a name -> memory IDs table (people or themes), in store order"""
+    def __init__(self, bank: "SQLiteMemoryBank", table: str, column: str,
+                 registered: Optional[Dict[str, Any]] = None):
+        self._bank = bank
+        self._table = table
+        self._column = column
+        self._registered = registered  # Names that exist even with no memories
+    
+    def __getitem__(self, name: str) -> List[str]:
+        memory_ids = [memory_id for (memory_id,) in self._bank._conn.execute(
+            f"SELECT m.id FROM {self._table} t JOIN memories m ON m.seq = t.memory_seq "
+            f"WHERE t.{self._column} = ? ORDER BY t.memory_seq", (name,))]
+        if not memory_ids and (self._registered is None or name not in self._registered):
+            raise KeyError(name)
+        return memory_ids
+    
+    def __iter__(self):
+        for (name,) in self._bank._conn.execute(f"SELECT DISTINCT {self._column} FROM {self._table} ORDER BY 1"):
+            yield name
+    
+    def __len__(self) -> int:
+        return self._bank._conn.execute(f"SELECT COUNT(DISTINCT {self._column}) FROM {self._table}").fetchone()[0]
+
+class SQLiteMemoryBank:
+    """
+    Persistent MemoryBank backed by SQLite.
+    
+    Same API as MemoryBank, but every store is committed, so an interview
+    series survives a crash. Opening a bank reads only the theme vocabulary
+    and the duplicate aliases. Memories are loaded from their JSON rows on
+    access, through a small LRU cache, and period/person/theme queries are
+    answered by SQL indexes. Content and significance are full-text
+    searchable through FTS5 when the SQLite build includes it.
+    
+    duplicate_threshold and duplicate_policy work as in MemoryBank. Aliases
+    are persisted; the MinHash index is rebuilt from the content column on
+    the first store after opening.
+    """
+    def __init__(self, db_path: str, cache_size: int = 1024,
+                 duplicate_threshold: Optional[float] = None, duplicate_policy: str = "merge"):
+        if duplicate_policy not in MemoryBank.DUPLICATE_POLICIES:
+            raise ValueError(f"duplicate_policy must be one of {MemoryBank.DUPLICATE_POLICIES}, "
+                             f"got '{duplicate_policy}'")
+        if duplicate_threshold is not None and not 0 < duplicate_threshold <= 1:
+            raise ValueError(f"threshold must be in (0, 1], got {duplicate_threshold}")
+        self.db_path = db_path
+        self._conn = sqlite3.connect(db_path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        # Python's lower() so theme membership matches ThemeMatcher for non-ASCII text too
+        self._conn.create_function(
+            "contains_keyword", 2, lambda text, keyword: keyword in text.lower(), deterministic=True
+        )
+        self._conn.executescript(_SQLITE_SCHEMA)
+        try:
+            self._conn.executescript(_SQLITE_FTS_SCHEMA)
+            self.full_text_search = True
+        except sqlite3.OperationalError:  # SQLite built without FTS5
+            self.full_text_search = False
+        try:
+            self._conn.executescript(_SQLITE_TRIGRAM_SCHEMA)
+            self.substring_index = True
+        except sqlite3.OperationalError:  # FTS5 missing or older than SQLite 3.34
+            self.substring_index = False
+        
+        self._cache: "OrderedDict[str, Memory]" = OrderedDict()
+        self._cache_size = cache_size
+        self._columns: Optional[MemoryColumns] = None
+        self._people_graph: Optional[PeopleGraph] = None
+        self._segmenter: Optional[TimelineSegmenter] = None
+        self.memories = _StoredMemories(self)
+        self.people_index = _StoredMembership(self, "people", "person")
+        self.theme_vocabulary: Dict[str, List[str]] = {
+            theme: json.loads(keywords) for theme, keywords in self._conn.execute("SELECT theme, keywords FROM themes")
+        }
+        self.theme_index = _StoredMembership(self, "memory_themes", "theme", self.theme_vocabulary)
+        self.theme_matcher: Optional[ThemeMatcher] = ThemeMatcher(self.theme_vocabulary) if self.theme_vocabulary else None
+        self.duplicate_threshold = duplicate_threshold
+        self.duplicate_policy = duplicate_policy
+        self.duplicate_of: Dict[str, str] = dict(self._conn.execute("SELECT id, original FROM duplicates"))
+        self._duplicates: Optional[NearDuplicateIndex] = None
+    
+    def close(self):
+        self._conn.close()
+    
+    def __enter__(self) -> "SQLiteMemoryBank":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    @property
+    def timeline(self) -> List[str]:
+        """Ordered memory IDs"""
+        return [memory_id for (memory_id,) in self._conn.execute(
+            "SELECT id FROM memories ORDER BY year IS NULL, year, seq")]
+    
+    @property
+    def columns(self) -> MemoryColumns:
+        """Columnar analytics view, built on first use straight from SQL and then kept current"""
+        if self._columns is None:
+            columns = MemoryColumns()
+            people: Dict[int, List[str]] = {}
+            for seq, person in self._conn.execute("SELECT memory_seq, person FROM people ORDER BY memory_seq"):
+                people.setdefault(seq, []).append(person)
+            type_codes = {t.value: code for t, code in MEMORY_TYPE_CODES.items()}
+            for seq, memory_id, year, age, memory_type, emotion_count in self._conn.execute(
+                "SELECT seq, id, year, json_extract(data, '$.age'), json_extract(data, '$.memory_type'), "
+                "json_array_length(data, '$.emotions') FROM memories ORDER BY seq"
+            ):
+                columns.append_values(memory_id, year, age, type_codes[memory_type], emotion_count,
+                                      people.get(seq, []))
+            self._columns = columns
+        return self._columns
+    
+    @property
+    def segmenter(self) -> TimelineSegmenter:
+        """Timeline segmentation, built on first use from one read of the year index and then kept current"""
+        if self._segmenter is None:
+            segmenter = TimelineSegmenter()
+            for year, age in self._conn.execute(
+                "SELECT year, json_extract(data, '$.age') FROM memories ORDER BY year IS NULL, year, seq"
+            ):
+                segmenter.add(year, age)
+            self._segmenter = segmenter
+        return self._segmenter
+    
+    @property
+    def people_graph(self) -> PeopleGraph:
+        """People co-occurrence graph, built on first use from the people table and then kept current"""
+        if self._people_graph is None:
+            graph = PeopleGraph()
+            memory_people: List[str] = []
+            current = None
+            for seq, year, person in self._conn.execute(
+                "SELECT p.memory_seq, m.year, p.person FROM people p JOIN memories m ON m.seq = p.memory_seq "
+                "ORDER BY p.memory_seq"
+            ):
+                if current is not None and seq != current[0]:
+                    graph.add(memory_people, current[1])
+                    memory_people = []
+                current = (seq, year)
+                memory_people.append(person)
+            if current is not None:
+                graph.add(memory_people, current[1])
+            self._people_graph = graph
+        return self._people_graph
+    
+    @property
+    def duplicates(self) -> Optional[NearDuplicateIndex]:
+        """Near-duplicate index over memory seqs, built on first use from the content column"""
+        if self.duplicate_threshold is None:
+            return None
+        if self._duplicates is None:
+            index = NearDuplicateIndex(self.duplicate_threshold)
+            for seq, content in self._conn.execute("SELECT seq, content FROM memories ORDER BY seq"):
+                index.add(seq, index.signature(content))
+            self._duplicates = index
+        return self._duplicates
+    
+    def store(self, memory: Memory) -> str:
+        """
+        Store (or replace) a memory and commit it.
+        
+        Returns the ID the memory is stored under: its own, or for a
+        near-duplicate the ID of the memory it repeats.
+        """
+        with self._conn:
+            return self._insert(memory)
+    
+    def resolve(self, memory_id: str) -> str:
+        """ID of the stored memory for an ID that may have been absorbed as a duplicate"""
+        return self.duplicate_of.get(memory_id, memory_id)
+    
+    def store_many(self, memories: List[Memory]) -> int:
+        """Store a batch of memories in one transaction"""
+        count = 0
+        with self._conn:
+            for memory in memories:
+                self._insert(memory)
+                count += 1
+        return count
+    
+    def _absorb_duplicate(self, original_seq: int, duplicate: Memory) -> str:
+        (data,) = self._conn.execute("SELECT data FROM memories WHERE seq = ?", (original_seq,)).fetchone()
+        original = Memory.model_validate_json(data)
+        self._conn.execute("INSERT OR REPLACE INTO duplicates VALUES (?, ?)", (duplicate.id, original.id))
+        self.duplicate_of[duplicate.id] = original.id
+        if self.duplicate_policy == "merge":
+            self._insert(_merge_duplicate(original, duplicate))
+        return original.id
+    
+    def _insert(self, memory: Memory) -> str:
+        row = self._conn.execute("SELECT seq FROM memories WHERE id = ?", (memory.id,)).fetchone()
+        signature = None
+        if row is None and self.duplicates is not None:
+            signature = self.duplicates.signature(memory.content)
+            original_seq = self.duplicates.find(signature)
+            if original_seq is not None:
+                return self._absorb_duplicate(original_seq, memory)
+        if row is not None:
+            if self._people_graph is not None or self._segmenter is not None:
+                previous_year, previous_age = self._conn.execute(
+                    "SELECT year, json_extract(data, '$.age') FROM memories WHERE seq = ?", row).fetchone()
+            if self._people_graph is not None:
+                previous_people = [person for (person,) in self._conn.execute(
+                    "SELECT person FROM people WHERE memory_seq = ?", row)]
+                self._people_graph.remove(previous_people, previous_year)
+            if self._segmenter is not None:
+                self._segmenter.remove(previous_year, previous_age)
+            if self._duplicates is not None:
+                self._duplicates.remove(row[0])
+            # Re-storing moves the memory to the end of the store order, as in MemoryBank
+            self._conn.execute("DELETE FROM people WHERE memory_seq = ?", row)
+            self._conn.execute("DELETE FROM memory_themes WHERE memory_seq = ?", row)
+            self._conn.execute("DELETE FROM memories WHERE seq = ?", row)
+        self._cache.pop(memory.id, None)
+        
+        seq = self._conn.execute(
+            "INSERT INTO memories (id, year, content, significance, data) VALUES (?, ?, ?, ?, ?)",
+            (memory.id, memory.year, memory.content, memory.significance, memory.model_dump_json())
+        ).lastrowid
+        self._conn.executemany("INSERT OR IGNORE INTO people VALUES (?, ?)",
+                               [(person, seq) for person in memory.people])
+        if self.theme_matcher:
+            self._conn.executemany("INSERT INTO memory_themes VALUES (?, ?)",
+                                   [(theme, seq) for theme in self.theme_matcher.scan(memory.content)])
+        if self._columns is not None:
+            self._columns.append(memory)
+        if self._people_graph is not None:
+            self._people_graph.add(memory.people, memory.year)
+        if self._segmenter is not None:
+            self._segmenter.add(memory.year, memory.age)
+        if self._duplicates is not None:
+            self._duplicates.add(seq, signature or self._duplicates.signature(memory.content))
+        return memory.id
+    
+    def _load(self, memory_id: str) -> Optional[Memory]:
+        memory = self._cache.get(memory_id)
+        if memory is not None:
+            self._cache.move_to_end(memory_id)
+            return memory
+        row = self._conn.execute("SELECT data FROM memories WHERE id = ?", (memory_id,)).fetchone()
+        if row is None:
+            return None
+        memory = Memory.model_validate_json(row[0])
+        self._cache[memory_id] = memory
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return memory
+    
+    def _query(self, sql: str, params: tuple = ()) -> List[Memory]:
+        return [Memory.model_validate_json(data) for (data,) in self._conn.execute(sql, params)]
+    
+    def get_by_period(self, start_year: int, end_year: int) -> List[Memory]:
+        """Get memories within a time period"""
+        return self._query("SELECT data FROM memories WHERE year BETWEEN ? AND ? ORDER BY year, seq",
+                           (start_year, end_year))
+    
+    def get_by_person(self, person: str) -> List[Memory]:
+        """Get all memories involving a person"""
+        return self._query("SELECT m.data FROM people p JOIN memories m ON m.seq = p.memory_seq "
+                           "WHERE p.person = ? ORDER BY p.memory_seq", (person,))
+    
+    def register_theme(self, theme: str, keywords: Optional[List[str]] = None) -> int:
+        """
+        Add (or redefine) a theme and index the memories that mention it.
+        
+        Keywords of three or more characters find their candidate rows in
+        the trigram index with one OR-ed MATCH, and only those rows are
+        checked with contains_keyword. Shorter keywords, or a SQLite build
+        without the trigram tokenizer, fall back to scanning the content
+        column once per keyword. Later stores are scored against the
+        vocabulary as they arrive.
+        """
+        keywords = [k.lower() for k in (keywords or [theme.replace('_', ' ')]) if k.strip()]
+        indexed = [k for k in keywords if len(k) >= 3] if self.substring_index else []
+        with self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO themes VALUES (?, ?)", (theme, json.dumps(keywords)))
+            self._conn.execute("DELETE FROM memory_themes WHERE theme = ?", (theme,))
+            if indexed:
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO memory_themes SELECT ?, m.seq FROM memories_grams g "
+                    "JOIN memories m ON m.seq = g.rowid WHERE memories_grams MATCH ? "
+                    "AND EXISTS (SELECT 1 FROM json_each(?) WHERE contains_keyword(m.content, value))",
+                    (theme, " OR ".join('"' + k.replace('"', '""') + '"' for k in indexed), json.dumps(indexed))
+                )
+            for keyword in keywords:
+                if keyword not in indexed:
+                    self._conn.execute("INSERT OR IGNORE INTO memory_themes "
+                                       "SELECT ?, seq FROM memories WHERE contains_keyword(content, ?)",
+                                       (theme, keyword))
+        self.theme_vocabulary[theme] = keywords
+        self.theme_matcher = ThemeMatcher(self.theme_vocabulary)
+        return self._conn.execute("SELECT COUNT(*) FROM memory_themes WHERE theme = ?", (theme,)).fetchone()[0]
+    
+    def get_by_theme(self, theme: str) -> List[Memory]:
+        """Get all memories in a registered theme, in store order"""
+        return self._query("SELECT m.data FROM memory_themes t JOIN memories m ON m.seq = t.memory_seq "
+                           "WHERE t.theme = ? ORDER BY t.memory_seq", (theme,))
+    
+    def theme_timeline(self, theme: str) -> List[Memory]:
+        """Get a theme's memories in timeline order (by year, undated last)"""
+        return self._query("SELECT m.data FROM memory_themes t JOIN memories m ON m.seq = t.memory_seq "
+                           "WHERE t.theme = ? ORDER BY m.year IS NULL, m.year, m.seq", (theme,))
+    
+    def search(self, query: str, limit: int = 20) -> List[Memory]:
+        """Full-text search over content and significance, best matches first"""
+        if self.full_text_search:
+            return self._query("SELECT m.data FROM memories_fts f JOIN memories m ON m.seq = f.rowid "
+                               "WHERE memories_fts MATCH ? ORDER BY f.rank LIMIT ?", (query, limit))
+        pattern = f"%{query}%"
+        return self._query("SELECT data FROM memories WHERE content LIKE ? OR significance LIKE ? "
+                           "ORDER BY seq LIMIT ?", (pattern, pattern, limit))
 
 # Interview Tools
 def elicit_memory_details(basic_memory: str) -> Memory:
@@ -172,12 +1336,12 @@ Ask follow-up questions to get rich detail."""
             
             # Extract memory from conversation
             memory = self._extract_memory_from_conversation(result)
-            if memory:
-                self.memory_bank.store(memory)
+            # A retelling of an already stored memory is folded into it rather than collected again
+            if memory and self.memory_bank.store(memory) == memory.id:
                 collected_memories.append(memory)
                 
                 # Get follow-up to connect memories
-                if i > 0:
+                if len(collected_memories) >= 2:
                     connection_prompt = f"""The person just shared: {memory.content[:100]}...
                     
 Help them connect this to their previous memory about: {collected_memories[-2].content[:100]}...
@@ -191,10 +1355,17 @@ Are there themes or patterns emerging?"""
     
     def _extract_memory_from_conversation(self, result: Dict) -> Optional[Memory]:
         """Parse conversation to extract Memory object"""
-        # This would parse the agent response to create a Memory
-        # For now, stub implementation
+        # This would parse the agent response into dated, peopled fields;
+        # for now the latest message is the memory, and no answer is no memory
+        messages = getattr((result or {}).get('history'), 'messages', None) or []
+        if not messages:
+            return None
+        answer = messages[-1]
+        content = answer.get('content') if isinstance(answer, dict) else getattr(answer, 'content', answer)
+        if not isinstance(content, str) or len(content.strip()) < 10:
+            return None
         return Memory(
-            content="Extracted memory content",
+            content=content.strip(),
             memory_type=MemoryType.MILESTONE,
             significance="Parsed significance"
         )
@@ -205,45 +1376,38 @@ Are there themes or patterns emerging?"""
         pass
 
 # Timeline Analysis Tools
-def identify_life_phases(memories: List[Memory]) -> List[LifePhase]:
-    """Tool to identify natural life phases from memories"""
-    # Group by major transitions
-    phases = []
-    
-    # Simple implementation - would be more sophisticated
-    year_ranges = [
-        (0, 12, "childhood"),
-        (13, 18, "adolescence"),
-        (19, 25, "young_adulthood"),
-        (26, 40, "early_career"),
-        (41, 60, "midlife"),
-        (61, 100, "later_years")
+def identify_life_phases(
+    memories: Optional[List[Memory]] = None,
+    columns: Optional[MemoryColumns] = None,
+    segmenter: Optional[TimelineSegmenter] = None
+) -> List[LifePhase]:
+    """Tool to identify natural life phases from memories (or a bank's columns or segmenter)"""
+    if segmenter is None and columns is None:
+        segmenter = TimelineSegmenter.from_memories(memories or [])
+    if segmenter is not None:
+        return segmenter.phases()
+    
+    # Batch path: one vectorized pass over the columns
+    bracket_stats = columns.age_bracket_stats([(start_age, end_age) for start_age, end_age, _ in LIFE_STAGES])
+    return [
+        _life_phase(phase_name, count, first_year or 1900, last_year or 2024)
+        for (_, _, phase_name), (count, first_year, last_year) in zip(LIFE_STAGES, bracket_stats)
+        if count
     ]
-    
-    for start_age, end_age, phase_name in year_ranges:
-        phase_memories = [m for m in memories if m.age and start_age <= m.age <= end_age]
-        if phase_memories:
-            phases.append(LifePhase(
-                name=phase_name,
-                start_year=min(m.year for m in phase_memories if m.year) or 1900,
-                end_year=max(m.year for m in phase_memories if m.year) or 2024,
-                description=f"Phase containing {len(phase_memories)} memories",
-                key_themes=[]
-            ))
-    
-    return phases
 
-def detect_timeline_gaps(memories: List[Memory]) -> List[Tuple[int, int]]:
+def detect_timeline_gaps(
+    memories: Optional[List[Memory]] = None,
+    columns: Optional[MemoryColumns] = None,
+    segmenter: Optional[TimelineSegmenter] = None
+) -> List[Tuple[int, int]]:
     """Tool to find gaps in timeline coverage"""
-    gaps = []
-    sorted_memories = sorted([m for m in memories if m.year], key=lambda m: m.year)
+    if segmenter is None and columns is None:
+        segmenter = TimelineSegmenter.from_memories(memories or [])
+    if segmenter is not None:
+        return segmenter.gaps()
     
-    for i in range(len(sorted_memories) - 1):
-        year_diff = sorted_memories[i+1].year - sorted_memories[i].year
-        if year_diff > 5:  # Gap of more than 5 years
-            gaps.append((sorted_memories[i].year, sorted_memories[i+1].year))
-    
-    return gaps
+    years = columns.dated_years()
+    return [(earlier, later) for earlier, later in zip(years, years[1:]) if later - earlier > TIMELINE_GAP_YEARS]
 
 # Enhanced Timeline Agent
 class TimelineAgent(Agent):
@@ -255,12 +1419,22 @@ class TimelineAgent(Agent):
             tools=[identify_life_phases, detect_timeline_gaps]
         )
         self.memory_bank = memory_bank
+        self.coverage: Dict[str, Any] = {}
     
-    def build_timeline(self) -> Tuple[List[LifePhase], List[Tuple[int, int]]]:
-        """Build complete timeline and identify gaps"""
-        all_memories = list(self.memory_bank.memories.values())
+    def build_timeline(self, use_llm: bool = True) -> Tuple[List[LifePhase], List[Tuple[int, int]]]:
+        """
+        Build complete timeline and identify gaps.
         
-        prompt = f"""Analyze these {len(all_memories)} memories to create a life timeline.
+        Phases, gaps and coverage are read from the bank's segmenter, which is
+        updated as memories are stored; with use_llm=False this is just that read.
+        """
+        segmentation = self.memory_bank.segmenter.segment()
+        self.coverage = segmentation['coverage']
+        phases, gaps = segmentation['phases'], segmentation['gaps']
+        if not use_llm:
+            return phases, gaps
+        
+        prompt = f"""Analyze these {len(self.memory_bank.memories)} memories to create a life timeline.
 
 Identify:
 1. Natural life phases based on major transitions
@@ -268,7 +1442,8 @@ Identify:
 3. How the person evolved through phases
 4. Any significant gaps that need filling
 
-Memories span from {min(m.year for m in all_memories if m.year)} to {max(m.year for m in all_memories if m.year)}.
+Memories span from {self.coverage['first_year']} to {self.coverage['last_year']} ({self.coverage['years_covered']} years with memories).
+Gaps found so far: {gaps}
 
 Look for transitions like:
 - Geographic moves
@@ -279,10 +1454,6 @@ Look for transitions like:
 
         result = self.run(prompt)
         
-        # Use tools to identify phases and gaps
-        phases = identify_life_phases(all_memories)
-        gaps = detect_timeline_gaps(all_memories)
-        
         # Enhance phases with agent insights
         enhanced_phases = self._enhance_phases_with_insights(phases, result)
         
@@ -293,24 +1464,108 @@ Look for transitions like:
         # Would parse agent response to enhance phase descriptions
         return phases
 
+# Theme Matching Engine
+class ThemeMatcher:
+    """
+    Aho-Corasick automaton over every theme keyword.
+    
+    One left-to-right scan of a memory's lowercased content finds every keyword
+    of every theme, so scoring costs O(len(content) + matches) no matter how
+    many themes are registered. Scores are cached per memory id and reused
+    until that memory's content changes.
+    """
+    def __init__(self, theme_keywords: Dict[str, List[str]]):
+        self.themes: List[str] = list(theme_keywords)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[int, ...]] = [()]  # State -> theme positions, one per keyword ending here
+        self._cache: Dict[str, Tuple[str, Dict[str, int]]] = {}  # Memory ID -> (content, scores)
+        
+        for position, keywords in enumerate(theme_keywords.values()):
+            for keyword in keywords:
+                if keyword:
+                    self._add_keyword(keyword.lower(), position)
+        self._build_failure_links()
+    
+    def __contains__(self, theme: str) -> bool:
+        return theme in self.themes
+    
+    def _add_keyword(self, keyword: str, position: int):
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = next_state
+        self._out[state] += (position,)
+    
+    def _build_failure_links(self):
+        """Breadth-first failure links, folding suffix outputs into each state"""
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, child in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0) if state else 0
+                self._out[child] += self._out[self._fail[child]]
+                queue.append(child)
+    
+    def scan(self, text: str) -> Dict[str, int]:
+        """Keyword hits per theme in one pass over the text"""
+        goto, fail, out = self._goto, self._fail, self._out
+        hits = [0] * len(self.themes)
+        state = 0
+        for char in text.lower():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for position in out[state]:
+                hits[position] += 1
+        return {theme: count for theme, count in zip(self.themes, hits) if count}
+    
+    def match(self, memory: Memory) -> Dict[str, int]:
+        """Cached keyword hits per theme for a memory"""
+        cached = self._cache.get(memory.id)
+        if cached is not None and cached[0] == memory.content:
+            return cached[1]
+        scores = self.scan(memory.content)
+        self._cache[memory.id] = (memory.content, scores)
+        return scores
+    
+    def frequency(self, memories: List[Memory]) -> Dict[str, int]:
+        """Number of memories mentioning each theme"""
+        counts = {theme: 0 for theme in self.themes}
+        for memory in memories:
+            for theme in self.match(memory):
+                counts[theme] += 1
+        return counts
+
 # Theme Extraction Tools  
-def calculate_theme_frequency(memories: List[Memory], theme_keywords: Dict[str, List[str]]) -> Dict[str, int]:
+def calculate_theme_frequency(
+    memories: List[Memory],
+    theme_keywords: Dict[str, List[str]],
+    matcher: Optional[ThemeMatcher] = None
+) -> Dict[str, int]:
     """Tool to calculate theme frequency across memories"""
-    theme_counts = {theme: 0 for theme in theme_keywords}
-    
-    for memory in memories:
-        content_lower = memory.content.lower()
-        for theme, keywords in theme_keywords.items():
-            if any(keyword in content_lower for keyword in keywords):
-                theme_counts[theme] += 1
-    
-    return theme_counts
-
-def find_theme_evolution(memories: List[Memory], theme: str) -> List[Dict[str, Any]]:
+    matcher = matcher or ThemeMatcher(theme_keywords)
+    return matcher.frequency(memories)
+
+def find_theme_evolution(
+    memories: List[Memory],
+    theme: str,
+    matcher: Optional[ThemeMatcher] = None
+) -> List[Dict[str, Any]]:
     """Tool to track how a theme evolves over time"""
+    if matcher is None or theme not in matcher:
+        matcher = ThemeMatcher({theme: [theme]})
     evolution = []
     theme_memories = sorted(
-        [m for m in memories if theme.lower() in m.content.lower()],
+        [m for m in memories if theme in matcher.match(m)],
         key=lambda m: m.year or 0
     )
     
@@ -361,6 +1616,8 @@ For each theme, note:
         
         # Extract initial themes from response
         initial_themes = self._extract_themes_from_response(id_result)
+        for theme_name in initial_themes:
+            self.memory_bank.register_theme(theme_name)
         
         # Second pass: Deep dive on each theme
         for theme_name in initial_themes:
@@ -396,7 +1653,7 @@ Be specific about how this theme uniquely manifests in this person's life."""
         return Theme(
             name=name,
             description="Theme description from analysis",
-            related_memories=[m.id for m in memories[:3]],  # Stub
+            related_memories=[m.id for m in self.memory_bank.theme_timeline(name)],
             evolution="How theme evolved"
         )
     
@@ -414,39 +1671,205 @@ Analyze:
         result = self.run(interaction_prompt)
         # Would update themes with interaction data
 
+# Streaming Voice Profiling
+EMOTION_WORDS = {
+    'joy', 'happy', 'happiness', 'glad', 'delighted', 'sad', 'sadness', 'unhappy', 'grief', 'cried',
+    'tears', 'fear', 'afraid', 'scared', 'terrified', 'anger', 'angry', 'furious', 'mad', 'surprise',
+    'surprised', 'shocked', 'disgust', 'disgusted', 'love', 'loved', 'loving', 'pride', 'proud',
+    'shame', 'ashamed', 'guilt', 'guilty', 'anxiety', 'anxious', 'worried', 'nervous', 'excitement',
+    'excited', 'thrilled', 'content', 'contentment', 'peaceful', 'frustration', 'frustrated', 'relief',
+    'relieved', 'nostalgia', 'nostalgic', 'lonely', 'hurt', 'heartbroken', 'grateful', 'hope', 'hopeful'
+}
+PERSONAL_PRONOUNS = {
+    'i', 'me', 'my', 'mine', 'myself', 'we', 'us', 'our', 'ours', 'ourselves', 'you', 'your', 'yours',
+    'he', 'him', 'his', 'she', 'her', 'hers', 'they', 'them', 'their', 'theirs'
+}
+IRREGULAR_PAST = {
+    'was', 'were', 'had', 'did', 'went', 'came', 'saw', 'said', 'told', 'made', 'got', 'gave', 'took',
+    'knew', 'thought', 'felt', 'left', 'found', 'became', 'began', 'brought', 'bought', 'kept', 'held',
+    'ran', 'sat', 'stood', 'met', 'lost', 'won', 'wrote', 'spoke', 'grew', 'fell', 'taught', 'heard'
+}
+TRANSITION_WORDS = {
+    'however', 'therefore', 'meanwhile', 'then', 'later', 'afterwards', 'eventually', 'suddenly',
+    'finally', 'still', 'anyway', 'besides', 'although', 'because', 'instead', 'moreover',
+    'furthermore', 'nevertheless', 'thus', 'soon', 'before', 'after', 'since', 'yet'
+}
+INTENSIFIERS = {'really', 'very', 'so', 'truly', 'absolutely', 'totally', 'incredibly', 'extremely', 'such'}
+INFORMAL_WORDS = {'gonna', 'wanna', 'kinda', 'yeah', 'ok', 'okay', 'stuff', 'guy', 'guys', 'kid', 'kids', 'mom', 'dad'}
+STOPWORDS = {
+    'the', 'a', 'an', 'and', 'or', 'of', 'to', 'in', 'on', 'at', 'for', 'with', 'it', 'is', 'was',
+    'that', 'this', 'as', 'be', 'by', 'from', 'but', 'had', 'have', 'were', 'are'
+} | PERSONAL_PRONOUNS
+
+_VOICE_TOKEN = re.compile(r"[A-Za-z]+(?:'[A-Za-z]+)?|[.!?]+")
+
+class FrequentItems:
+    """
+    Misra-Gries heavy hitters: approximate top-k counts in bounded memory.
+    
+    At most `capacity` counters are kept. When a new item arrives and all are
+    taken, every counter is decremented and zeros are dropped, which costs
+    O(1) amortized per item. Counts are underestimated by at most
+    items_seen / (capacity + 1).
+    """
+    def __init__(self, capacity: int = 200):
+        self.capacity = capacity
+        self._counts: Dict[str, int] = {}
+    
+    def add(self, item: str):
+        counts = self._counts
+        if item in counts:
+            counts[item] += 1
+        elif len(counts) < self.capacity:
+            counts[item] = 1
+        else:
+            for key in list(counts):
+                counts[key] -= 1
+                if not counts[key]:
+                    del counts[key]
+    
+    def top(self, k: int, min_count: int = 1) -> List[Tuple[str, int]]:
+        return [(item, count) for item, count in heapq.nlargest(k, self._counts.items(), key=lambda i: (i[1], i[0]))
+                if count >= min_count]
+
+class LinguisticProfiler:
+    """
+    One-pass streaming voice profiler.
+    
+    Each sample is tokenized once. Every feature is a running counter, except
+    vocabulary richness (moving-average type-token ratio over a fixed window)
+    and the phrase, starter and emphasis tallies (FrequentItems), so memory
+    stays bounded however much text is fed.
+    """
+    def __init__(self, top_k: int = 10, ngram_sizes: Tuple[int, ...] = (2, 3),
+                 ttr_window: int = 100, capacity: int = 500):
+        self.top_k = top_k
+        self.ngram_sizes = ngram_sizes
+        self.words = 0
+        self.sentences = 0
+        self.emotional = 0
+        self.pronouns = 0
+        self.past_tense = 0
+        self.long_words = 0
+        self.informal = 0
+        self.exclamations = 0
+        self.transitions: Counter = Counter()
+        self.phrases = FrequentItems(capacity)
+        self.starters = FrequentItems(capacity)
+        self.emphasis = FrequentItems(capacity)
+        # Moving-average type-token ratio
+        self._window: deque = deque(maxlen=ttr_window)
+        self._window_counts: Counter = Counter()
+        self._ttr_sum = 0.0
+        self._ttr_windows = 0
+        # Current sentence
+        self._recent: deque = deque(maxlen=max(ngram_sizes, default=1))
+        self._sentence_words: List[str] = []
+    
+    def feed(self, text: str):
+        """Tokenize one sample and update every feature"""
+        for match in _VOICE_TOKEN.finditer(text):
+            token = match.group()
+            if token[0] in '.!?':
+                self.exclamations += token.count('!')
+                self._end_sentence()
+            else:
+                self._add_word(token)
+        self._end_sentence()  # A sample never continues a sentence into the next one
+    
+    def _add_word(self, token: str):
+        word = token.lower()
+        self.words += 1
+        if word in EMOTION_WORDS:
+            self.emotional += 1
+        if word in PERSONAL_PRONOUNS:
+            self.pronouns += 1
+        if word in IRREGULAR_PAST or (len(word) > 4 and word.endswith('ed')):
+            self.past_tense += 1
+        if word in TRANSITION_WORDS:
+            self.transitions[word] += 1
+        if len(word) >= 8:
+            self.long_words += 1
+        if "'" in word or word in INFORMAL_WORDS:
+            self.informal += 1
+        if len(token) > 1 and token.isupper() and word != 'i':
+            self.emphasis.add(token)
+        if self._recent and self._recent[-1] in INTENSIFIERS:
+            self.emphasis.add(f"{self._recent[-1]} {word}")
+        
+        # Vocabulary richness over a sliding window
+        if len(self._window) == self._window.maxlen:
+            dropped = self._window[0]
+            self._window_counts[dropped] -= 1
+            if not self._window_counts[dropped]:
+                del self._window_counts[dropped]
+        self._window.append(word)
+        self._window_counts[word] += 1
+        if len(self._window) == self._window.maxlen:
+            self._ttr_sum += len(self._window_counts) / len(self._window)
+            self._ttr_windows += 1
+        
+        # Phrases and sentence starters
+        self._recent.append(word)
+        for n in self.ngram_sizes:
+            if len(self._recent) >= n:
+                gram = list(self._recent)[-n:]
+                if not all(w in STOPWORDS for w in gram):
+                    self.phrases.add(' '.join(gram))
+        if len(self._sentence_words) < 2:
+            self._sentence_words.append(word)
+            if len(self._sentence_words) == 2:
+                self.starters.add(' '.join(self._sentence_words))
+    
+    def _end_sentence(self):
+        if self._sentence_words:
+            self.sentences += 1
+            if len(self._sentence_words) == 1:
+                self.starters.add(self._sentence_words[0])
+        self._sentence_words = []
+        self._recent.clear()
+    
+    def features(self) -> Dict[str, Any]:
+        words = self.words or 1
+        if self._ttr_windows:
+            richness = self._ttr_sum / self._ttr_windows
+        else:
+            richness = len(self._window_counts) / len(self._window) if self._window else 0
+        # Long words raise formality; contractions and casual words lower it
+        formality = (self.long_words - 2 * self.informal) / words
+        return {
+            'avg_sentence_length': self.words / self.sentences if self.sentences else 0,
+            'vocabulary_richness': richness,
+            'formality_level': 'high' if formality > 0.08 else 'low' if formality < 0 else 'medium',
+            'emotional_words_ratio': self.emotional / words,
+            'personal_pronouns_ratio': self.pronouns / words,
+            'past_tense_ratio': self.past_tense / words,
+            'exclamations_per_sentence': self.exclamations / self.sentences if self.sentences else 0
+        }
+    
+    def patterns(self) -> Dict[str, List[str]]:
+        return {
+            'common_phrases': [p for p, _ in self.phrases.top(self.top_k, min_count=2)],
+            'sentence_starters': [p for p, _ in self.starters.top(self.top_k, min_count=2)],
+            'transition_words': [w for w, _ in self.transitions.most_common(self.top_k)],
+            'emphasis_patterns': [p for p, _ in self.emphasis.top(self.top_k, min_count=2)]
+        }
+
+def profile_text(text_samples: Iterable[str], **options) -> LinguisticProfiler:
+    """Feed samples (any iterable, e.g. a generator over a large corpus) to a new profiler"""
+    profiler = LinguisticProfiler(**options)
+    for sample in text_samples:
+        profiler.feed(sample)
+    return profiler
+
 # Voice Analysis Tools
-def extract_linguistic_features(text_samples: List[str]) -> Dict[str, Any]:
+def extract_linguistic_features(text_samples: Iterable[str]) -> Dict[str, Any]:
     """Tool to extract linguistic features from text"""
-    features = {
-        'avg_sentence_length': 0,
-        'vocabulary_richness': 0,
-        'formality_level': 'medium',
-        'emotional_words_ratio': 0,
-        'personal_pronouns_ratio': 0,
-        'past_tense_ratio': 0
-    }
-    
-    # Simple implementation - would use NLP
-    total_words = sum(len(sample.split()) for sample in text_samples)
-    total_sentences = sum(sample.count('.') + sample.count('!') + sample.count('?') 
-                         for sample in text_samples)
-    
-    if total_sentences > 0:
-        features['avg_sentence_length'] = total_words / total_sentences
-    
-    return features
+    return profile_text(text_samples).features()
 
-def identify_speech_patterns(text_samples: List[str]) -> Dict[str, List[str]]:
+def identify_speech_patterns(text_samples: Iterable[str]) -> Dict[str, List[str]]:
     """Tool to identify recurring speech patterns"""
-    patterns = {
-        'common_phrases': [],
-        'sentence_starters': [],
-        'transition_words': [],
-        'emphasis_patterns': []
-    }
-    
-    # Would analyze for actual patterns
-    return patterns
+    return profile_text(text_samples).patterns()
 
 # Voice Preservation Agent
 class VoiceAgent(Agent):
@@ -459,11 +1882,24 @@ class VoiceAgent(Agent):
         )
         self.voice_profile = {}
     
-    def analyze_voice(self, memory_samples: List[Memory]) -> Dict[str, Any]:
-        """Create comprehensive voice profile"""
+    def analyze_voice(self, memory_samples: List[Memory], use_llm: bool = True) -> Dict[str, Any]:
+        """
+        Create comprehensive voice profile.
+        
+        The quantitative profile comes from one streaming pass over the
+        samples; with use_llm=False no agent call is made, so very large
+        writing samples can be profiled cheaply.
+        """
         text_samples = [m.content for m in memory_samples]
         
-        prompt = f"""Analyze these {len(text_samples)} memory descriptions to capture the person's authentic voice.
+        # Use tools for quantitative analysis, both from a single pass
+        profiler = profile_text(text_samples)
+        linguistic_features = profiler.features()
+        speech_patterns = profiler.patterns()
+        
+        qualitative_insights: Dict[str, str] = {}
+        if use_llm:
+            prompt = f"""Analyze these {len(text_samples)} memory descriptions to capture the person's authentic voice.
 
 Identify:
 1. Vocabulary preferences (formal/casual, simple/complex)
@@ -474,20 +1910,20 @@ Identify:
 6. Unique phrases or expressions
 7. Storytelling style (direct/meandering, factual/emotional)
 
+Measured so far: {linguistic_features}
+Recurring phrases: {speech_patterns['common_phrases']}
+
 Create a voice profile that will help maintain authenticity in the final narrative."""
 
-        result = self.run(prompt)
-        
-        # Use tools for quantitative analysis
-        linguistic_features = extract_linguistic_features(text_samples)
-        speech_patterns = identify_speech_patterns(text_samples)
+            result = self.run(prompt)
+            qualitative_insights = self._extract_qualitative_insights(result)
         
         # Combine with qualitative insights
         self.voice_profile = {
             'linguistic_features': linguistic_features,
             'speech_patterns': speech_patterns,
-            'qualitative_insights': self._extract_qualitative_insights(result),
-            'sample_authentic_phrases': self._extract_sample_phrases(text_samples)
+            'qualitative_insights': qualitative_insights,
+            'sample_authentic_phrases': self._extract_sample_phrases(speech_patterns)
         }
         
         return self.voice_profile
@@ -501,10 +1937,10 @@ Create a voice profile that will help maintain authenticity in the final narrati
             'formality': 'casual with moments of reflection'
         }
     
-    def _extract_sample_phrases(self, samples: List[str]) -> List[str]:
+    def _extract_sample_phrases(self, speech_patterns: Dict[str, List[str]]) -> List[str]:
         """Extract characteristic phrases"""
-        # Would identify actual recurring phrases
-        return ["I remember thinking...", "Looking back now...", "It's funny how..."]
+        phrases = speech_patterns['sentence_starters'][:3] + speech_patterns['common_phrases'][:3]
+        return [f"{phrase}..." for phrase in dict.fromkeys(phrases)]
 
 # Narrative Generation Tools
 def create_scene(memory: Memory, style: Dict[str, Any]) -> str:
@@ -637,6 +2073,30 @@ Return the adjusted text."""
         # Return adjusted text
         return text
 
+# Relationship Analysis Tools
+def identify_relationships(
+    people_graph: PeopleGraph,
+    people_index: Dict[str, List[str]],
+    top_k: int = 10
+) -> List[Relationship]:
+    """Tool to identify key relationships from the people co-occurrence graph"""
+    relationships = []
+    for person, appearances in heapq.nlargest(top_k, people_graph.appearances.items(), key=lambda item: item[1]):
+        ties = people_graph.top_relationships(person, 3)
+        years = sorted({year for other, _ in ties for year, _ in people_graph.relationship_timeline(person, other)})
+        impact = f"Appears in {appearances} memories"
+        if years:
+            impact += f" ({years[0]}-{years[-1]})"
+        if ties:
+            impact += "; closest to " + ", ".join(f"{other} ({shared})" for other, shared in ties)
+        relationships.append(Relationship(
+            person=person,
+            role="To be determined",
+            impact=impact,
+            key_moments=people_index.get(person, [])[:5]
+        ))
+    return relationships
+
 # Coherence Checking Tools
 def check_timeline_consistency(chapters: List[str]) -> List[str]:
     """Tool to verify timeline consistency across chapters"""
@@ -644,10 +2104,28 @@ def check_timeline_consistency(chapters: List[str]) -> List[str]:
     # Would check for chronological inconsistencies
     return issues
 
-def verify_character_consistency(chapters: List[str], people_index: Dict[str, List[str]]) -> List[str]:
+def verify_character_consistency(
+    chapters: List[str],
+    people_index: Dict[str, List[str]],
+    people_graph: Optional[PeopleGraph] = None,
+    min_memories: int = 3
+) -> List[str]:
     """Tool to verify character portrayals are consistent"""
     issues = []
-    # Would check character descriptions
+    # Flag people who recur in the memories but never appear in the text
+    recurring = {person: [person] for person, memory_ids in people_index.items() if len(memory_ids) >= min_memories}
+    if not recurring:
+        return issues
+    mentioned = ThemeMatcher(recurring).scan("\n".join(chapters))
+    for person in recurring:
+        if person not in mentioned:
+            issue = f"{person} appears in {len(people_index[person])} memories but in no chapter"
+            if people_graph is not None:
+                ties = people_graph.top_relationships(person, 2)
+                if ties:
+                    issue += f" (closest to {', '.join(name for name, _ in ties)})"
+            issues.append(issue)
+    # Would also check character descriptions
     return issues
 
 def assess_thematic_coherence(chapters: List[str], themes: List[Theme]) -> Dict[str, float]:
@@ -692,7 +2170,7 @@ Identify any issues that need correction."""
         
         # Use tools for specific checks
         timeline_issues = check_timeline_consistency(chapters)
-        character_issues = verify_character_consistency(chapters, memory_bank.people_index)
+        character_issues = verify_character_consistency(chapters, memory_bank.people_index, memory_bank.people_graph)
         theme_scores = assess_thematic_coherence(chapters, themes)
         
         return {
@@ -718,8 +2196,13 @@ Identify any issues that need correction."""
 class AutobiographyOrchestrator:
     """Enhanced orchestrator with state management and error handling"""
     
-    def __init__(self):
-        self.memory_bank = MemoryBank()
+    def __init__(self, db_path: Optional[str] = None, duplicate_threshold: Optional[float] = 0.8):
+        # Persist to SQLite when a database path is given, otherwise keep memories in RAM.
+        # Gap-filling re-interviews retell stored stories, so near-duplicates are folded in
+        if db_path:
+            self.memory_bank = SQLiteMemoryBank(db_path, duplicate_threshold=duplicate_threshold)
+        else:
+            self.memory_bank = MemoryBank(duplicate_threshold=duplicate_threshold)
         self.interview_agent = InterviewAgent(self.memory_bank)
         self.timeline_agent = TimelineAgent(self.memory_bank)
         self.theme_agent = ThemeAgent(self.memory_bank)
@@ -731,9 +2214,11 @@ class AutobiographyOrchestrator:
             'user_name': '',
             'phases': [],
             'themes': [],
+            'relationships': [],
             'voice_profile': {},
             'chapters': [],
             'timeline_gaps': [],
+            'timeline_coverage': {},
             'generation_log': []
         }
     
@@ -851,12 +2336,19 @@ Keep it conversational and warm."""
         phases, gaps = self.timeline_agent.build_timeline()
         self.state['phases'] = phases
         self.state['timeline_gaps'] = gaps
+        self.state['timeline_coverage'] = self.timeline_agent.coverage
         
         # Extract themes
         themes = self.theme_agent.analyze_themes()
         self.state['themes'] = themes
         
-        self._log(f"Identified {len(phases)} life phases and {len(themes)} major themes")
+        # Relationships come straight from the people graph maintained at store time
+        self.state['relationships'] = identify_relationships(
+            self.memory_bank.people_graph, self.memory_bank.people_index
+        )
+        
+        self._log(f"Identified {len(phases)} life phases, {len(themes)} major themes "
+                  f"and {len(self.state['relationships'])} key relationships")
     
     def _analyze_voice(self):
         """Analyze authentic voice from memories"""
@@ -879,6 +2371,10 @@ Keep it conversational and warm."""
                 f"years {start_year}-{end_year}",
                 target_memories=3
             )
+        
+        # The segmenter was updated as the new memories were stored
+        self.state['phases'], self.state['timeline_gaps'] = self.timeline_agent.build_timeline(use_llm=False)
+        self.state['timeline_coverage'] = self.timeline_agent.coverage
     
     def _generate_all_chapters(self):
         """Generate all narrative chapters"""
@@ -1051,9 +2547,402 @@ if __name__ == "__main__":
     autobiography = generate_autobiography_with_progress("Jane Doe")
 ```
 
+## Benchmarks
+
+Synthetic workloads for the storage indices. They exercise the index structures
+directly with generated IDs, so the timings exclude `Memory` validation.
+
+```python
+import random
+import time
+from types import SimpleNamespace
+
+def _legacy_timeline_insert(timeline: List[int], years: Dict[int, int], memory_id: int, year: int):
+    """The original linear-scan insert, kept for comparison"""
+    insert_pos = len(timeline)
+    for i, mem_id in enumerate(timeline):
+        if years[mem_id] > year:
+            insert_pos = i
+            break
+    timeline.insert(insert_pos, memory_id)
+
+def benchmark_timeline_index(
+    sizes: Tuple[int, ...] = (10_000, 100_000, 1_000_000),
+    queries: int = 200,
+    legacy_limit: int = 10_000,
+    seed: int = 7
+) -> List[Dict[str, float]]:
+    """Time TimelineIndex builds and 10-year period queries at each bank size"""
+    rng = random.Random(seed)
+    results = []
+    for n in sizes:
+        ids = list(range(n))
+        years = [rng.randint(1900, 2024) for _ in range(n)]
+        spans = [(start, start + 9) for start in (rng.randint(1900, 2015) for _ in range(queries))]
+        
+        index = TimelineIndex()
+        started = time.perf_counter()
+        for key, year in zip(ids, years):
+            index.insert(key, year)
+        build_s = time.perf_counter() - started
+        
+        started = time.perf_counter()
+        hits = sum(len(index.range(start, end)) for start, end in spans)
+        query_ms = (time.perf_counter() - started) * 1000 / queries
+        
+        row = {'memories': n, 'build_s': build_s, 'query_ms': query_ms, 'avg_hits': hits / queries}
+        if n <= legacy_limit:
+            timeline, year_of = [], dict(zip(ids, years))
+            started = time.perf_counter()
+            for memory_id, year in zip(ids, years):
+                _legacy_timeline_insert(timeline, year_of, memory_id, year)
+            row['legacy_build_s'] = time.perf_counter() - started
+        results.append(row)
+    return results
+
+def _legacy_theme_frequency(contents: List[str], theme_keywords: Dict[str, List[str]]) -> Dict[str, int]:
+    """The original per-theme, per-keyword substring scan, kept for comparison"""
+    theme_counts = {theme: 0 for theme in theme_keywords}
+    for content in contents:
+        content_lower = content.lower()
+        for theme, keywords in theme_keywords.items():
+            if any(keyword in content_lower for keyword in keywords):
+                theme_counts[theme] += 1
+    return theme_counts
+
+def benchmark_theme_matcher(
+    sizes: Tuple[int, ...] = (1_000, 10_000, 100_000),
+    themes: int = 300,
+    keywords_per_theme: int = 5,
+    legacy_limit: int = 10_000,
+    seed: int = 7
+) -> List[Dict[str, float]]:
+    """Time theme frequency over synthetic memories (~60 words each) with hundreds of themes"""
+    rng = random.Random(seed)
+    vocabulary = [''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(3, 9)))
+                  for _ in range(5_000)]
+    theme_keywords = {f"theme_{t}": rng.sample(vocabulary, keywords_per_theme) for t in range(themes)}
+    results = []
+    for n in sizes:
+        memories = [SimpleNamespace(id=f"mem_{i}", content=' '.join(rng.choices(vocabulary, k=60)))
+                    for i in range(n)]
+        
+        started = time.perf_counter()
+        matcher = ThemeMatcher(theme_keywords)
+        matcher.frequency(memories)
+        row = {'memories': n, 'matcher_s': time.perf_counter() - started}
+        
+        started = time.perf_counter()
+        matcher.frequency(memories)
+        row['cached_s'] = time.perf_counter() - started
+        
+        if n <= legacy_limit:
+            started = time.perf_counter()
+            _legacy_theme_frequency([m.content for m in memories], theme_keywords)
+            row['legacy_s'] = time.perf_counter() - started
+        results.append(row)
+    return results
+
+def benchmark_theme_index(
+    sizes: Tuple[int, ...] = (10_000, 100_000),
+    themes: int = 50,
+    seed: int = 7
+) -> List[Dict[str, float]]:
+    """Time stores against a registered vocabulary and registering one more theme"""
+    rng = random.Random(seed)
+    vocabulary = [''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(3, 9)))
+                  for _ in range(5_000)]
+    results = []
+    for n in sizes:
+        bank = MemoryBank()
+        for t in range(themes):
+            bank.register_theme(f"theme_{t}", rng.sample(vocabulary, 3))
+        memories = [Memory(id=f"mem_{i}", content=' '.join(rng.choices(vocabulary, k=60)),
+                           memory_type=MemoryType.ROUTINE, year=rng.randint(1900, 2024),
+                           significance="benchmark") for i in range(n)]
+        
+        started = time.perf_counter()
+        for memory in memories:
+            bank.store(memory)
+        row = {'memories': n, 'store_us': (time.perf_counter() - started) * 1e6 / n}
+        
+        started = time.perf_counter()
+        row['new_theme_hits'] = bank.register_theme("new_theme", rng.sample(vocabulary, 3))
+        row['register_s'] = time.perf_counter() - started
+        
+        started = time.perf_counter()
+        bank.theme_timeline("new_theme")
+        row['timeline_ms'] = (time.perf_counter() - started) * 1000
+        results.append(row)
+    return results
+
+def benchmark_sqlite_memory_bank(
+    sizes: Tuple[int, ...] = (10_000, 100_000, 1_000_000),
+    queries: int = 100,
+    seed: int = 7
+) -> List[Dict[str, float]]:
+    """Build SQLite banks, then time reopening them and querying without loading everything"""
+    import os
+    import tempfile
+    
+    rng = random.Random(seed)
+    vocabulary = [''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(3, 9)))
+                  for _ in range(5_000)]
+    people = [f"person_{p}" for p in range(2_000)]
+    results = []
+    for n in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "memories.db")
+            started = time.perf_counter()
+            with SQLiteMemoryBank(db_path) as bank:
+                for chunk in range(0, n, 10_000):
+                    bank.store_many([
+                        Memory(id=f"mem_{i}", content=' '.join(rng.choices(vocabulary, k=40)),
+                               memory_type=MemoryType.ROUTINE, year=rng.randint(1900, 2024),
+                               people=rng.sample(people, 2), significance="benchmark")
+                        for i in range(chunk, min(chunk + 10_000, n))
+                    ])
+            row = {'memories': n, 'build_s': time.perf_counter() - started,
+                   'db_mb': os.path.getsize(db_path) / 1e6}
+            
+            started = time.perf_counter()
+            bank = SQLiteMemoryBank(db_path)
+            row['open_ms'] = (time.perf_counter() - started) * 1000
+            
+            started = time.perf_counter()
+            for _ in range(queries):
+                bank.get_by_person(rng.choice(people))
+            row['person_ms'] = (time.perf_counter() - started) * 1000 / queries
+            
+            started = time.perf_counter()
+            for _ in range(queries):
+                bank.search(rng.choice(vocabulary), limit=20)
+            row['search_ms'] = (time.perf_counter() - started) * 1000 / queries
+            
+            started = time.perf_counter()
+            for _ in range(queries):
+                bank.memories[f"mem_{rng.randrange(n)}"]
+            row['lookup_ms'] = (time.perf_counter() - started) * 1000 / queries
+            bank.close()
+        results.append(row)
+    return results
+
+def benchmark_memory_columns(
+    sizes: Tuple[int, ...] = (10_000, 100_000, 1_000_000),
+    legacy_limit: int = 100_000,
+    seed: int = 7
+) -> List[Dict[str, float]]:
+    """Time phase and gap analytics on the columns against loops over Memory objects"""
+    rng = random.Random(seed)
+    types = list(MemoryType)
+    results = []
+    for n in sizes:
+        columns = MemoryColumns()
+        for i in range(n):
+            age = rng.randint(0, 90)
+            columns.append_values(f"mem_{i}", 1930 + age if rng.random() < 0.9 else None, age,
+                                  rng.randrange(len(types)), rng.randint(0, 4), [])
+        started = time.perf_counter()
+        identify_life_phases(columns=columns)
+        detect_timeline_gaps(columns=columns)
+        row = {'memories': n, 'columns_ms': (time.perf_counter() - started) * 1000}
+        
+        if n <= legacy_limit:
+            memories = [Memory(id=memory_id, content="benchmark memory", memory_type=types[code],
+                               year=None if year == _UNKNOWN else year, age=age, significance="benchmark")
+                        for memory_id, year, age, code in zip(columns.ids, columns.year, columns.age, columns.type_code)]
+            started = time.perf_counter()
+            brackets = [(0, 12), (13, 18), (19, 25), (26, 40), (41, 60), (61, 100)]
+            for start_age, end_age in brackets:
+                phase_memories = [m for m in memories if m.age and start_age <= m.age <= end_age]
+                min((m.year for m in phase_memories if m.year), default=None)
+                max((m.year for m in phase_memories if m.year), default=None)
+            dated = sorted([m for m in memories if m.year], key=lambda m: m.year)
+            [b.year - a.year for a, b in zip(dated, dated[1:])]
+            row['objects_ms'] = (time.perf_counter() - started) * 1000
+        results.append(row)
+    return results
+
+def benchmark_near_duplicates(
+    sizes: Tuple[int, ...] = (10_000, 100_000),
+    duplicate_rate: float = 0.1,
+    threshold: float = 0.8,
+    seed: int = 7
+) -> List[Dict[str, float]]:
+    """Time index lookups on synthetic memories where some are one-word edits of earlier ones"""
+    rng = random.Random(seed)
+    vocabulary = [''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(3, 9)))
+                  for _ in range(5_000)]
+    results = []
+    for n in sizes:
+        index = NearDuplicateIndex(threshold)
+        texts: List[List[str]] = []
+        planted = caught = false_matches = 0
+        lookup_s = 0.0
+        for i in range(n):
+            is_duplicate = bool(texts) and rng.random() < duplicate_rate
+            if is_duplicate:
+                words = list(rng.choice(texts))
+                words[rng.randrange(len(words))] = rng.choice(vocabulary)
+                planted += 1
+            else:
+                words = rng.choices(vocabulary, k=60)
+            signature = index.signature(' '.join(words))
+            started = time.perf_counter()
+            match = index.find(signature)
+            lookup_s += time.perf_counter() - started
+            if match is None:
+                index.add(i, signature)
+                texts.append(words)
+            elif is_duplicate:
+                caught += 1
+            else:
+                false_matches += 1
+        results.append({'memories': n, 'lookup_us': lookup_s * 1e6 / n, 'planted': planted,
+                        'caught': caught, 'false_matches': false_matches})
+    return results
+
+def benchmark_people_graph(
+    sizes: Tuple[int, ...] = (10_000, 100_000, 1_000_000),
+    people: int = 500,
+    queries: int = 1_000,
+    seed: int = 7
+) -> List[Dict[str, float]]:
+    """Time graph updates and relationship queries on memories with 1-4 people each"""
+    rng = random.Random(seed)
+    names = [f"person_{p}" for p in range(people)]
+    results = []
+    for n in sizes:
+        graph = PeopleGraph()
+        started = time.perf_counter()
+        for _ in range(n):
+            graph.add(rng.sample(names, rng.randint(1, 4)), rng.randint(1900, 2024))
+        row = {'memories': n, 'add_us': (time.perf_counter() - started) * 1e6 / n}
+        
+        started = time.perf_counter()
+        for _ in range(queries):
+            person = rng.choice(names)
+            for other, _ in graph.top_relationships(person, 5):
+                graph.relationship_timeline(person, other)
+        row['query_us'] = (time.perf_counter() - started) * 1e6 / queries
+        
+        started = time.perf_counter()
+        graph.clusters()
+        row['clusters_ms'] = (time.perf_counter() - started) * 1000
+        results.append(row)
+    return results
+
+def benchmark_linguistic_profiler(
+    sizes: Tuple[int, ...] = (10_000, 100_000, 300_000),
+    seed: int = 7
+) -> List[Dict[str, float]]:
+    """Time one-pass profiling of synthetic first-person prose (~12 words per sentence)"""
+    import tracemalloc
+    
+    rng = random.Random(seed)
+    vocabulary = sorted(EMOTION_WORDS | PERSONAL_PRONOUNS | IRREGULAR_PAST | TRANSITION_WORDS) + [
+        ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(3, 10))) for _ in range(3_000)
+    ]
+    starters = ["I remember", "Looking back", "Back then", "My father", "We always"]
+    
+    def samples(words: int):
+        while words > 0:
+            sentence = [rng.choice(starters)] + rng.choices(vocabulary, k=10)
+            words -= len(sentence) + 1
+            yield ' '.join(sentence) + rng.choice('..!?')
+    
+    def run(n: int) -> float:
+        started = time.perf_counter()
+        profiler = profile_text(samples(n))
+        profiler.features()
+        profiler.patterns()
+        return time.perf_counter() - started
+    
+    results = []
+    for n in sizes:
+        elapsed = run(n)
+        # Traced separately: tracemalloc slows allocation-heavy code several-fold
+        tracemalloc.start()
+        run(n)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        results.append({'words': n, 'seconds': elapsed, 'words_per_s': n / elapsed, 'peak_kb': peak / 1024})
+    return results
+
+def benchmark_timeline_segmenter(
+    sizes: Tuple[int, ...] = (10_000, 100_000, 1_000_000),
+    reads: int = 1_000,
+    seed: int = 7
+) -> List[Dict[str, float]]:
+    """Time incremental segmentation against recomputing phases and gaps from the columns"""
+    rng = random.Random(seed)
+    types = list(MemoryType)
+    results = []
+    for n in sizes:
+        columns = MemoryColumns()
+        segmenter = TimelineSegmenter()
+        rows = []
+        for i in range(n):
+            age = rng.randint(0, 90)
+            year = 1930 + age if rng.random() < 0.9 else None
+            rows.append((year, age))
+            columns.append_values(f"mem_{i}", year, age, rng.randrange(len(types)), 0, [])
+        
+        started = time.perf_counter()
+        for year, age in rows:
+            segmenter.add(year, age)
+        add_us = (time.perf_counter() - started) * 1e6 / n
+        
+        started = time.perf_counter()
+        for _ in range(reads):
+            segmenter.segment()
+        read_us = (time.perf_counter() - started) * 1e6 / reads
+        
+        started = time.perf_counter()
+        identify_life_phases(columns=columns)
+        detect_timeline_gaps(columns=columns)
+        recompute_ms = (time.perf_counter() - started) * 1000
+        results.append({'memories': n, 'add_us': add_us, 'read_us': read_us, 'recompute_ms': recompute_ms})
+    return results
+
+if __name__ == "__main__":
+    for row in benchmark_timeline_index():
+        legacy = f", legacy build {row['legacy_build_s']:.2f}s" if 'legacy_build_s' in row else ""
+        print(f"{row['memories']:>9,} memories: build {row['build_s']:.2f}s, "
+              f"query {row['query_ms']:.2f}ms ({row['avg_hits']:,.0f} hits){legacy}")
+    for row in benchmark_theme_matcher():
+        legacy = f", legacy {row['legacy_s']:.2f}s" if 'legacy_s' in row else ""
+        print(f"{row['memories']:>9,} memories x 300 themes: matcher {row['matcher_s']:.2f}s, "
+              f"cached {row['cached_s']:.3f}s{legacy}")
+    for row in benchmark_theme_index():
+        print(f"{row['memories']:>9,} memories x 50 themes: store {row['store_us']:.0f}us each, "
+              f"register theme {row['register_s']:.3f}s ({row['new_theme_hits']:,} hits), "
+              f"timeline {row['timeline_ms']:.1f}ms")
+    for row in benchmark_sqlite_memory_bank():
+        print(f"{row['memories']:>9,} memories in SQLite ({row['db_mb']:.0f} MB, built in {row['build_s']:.0f}s): "
+              f"open {row['open_ms']:.1f}ms, person {row['person_ms']:.2f}ms, "
+              f"search {row['search_ms']:.2f}ms, lookup {row['lookup_ms']:.3f}ms")
+    for row in benchmark_memory_columns():
+        objects = f", Memory objects {row['objects_ms']:.1f}ms" if 'objects_ms' in row else ""
+        print(f"{row['memories']:>9,} memories: phases + gaps on columns {row['columns_ms']:.1f}ms{objects}")
+    for row in benchmark_near_duplicates():
+        print(f"{row['memories']:>9,} memories: duplicate lookup {row['lookup_us']:.0f}us, "
+              f"caught {row['caught']:,} of {row['planted']:,} planted near-duplicates, "
+              f"{row['false_matches']} false matches")
+    for row in benchmark_people_graph():
+        print(f"{row['memories']:>9,} memories x 500 people: add {row['add_us']:.1f}us, "
+              f"top-5 + timelines {row['query_us']:.0f}us, clusters {row['clusters_ms']:.1f}ms")
+    for row in benchmark_linguistic_profiler():
+        print(f"{row['words']:>9,} words: profiled in {row['seconds']:.2f}s "
+              f"({row['words_per_s']:,.0f} words/s, peak {row['peak_kb']:,.0f} KB)")
+    for row in benchmark_timeline_segmenter():
+        print(f"{row['memories']:>9,} memories: segmenter {row['add_us']:.2f}us/store, "
+              f"read {row['read_us']:.0f}us vs recompute from columns {row['recompute_ms']:.1f}ms")
+```
+
 ## Key Architecture Decisions
 
-1. **Memory Bank**: Central storage allows all agents to access memories
+1. **Memory Bank**: Central storage allows all agents to access memories, with a year-bucketed timeline index for period queries; `SQLiteMemoryBank` persists the same API to disk with FTS5 search
 2. **Specialized Agents**: Each agent has deep expertise in its domain
 3. **Tool System**: Tools provide concrete operations with typed inputs/outputs
 4. **State Management**: Orchestrator maintains global state across phases
@@ -83,9 +83,13 @@ def extract_themes(memories: List[Memory]) -> List[Theme]:
     # Implementation would identify patterns
     return []
 
-def identify_relationships(memories: List[Memory]) -> List[Relationship]:
-    """Identify key relationships from memories"""
-    # Implementation would extract and analyze people
+def identify_relationships(
+    people_graph: "PeopleGraph",
+    people_index: Dict[str, List[str]],
+    top_k: int = 10
+) -> List[Relationship]:
+    """Identify key relationships from the memory bank's people co-occurrence graph"""
+    # Implementation would rank people by appearances and read their closest ties from the graph
     return []
 
 def create_chapter_outline(
@@ -3,33 +3,127 @@ Three-Pass State Tracker - State management for the 3-pass systematic thinking m
 """
 
 from .core import (
+    PhasePrompts,
     ThreePassState,
+    ComponentJourney,
     ThreePassTracker,
     start_journey,
     get_current_state,
     next_phase,
+    seek_journey,
+    complete_subphase,
+    next_subphase,
+    start_component,
+    get_components_status,
     get_instructions,
     get_status,
     complete_journey,
     abandon_journey,
+    list_snapshots,
+    rewind_journey,
+    get_phase_analytics,
+    record_phase_file,
     get_contextual_prompt,
     explore_methodology,
+    read_methodology_file,
+    read_methodology_files,
     inject_3pass_structure,
-    get_phase_file_path
+    inject_3pass_structures,
+    get_phase_file_path,
+    generate_phase_skeletons
+)
+from .notation import (
+    Notation,
+    format_notation,
+    parse_notation
+)
+from .workflow import (
+    WorkflowTree,
+    get_workflow,
+    parse_workflow
+)
+from .analytics import (
+    DwellStats,
+    PhaseAnalytics
+)
+from .artifacts import (
+    ArtifactRegistry,
+    PhaseArtifact
+)
+from .methodology_index import (
+    MethodologyIndex,
+    related_docs,
+    watch_methodology
+)
+from .methodology_sync import (
+    MethodologySync,
+    SyncResult,
+    sync_methodology
+)
+from .journey_archive import (
+    export_journey,
+    import_journey
+)
+from .phase_watch import (
+    PhaseWatcher,
+    watch_phase_files,
+    unwatch_phase_files
+)
+from .fs_watch import (
+    FileWatcher,
+    TreeChanges
 )
 
 __all__ = [
+    "PhasePrompts",
     "ThreePassState", 
+    "ComponentJourney",
     "ThreePassTracker",
     "start_journey",
     "get_current_state", 
     "next_phase",
+    "seek_journey",
+    "complete_subphase",
+    "next_subphase",
+    "start_component",
+    "get_components_status",
     "get_instructions",
     "get_status",
     "complete_journey",
     "abandon_journey",
+    "list_snapshots",
+    "rewind_journey",
+    "get_phase_analytics",
+    "record_phase_file",
     "get_contextual_prompt",
     "explore_methodology",
+    "read_methodology_file",
+    "read_methodology_files",
     "inject_3pass_structure",
-    "get_phase_file_path"
+    "inject_3pass_structures",
+    "get_phase_file_path",
+    "generate_phase_skeletons",
+    "Notation",
+    "format_notation",
+    "parse_notation",
+    "WorkflowTree",
+    "get_workflow",
+    "parse_workflow",
+    "DwellStats",
+    "PhaseAnalytics",
+    "ArtifactRegistry",
+    "PhaseArtifact",
+    "MethodologyIndex",
+    "related_docs",
+    "watch_methodology",
+    "MethodologySync",
+    "SyncResult",
+    "sync_methodology",
+    "export_journey",
+    "import_journey",
+    "PhaseWatcher",
+    "watch_phase_files",
+    "unwatch_phase_files",
+    "FileWatcher",
+    "TreeChanges"
 ]
\ No newline at end of file
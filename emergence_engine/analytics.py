@@ -0,0 +1,192 @@
+"""
+Phase dwell-time analytics across journeys
+
+Each phase transition adds its dwell time to a running aggregate keyed by
+(pass, phase, domain). Aggregates hold a count, sum, max and a sparse
+log-scale histogram, so updates are O(1) and p50/p95 can be answered
+(within one bucket, about ±5%) without reading any journey's history.
+Histograms merge by addition, so cross-domain queries just sum buckets.
+"""
+
+import json
+import logging
+import math
+import os
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+from .notation import MAX_PHASE, MAX_PASS
+
+logger = logging.getLogger(__name__)
+
+ANALYTICS_FILE = "phase_analytics.json"
+
+# Histogram buckets grow by 10%: bucket b covers [GROWTH**b, GROWTH**(b+1)) seconds
+_GROWTH = 1.1
+_LOG_GROWTH = math.log(_GROWTH)
+
+
+class DwellStats:
+    """Mergeable dwell-time aggregate"""
+
+    __slots__ = ("count", "total", "max", "buckets")
+
+    def __init__(self, count: int = 0, total: float = 0.0, max: float = 0.0,
+                 buckets: Optional[Dict[int, int]] = None):
+        self.count = count
+        self.total = total
+        self.max = max
+        self.buckets: Dict[int, int] = dict(buckets or {})
+
+    @staticmethod
+    def _bucket(seconds: float) -> int:
+        return math.floor(math.log(max(seconds, 1e-3)) / _LOG_GROWTH)
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        bucket = self._bucket(seconds)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def merge(self, other: "DwellStats") -> None:
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        for bucket, count in other.buckets.items():
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + count
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, p: float) -> float:
+        """Approximate percentile (0-100) from the histogram"""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(p / 100 * self.count))
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                # Geometric midpoint of the bucket, never above the observed max
+                return min(_GROWTH ** (bucket + 0.5), self.max)
+        return self.max
+
+    def to_dict(self) -> dict:
+        return {"count": self.count, "total": self.total, "max": self.max,
+                "buckets": {str(b): c for b, c in sorted(self.buckets.items())}}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DwellStats":
+        return cls(data["count"], data["total"], data["max"],
+                   {int(b): c for b, c in data.get("buckets", {}).items()})
+
+
+class PhaseStatsRow(NamedTuple):
+    """One row of an analytics query"""
+    pass_num: int
+    phase: int
+    domain: str  # "*" when aggregated across domains
+    stats: DwellStats
+
+
+def _key(pass_num: int, phase: int, domain: str) -> str:
+    return f"{pass_num}|{phase}|{domain}"
+
+
+class PhaseAnalytics:
+    """
+    File-backed dwell-time aggregates shared by every journey of a tracker.
+
+    Updates take an exclusive lock on a sibling .lock file (where available),
+    so several MCP server processes sharing a state directory don't lose each
+    other's counts, and replace the data file atomically.
+    """
+
+    def __init__(self, analytics_file: Path):
+        self.analytics_file = Path(analytics_file)
+
+    @property
+    def _lock_file(self) -> Path:
+        return self.analytics_file.with_name(self.analytics_file.name + ".lock")
+
+    def _read(self) -> Dict[str, DwellStats]:
+        # Writers replace the file atomically, so readers need no lock
+        try:
+            with open(self.analytics_file, "r") as f:
+                data = json.loads(f.read() or "{}")
+        except FileNotFoundError:
+            return {}
+        except ValueError as e:
+            logger.error(f"Failed to load phase analytics {self.analytics_file}: {e}")
+            return {}
+        return {key: DwellStats.from_dict(entry) for key, entry in data.get("phases", {}).items()}
+
+    def record(self, pass_num: int, phase: int, domain: str, seconds: float) -> None:
+        """Add one dwell time to the (pass, phase, domain) aggregate"""
+        fd = os.open(str(self._lock_file), os.O_RDWR | os.O_CREAT, 0o644)
+        with os.fdopen(fd, "r+") as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                with open(self.analytics_file, "r") as f:
+                    data = json.loads(f.read() or "{}")
+            except FileNotFoundError:
+                data = {}
+            except ValueError:
+                logger.error(f"Resetting corrupt phase analytics {self.analytics_file}")
+                data = {}
+            phases = data.setdefault("phases", {})
+            key = _key(pass_num, phase, domain)
+            stats = DwellStats.from_dict(phases[key]) if key in phases else DwellStats()
+            stats.add(seconds)
+            phases[key] = stats.to_dict()
+
+            # Write a sibling temp file and swap it in, so a crash never leaves a truncated file
+            tmp = self.analytics_file.with_name(f".{self.analytics_file.name}.{os.getpid()}.tmp")
+            try:
+                with open(tmp, "w") as f:
+                    json.dump(data, f, separators=(",", ":"))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp, self.analytics_file)
+            finally:
+                if tmp.exists():
+                    tmp.unlink()
+
+    def query(self, domain: Optional[str] = None, pass_num: Optional[int] = None,
+              phase: Optional[int] = None) -> List[PhaseStatsRow]:
+        """
+        Aggregates per (pass, phase), for one domain or merged across all domains.
+
+        Rows with no recorded transitions are omitted.
+        """
+        merged: Dict[tuple, DwellStats] = {}
+        for key, stats in self._read().items():
+            key_pass, key_phase, key_domain = key.split("|", 2)
+            key_pass, key_phase = int(key_pass), int(key_phase)
+            if domain is not None and key_domain != domain:
+                continue
+            if (pass_num is not None and key_pass != pass_num) or (phase is not None and key_phase != phase):
+                continue
+            merged.setdefault((key_pass, key_phase), DwellStats()).merge(stats)
+
+        return [PhaseStatsRow(p, ph, domain if domain is not None else "*", merged[(p, ph)])
+                for p in range(1, MAX_PASS + 1) for ph in range(MAX_PHASE + 1) if (p, ph) in merged]
+
+
+def format_duration(seconds: float) -> str:
+    """Compact human duration: 42s, 7.5m, 3.2h, 1.4d"""
+    if seconds < 60:
+        return f"{seconds:.0f}s"
+    if seconds < 3600:
+        return f"{seconds / 60:.1f}m"
+    if seconds < 86400:
+        return f"{seconds / 3600:.1f}h"
+    return f"{seconds / 86400:.1f}d"
@@ -0,0 +1,170 @@
+"""
+Phase artifact registry - records which phase files a journey has produced
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+from pydantic import BaseModel, Field
+
+from .notation import format_notation
+
+logger = logging.getLogger(__name__)
+
+LAYERS = 3
+PASSES = 3
+PHASES = 7
+EXPECTED_ARTIFACTS = LAYERS * PASSES * PHASES  # 63 per scope
+
+GLOBAL_SCOPE = "global"
+
+# 3_pass_thinking/{global_system|component_specific/<name>}/layer_X/pass_Y/{phase}_{PhaseName}.md
+_PHASE_FILE = re.compile(
+    r"(?:^|/)3_pass_thinking/(?:global_system|component_specific/(?P<component>[^/]+))"
+    r"/layer_(?P<layer>\d+)/pass_(?P<pass_num>\d+)/(?P<phase>\d+)_(?P<name>[A-Za-z]+)\.md$"
+)
+
+
+class PhaseArtifact(BaseModel):
+    """A phase file written during a journey"""
+
+    path: str = Field(..., description="File path relative to the STARLOG project")
+    scope: str = Field(default=GLOBAL_SCOPE, description="'global' or the component name")
+    layer: int = Field(..., description="Layer the file belongs to")
+    pass_num: int = Field(..., description="Pass the file belongs to")
+    phase: int = Field(..., description="Workflow phase (0-6)")
+    notation: str = Field(..., description="DSL notation, e.g. L0P1W[0](3)")
+    size: int = Field(..., description="File size in bytes")
+    sha256: str = Field(..., description="Content hash")
+    recorded_at: datetime = Field(default_factory=datetime.now)
+
+
+def parse_phase_path(path: str) -> Optional[Tuple[str, int, int, int]]:
+    """
+    Identify a phase file from its path.
+
+    Returns:
+        (scope, layer, pass_num, phase) or None if the path isn't a phase file
+    """
+    match = _PHASE_FILE.search(Path(path).as_posix())
+    if not match:
+        return None
+    return (
+        match.group("component") or GLOBAL_SCOPE,
+        int(match.group("layer")),
+        int(match.group("pass_num")),
+        int(match.group("phase")),
+    )
+
+
+def _hash_file(file_path: Path) -> Tuple[str, int]:
+    """Return (sha256, size) of a file, reading it in chunks"""
+    digest = hashlib.sha256()
+    size = 0
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+            size += len(chunk)
+    return digest.hexdigest(), size
+
+
+class ArtifactRegistry:
+    """
+    File-backed registry of phase artifacts for one STARLOG project.
+
+    The whole registry lives in one JSON file so status queries need a single read.
+    """
+
+    def __init__(self, registry_file: Path):
+        self.registry_file = Path(registry_file)
+
+    def load(self) -> Dict[str, PhaseArtifact]:
+        """Load all recorded artifacts keyed by relative path"""
+        if not self.registry_file.exists():
+            return {}
+        try:
+            with open(self.registry_file, "r") as f:
+                data = json.load(f)
+            return {path: PhaseArtifact(**entry) for path, entry in data.get("artifacts", {}).items()}
+        except Exception as e:
+            logger.error(f"Failed to load artifact registry {self.registry_file}: {e}")
+            return {}
+
+    def save(self, artifacts: Dict[str, PhaseArtifact]) -> None:
+        """Atomically write the registry"""
+        tmp = self.registry_file.with_name(self.registry_file.name + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(
+                {"artifacts": {path: a.model_dump() for path, a in sorted(artifacts.items())}},
+                f, default=str, indent=2
+            )
+        os.replace(tmp, self.registry_file)
+
+    def record(self, starlog_path: str, file_path: str) -> PhaseArtifact:
+        """
+        Hash a phase file and record it.
+
+        Raises:
+            ValueError: if file_path is not a phase file inside 3_pass_thinking
+            FileNotFoundError: if the file does not exist
+        """
+        full_path = Path(file_path)
+        if not full_path.is_absolute():
+            full_path = Path(starlog_path) / full_path
+        parsed = parse_phase_path(str(full_path))
+        if parsed is None:
+            raise ValueError(f"Not a 3_pass_thinking phase file: {file_path}")
+
+        scope, layer, pass_num, phase = parsed
+        sha256, size = _hash_file(full_path)
+        try:
+            rel_path = full_path.relative_to(starlog_path).as_posix()
+        except ValueError:
+            rel_path = full_path.as_posix()
+
+        artifact = PhaseArtifact(
+            path=rel_path, scope=scope, layer=layer, pass_num=pass_num, phase=phase,
+            notation=format_notation(layer, pass_num, phase), size=size, sha256=sha256
+        )
+        artifacts = self.load()
+        artifacts[rel_path] = artifact
+        self.save(artifacts)
+        logger.debug(f"Recorded phase artifact {rel_path} ({artifact.notation})")
+        return artifact
+
+    def delete(self) -> None:
+        """Remove the registry file"""
+        if self.registry_file.exists():
+            self.registry_file.unlink()
+
+
+def coverage(artifacts: Dict[str, PhaseArtifact], scope: str = GLOBAL_SCOPE) -> Dict[Tuple[int, int], Set[int]]:
+    """Map (layer, pass) to the recorded phases for one scope"""
+    grid: Dict[Tuple[int, int], Set[int]] = {}
+    for artifact in artifacts.values():
+        if artifact.scope == scope:
+            grid.setdefault((artifact.layer, artifact.pass_num), set()).add(artifact.phase)
+    return grid
+
+
+def format_coverage(artifacts: Dict[str, PhaseArtifact], scope: str = GLOBAL_SCOPE) -> str:
+    """Render the expected-artifact grid: recorded phases as digits, missing as '·'"""
+    grid = coverage(artifacts, scope)
+    recorded = sum(
+        len(phases) for (layer, pass_num), phases in grid.items()
+        if layer < LAYERS and pass_num <= PASSES
+    )
+    lines = [f"Phase Artifacts ({scope}): {recorded}/{EXPECTED_ARTIFACTS}"]
+    for layer in range(LAYERS):
+        cells = []
+        for pass_num in range(1, PASSES + 1):
+            phases = grid.get((layer, pass_num), set())
+            cells.append(f"P{pass_num} " + "".join(str(p) if p in phases else "·" for p in range(PHASES)))
+        lines.append(f"  L{layer}  " + "  ".join(cells))
+    return "\n".join(lines)
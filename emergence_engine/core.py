@@ -2,14 +2,22 @@
 Core functionality for the 3-pass state tracker
 """
 
+import hashlib
 import json
 import os
 import logging
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from pydantic import BaseModel, Field
 from datetime import datetime
 
+from .analytics import ANALYTICS_FILE, PhaseAnalytics, format_duration
+from .artifacts import ArtifactRegistry, PhaseArtifact, format_coverage, GLOBAL_SCOPE
+from .notation import format_notation, parse_notation
+from .snapshots import DEFAULT_MAX_BYTES, DEFAULT_MAX_SNAPSHOTS, SnapshotLog
+from .workflow import Subphase, get_workflow
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,6 +40,18 @@ class PhasePrompts:
         3: "Specifically Reify (Make THIS)"
     }
     
+    @classmethod
+    def get_phase_definition(cls, phase: int) -> str:
+        """Get the workflow notation for a phase, as written in the master prompt"""
+        parsed = get_workflow().phase(phase)
+        return parsed.definition if parsed else f"Phase {phase}"
+    
+    @classmethod
+    def get_subphases(cls, phase: int) -> List[Tuple[str, str]]:
+        """Get (code, name) pairs for a phase's subphases, e.g. ("1a", "PurposeCapture")"""
+        parsed = get_workflow().phase(phase)
+        return [(sub.code, sub.name) for sub in parsed.subphases] if parsed else []
+    
     @classmethod
     def _get_pass1_prompts(cls, domain: str) -> dict:
         """Get Pass 1 (Conceptualize) prompts"""
@@ -89,24 +109,23 @@ class PhasePrompts:
         return prompts.get(phase, f"Work on {phase_name} for {pass_name} in domain: {domain}")
 
 
-class ThreePassState(BaseModel):
+class JourneyPosition(BaseModel):
     """
-    State tracking for 3-pass systematic thinking methodology
+    Position within the 3-pass workflow
     
     Uses notation from the System Design DSL:
     L₀P₁W[0](3) = Layer 0, Pass 1, Workflow Phase 3
     """
     
-    domain: str = Field(..., description="The domain being analyzed")
     layer: int = Field(default=0, description="Current layer (L₀, L₁, L₂, ...)")
     pass_num: int = Field(default=1, description="Current pass (1=Conceptualize, 2=Generally Reify, 3=Specifically Reify)")
     phase: int = Field(default=0, description="Current workflow phase (0-6)")
-    started_at: datetime = Field(default_factory=datetime.now)
-    last_updated: datetime = Field(default_factory=datetime.now)
+    subphases_done: int = Field(default=0, description="Bitset of completed subphases in the current phase (bit n = nth subphase)")
+    phase_entered_at: Optional[datetime] = Field(default=None, description="When the current phase was entered")
     
     def get_notation(self) -> str:
         """Return current state in DSL notation"""
-        return f"L{self.layer}P{self.pass_num}W[{self.layer}]({self.phase})"
+        return format_notation(self.layer, self.pass_num, self.phase)
     
     def get_phase_name(self) -> str:
         """Return human-readable phase name"""
@@ -129,6 +148,56 @@ class ThreePassState(BaseModel):
             3: "Specifically Reify (Make THIS)"
         }
         return pass_names.get(self.pass_num, f"Pass{self.pass_num}")
+    
+    def get_subphase_progress(self) -> Tuple[List[Subphase], Optional[Subphase]]:
+        """Return (completed subphases, first incomplete subphase or None) for the current phase"""
+        phase = get_workflow().phase(self.phase)
+        subphases = phase.subphases if phase else ()
+        done = [sub for sub in subphases if self.subphases_done >> sub.bit & 1]
+        pending = next((sub for sub in subphases if not self.subphases_done >> sub.bit & 1), None)
+        return done, pending
+    
+    def advance(self) -> None:
+        """Move to the next phase, rolling over into the next pass and layer"""
+        self.subphases_done = 0
+        if self.phase < 6:
+            self.phase += 1
+        elif self.pass_num < 3:
+            # End of workflow phases, advance pass
+            self.pass_num += 1
+            self.phase = 0
+        else:
+            # End of all passes, advance layer (recursive application)
+            self.layer += 1
+            self.pass_num = 1
+            self.phase = 0
+
+
+class ComponentJourney(JourneyPosition):
+    """A component's own position, nested under the global journey"""
+    
+    started_at: datetime = Field(default_factory=datetime.now)
+    last_updated: datetime = Field(default_factory=datetime.now)
+
+
+class ThreePassState(JourneyPosition):
+    """
+    State tracking for 3-pass systematic thinking methodology
+    
+    The top-level position is the global system's journey; component
+    journeys keep their own positions in `components`.
+    """
+    
+    domain: str = Field(..., description="The domain being analyzed")
+    started_at: datetime = Field(default_factory=datetime.now)
+    last_updated: datetime = Field(default_factory=datetime.now)
+    components: Dict[str, ComponentJourney] = Field(default_factory=dict, description="Component journeys by name")
+    
+    def get_position(self, component_name: Optional[str] = None) -> Optional[JourneyPosition]:
+        """Return the global position, or a component's (None if it hasn't been started)"""
+        if not component_name:
+            return self
+        return self.components.get(component_name)
 
 
 class ThreePassTracker:
@@ -136,15 +205,67 @@ class ThreePassTracker:
     Manages 3-pass state for multiple journeys using file-based persistence
     """
     
-    def __init__(self, base_path: str = "/tmp/three_pass_states"):
+    def __init__(self, base_path: str = "/tmp/three_pass_states", max_snapshots: int = DEFAULT_MAX_SNAPSHOTS,
+                 max_snapshot_bytes: int = DEFAULT_MAX_BYTES):
         self.base_path = Path(base_path)
         self.base_path.mkdir(exist_ok=True)
+        self.max_snapshots = max_snapshots
+        self.max_snapshot_bytes = max_snapshot_bytes
+        self.analytics = PhaseAnalytics(self.base_path / ANALYTICS_FILE)
+    
+    def _safe_name(self, starlog_path: str) -> str:
+        """Use starlog path as unique identifier"""
+        return starlog_path.replace("/", "_").replace("\\", "_")
     
     def _get_state_file(self, starlog_path: str) -> Path:
         """Get state file path for a starlog project"""
-        # Use starlog path as unique identifier
-        safe_name = starlog_path.replace("/", "_").replace("\\", "_")
-        return self.base_path / f"{safe_name}.json"
+        return self.base_path / f"{self._safe_name(starlog_path)}.json"
+    
+    def get_registry(self, starlog_path: str) -> ArtifactRegistry:
+        """Get the phase artifact registry for a starlog project"""
+        return ArtifactRegistry(self.base_path / f"{self._safe_name(starlog_path)}.artifacts.json")
+    
+    def journey_files(self, starlog_path: str) -> Dict[str, Path]:
+        """Map each per-journey file kind (state, artifacts, ...) to its path under base_path"""
+        return {
+            "state": self._get_state_file(starlog_path),
+            "artifacts": self.get_registry(starlog_path).registry_file,
+            "snapshots": self.get_snapshot_log(starlog_path).log_file,
+            "transitions": self._get_transitions_file(starlog_path),
+        }
+    
+    def _get_transitions_file(self, starlog_path: str) -> Path:
+        """Append-only log of a journey's phase transitions"""
+        return self.base_path / f"{self._safe_name(starlog_path)}.transitions.jsonl"
+    
+    def _record_transition(self, starlog_path: str, domain: str, component_name: Optional[str],
+                           from_notation: str, to_notation: str, at: datetime,
+                           dwell_seconds: Optional[float]) -> None:
+        """Append one timestamped transition to the journey's history"""
+        entry = {"at": at.isoformat(), "domain": domain, "component": component_name,
+                 "from": from_notation, "to": to_notation, "dwell_seconds": dwell_seconds}
+        with open(self._get_transitions_file(starlog_path), 'a') as f:
+            f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+    
+    def get_transitions(self, starlog_path: str) -> List[dict]:
+        """Read a journey's transition history, oldest first"""
+        try:
+            with open(self._get_transitions_file(starlog_path), 'r') as f:
+                return [json.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
+    
+    def get_snapshot_log(self, starlog_path: str) -> SnapshotLog:
+        """Get the bounded snapshot log for a starlog project"""
+        return SnapshotLog(self.base_path / f"{self._safe_name(starlog_path)}.snapshots.jsonl",
+                           self.max_snapshots, self.max_snapshot_bytes)
+
+    def record_phase_file(self, starlog_path: str, file_path: str) -> PhaseArtifact:
+        """Record a written phase file (path, size, hash, notation) in the project's registry"""
+        full_path = Path(file_path) if Path(file_path).is_absolute() else Path(starlog_path) / file_path
+        if _is_unedited_skeleton(full_path):
+            raise ValueError(f"Phase file is still an unedited skeleton: {file_path}")
+        return self.get_registry(starlog_path).record(starlog_path, file_path)
     
     def _load_state(self, starlog_path: str) -> Optional[ThreePassState]:
         """Load state from file"""
@@ -166,53 +287,179 @@ class ThreePassTracker:
         """Save state to file"""
         state_file = self._get_state_file(starlog_path)
         state.last_updated = datetime.now()
+        data = state.model_dump()
         
         with open(state_file, 'w') as f:
-            json.dump(state.model_dump(), f, default=str, indent=2)
+            json.dump(data, f, default=str, indent=2)
+        self.get_snapshot_log(starlog_path).append(state.last_updated.isoformat(), data)
+    
+    def _clear_history(self, starlog_path: str) -> None:
+        """Remove a journey's artifact registry, snapshots and transition history"""
+        self.get_registry(starlog_path).delete()
+        self.get_snapshot_log(starlog_path).delete()
+        transitions_file = self._get_transitions_file(starlog_path)
+        if transitions_file.exists():
+            transitions_file.unlink()
     
     def start_journey(self, domain: str, starlog_path: str) -> str:
         """Start a new 3-pass journey"""
         logger.info(f"Starting 3-pass journey for domain '{domain}' at path '{starlog_path}'")
-        state = ThreePassState(domain=domain)
+        # History left by a completed journey at this path must not leak into the new one
+        self._clear_history(starlog_path)
+        state = ThreePassState(domain=domain, phase_entered_at=datetime.now())
         self._save_state(starlog_path, state)
         logger.debug(f"Created initial state: {state.get_notation()}")
         return f"Started 3-pass journey for '{domain}' at {state.get_notation()}"
     
-    def get_current_state(self, starlog_path: str) -> str:
+    def get_current_state(self, starlog_path: str, component_name: Optional[str] = None) -> str:
         """Get current state in DSL notation"""
         state = self._load_state(starlog_path)
         if not state:
             return "No active 3-pass journey found. Use start_journey() first."
-        return state.get_notation()
+        position = state.get_position(component_name)
+        if position is None:
+            return f"No journey for component '{component_name}'. Use start_component() first."
+        return position.get_notation()
     
-    def next_phase(self, starlog_path: str) -> str:
-        """Advance to next phase"""
+    def next_phase(self, starlog_path: str, component_name: Optional[str] = None) -> str:
+        """Advance to next phase (of the global journey, or of a component's)"""
         state = self._load_state(starlog_path)
         if not state:
             logger.warning(f"Attempted to advance phase but no journey found for path: {starlog_path}")
             return "No active journey found. Use start_journey() first."
         
-        old_notation = state.get_notation()
+        position = state.get_position(component_name)
+        if position is None:
+            return f"No journey for component '{component_name}'. Use start_component() first."
+        
+        now = datetime.now()
+        old_notation = position.get_notation()
+        old_pass, old_phase, old_layer = position.pass_num, position.phase, position.layer
+        entered_at = position.phase_entered_at
+        position.advance()
+        position.phase_entered_at = now
+        if position.layer != old_layer:
+            logger.info(f"Advanced to next layer: {position.layer}")
+        elif position.pass_num != old_pass:
+            logger.info(f"Advanced to next pass: {position.pass_num}")
+        if component_name:
+            position.last_updated = now
+        
+        self._save_state(starlog_path, state)
+        
+        # Journeys started before transition tracking have no entry time for their first phase
+        dwell = (now - entered_at).total_seconds() if entered_at else None
+        self._record_transition(starlog_path, state.domain, component_name, old_notation,
+                                position.get_notation(), now, dwell)
+        if dwell is not None:
+            self.analytics.record(old_pass, old_phase, state.domain, dwell)
+        logger.debug(f"Phase transition: {old_notation} → {position.get_notation()}")
+        return f"Advanced to {position.get_notation()}"
+    
+    def seek(self, starlog_path: str, notation: str, component_name: Optional[str] = None) -> str:
+        """
+        Move a journey directly to a position given in DSL notation.
+        
+        Raises:
+            ValueError: if the notation is malformed or out of range
+        """
+        target = parse_notation(notation)
+        state = self._load_state(starlog_path)
+        if not state:
+            return "No active journey found. Use start_journey() first."
+        position = state.get_position(component_name)
+        if position is None:
+            return f"No journey for component '{component_name}'. Use start_component() first."
+        
+        old_notation = position.get_notation()
+        position.layer, position.pass_num, position.phase = target
+        position.subphases_done = 0
+        position.phase_entered_at = datetime.now()
+        if component_name:
+            position.last_updated = datetime.now()
+        self._save_state(starlog_path, state)
+        logger.info(f"Seek {starlog_path}{f' ({component_name})' if component_name else ''}: "
+                    f"{old_notation} → {position.get_notation()}")
+        return f"Moved from {old_notation} to {position.get_notation()}"
+    
+    def complete_subphase(self, starlog_path: str, code: Optional[str] = None,
+                          component_name: Optional[str] = None) -> str:
+        """
+        Mark a subphase of the current phase complete (the next pending one if code is None).
         
-        # Advance phase
-        if state.phase < 6:
-            state.phase += 1
+        Raises:
+            ValueError: if code is not a subphase of the current phase
+        """
+        state = self._load_state(starlog_path)
+        if not state:
+            return "No active journey found. Use start_journey() first."
+        position = state.get_position(component_name)
+        if position is None:
+            return f"No journey for component '{component_name}'. Use start_component() first."
+        
+        phase = get_workflow().phase(position.phase)
+        if code is None:
+            _, target = position.get_subphase_progress()
+            if target is None:
+                return f"All subphases of {position.get_phase_name()} complete. Use next_phase() to advance."
         else:
-            # End of workflow phases, advance pass
-            if state.pass_num < 3:
-                state.pass_num += 1
-                state.phase = 0
-                logger.info(f"Advanced to next pass: {state.pass_num}")
-            else:
-                # End of all passes, advance layer (recursive application)
-                state.layer += 1
-                state.pass_num = 1
-                state.phase = 0
-                logger.info(f"Advanced to next layer: {state.layer}")
+            target = next((sub for sub in phase.subphases if sub.code == code), None) if phase else None
+            if target is None:
+                raise ValueError(f"Subphase '{code}' is not part of phase {position.phase} ({position.get_phase_name()})")
+        
+        position.subphases_done |= 1 << target.bit
+        if component_name:
+            position.last_updated = datetime.now()
+        self._save_state(starlog_path, state)
+        return self._format_subphase_progress(position, f"Completed ({target.code})[{target.name}]")
+    
+    def next_subphase(self, starlog_path: str, component_name: Optional[str] = None) -> str:
+        """Complete the pending subphase of the current phase and report the one to work on next"""
+        return self.complete_subphase(starlog_path, None, component_name)
+    
+    def _format_subphase_progress(self, position: JourneyPosition, headline: str) -> str:
+        done, pending = position.get_subphase_progress()
+        phase = get_workflow().phase(position.phase)
+        total = len(phase.subphases) if phase else 0
+        following = (f"Next: ({pending.code})[{pending.name}]" if pending
+                     else "All subphases complete. Use next_phase() to advance.")
+        return f"{headline} at {position.get_notation()} ({len(done)}/{total}). {following}"
+    
+    def start_component(self, starlog_path: str, component_name: str) -> str:
+        """Start a component journey under the project's global journey"""
+        state = self._load_state(starlog_path)
+        if not state:
+            return "No active journey found. Use start_journey() first."
+        if not _valid_component_name(component_name):
+            return f"Invalid component name: {component_name!r}"
+        if component_name in state.components:
+            return f"Component '{component_name}' already at {state.components[component_name].get_notation()}"
         
+        state.components[component_name] = ComponentJourney(phase_entered_at=datetime.now())
         self._save_state(starlog_path, state)
-        logger.debug(f"Phase transition: {old_notation} → {state.get_notation()}")
-        return f"Advanced to {state.get_notation()}"
+        logger.info(f"Started component journey '{component_name}' for {starlog_path}")
+        return f"Started component journey '{component_name}' at {state.components[component_name].get_notation()}"
+    
+    def get_components_status(self, starlog_path: str) -> str:
+        """Report the global and every component position from one state and one registry read"""
+        state = self._load_state(starlog_path)
+        if not state:
+            return "No active 3-pass journey found."
+        
+        artifacts = self.get_registry(starlog_path).load()
+        counts: Dict[str, int] = {}
+        for artifact in artifacts.values():
+            counts[artifact.scope] = counts.get(artifact.scope, 0) + 1
+        
+        rows = [(GLOBAL_SCOPE, state)] + sorted(state.components.items())
+        width = max(len(name) for name, _ in rows)
+        lines = [f"Journey Components: {state.domain} ({len(state.components)} components)"]
+        for name, position in rows:
+            lines.append(
+                f"  {name:<{width}}  {position.get_notation():<14} {position.get_phase_name():<19} "
+                f"{counts.get(name, 0):>2}/63 artifacts"
+            )
+        return "\n".join(lines)
     
     def get_instructions(self, starlog_path: str) -> str:
         """Get instructions for current phase"""
@@ -260,10 +507,35 @@ Last Updated: {state.last_updated.strftime('%Y-%m-%d %H:%M')}
 
 Current Phase: {state.get_phase_name()}
 Current Pass: {state.get_pass_name()}
+{self._format_subphase_status(state)}
+
+{self._format_artifact_status(starlog_path, state)}
 
 Next: Use get_instructions() for detailed guidance
 """
     
+    def _format_subphase_status(self, position: JourneyPosition) -> str:
+        """One-line subphase checklist for the current phase"""
+        phase = get_workflow().phase(position.phase)
+        if not phase or not phase.subphases:
+            return "Subphases: none in this phase"
+        done, pending = position.get_subphase_progress()
+        marks = "".join("✓" if position.subphases_done >> sub.bit & 1 else "·" for sub in phase.subphases)
+        following = f" | next: ({pending.code})[{pending.name}]" if pending else ""
+        return f"Subphases: {len(done)}/{len(phase.subphases)} {marks}{following}"
+    
+    def _format_artifact_status(self, starlog_path: str, state: ThreePassState) -> str:
+        """Summarize recorded phase artifacts and component positions from a single registry read"""
+        artifacts = self.get_registry(starlog_path).load()
+        result = format_coverage(artifacts, GLOBAL_SCOPE)
+        started = state.components
+        components = sorted({a.scope for a in artifacts.values() if a.scope != GLOBAL_SCOPE} | set(started))
+        for component in components:
+            count = sum(1 for a in artifacts.values() if a.scope == component)
+            position = f"{started[component].get_notation()} | " if component in started else ""
+            result += f"\nComponent '{component}': {position}{count} artifacts recorded"
+        return result
+    
     def complete_journey(self, starlog_path: str) -> str:
         """Complete and clean up journey state"""
         state = self._load_state(starlog_path)
@@ -282,6 +554,83 @@ Next: Use get_instructions() for detailed guidance
         
         return f"Journey completed and cleaned up: '{domain}' (final position: {final_notation})"
     
+    def list_snapshots(self, starlog_path: str, limit: int = 20) -> str:
+        """List recent snapshots, newest first, numbered by how many steps back they are"""
+        snapshots = self.get_snapshot_log(starlog_path).load()
+        if not snapshots:
+            return "No snapshots found for this journey."
+        
+        lines = [f"Journey Snapshots: {len(snapshots)} retained (newest first)"]
+        for steps, snapshot in enumerate(reversed(snapshots[-limit:])):
+            state = ThreePassState(**snapshot.state)
+            components = f" | {len(state.components)} components" if state.components else ""
+            lines.append(f"  {steps:>3}  {state.get_notation():<14} {state.get_phase_name():<19} "
+                         f"{snapshot.at[:19]}{components}")
+        return "\n".join(lines)
+    
+    def rewind(self, starlog_path: str, steps: Optional[int] = None, notation: Optional[str] = None) -> str:
+        """
+        Restore an earlier journey state from its snapshot.
+        
+        Either go back a number of saved steps, or to the most recent snapshot
+        whose global position matches the notation. The restore is itself
+        snapshotted, so a rewind can be undone with rewind(steps=1). Works
+        after complete_journey() too, since snapshots outlive the state file.
+        
+        Raises:
+            ValueError: if both or neither of steps and notation are given, or the notation is invalid
+        """
+        if (steps is None) == (notation is None):
+            raise ValueError("Specify exactly one of steps or notation")
+        
+        snapshots = self.get_snapshot_log(starlog_path).load()
+        if not snapshots:
+            return "No snapshots found for this journey."
+        
+        if notation is not None:
+            target = parse_notation(notation)
+            snapshot = next((snap for snap in reversed(snapshots)
+                             if (snap.state.get("layer"), snap.state.get("pass_num"), snap.state.get("phase")) == target),
+                            None)
+            if snapshot is None:
+                return f"No retained snapshot at {format_notation(*target)}."
+        else:
+            # Without a state file the newest snapshot is the position that was completed
+            max_steps = len(snapshots) - 1 if self._get_state_file(starlog_path).exists() else len(snapshots)
+            if max_steps < 1:
+                return "No earlier snapshot to rewind to."
+            if not 1 <= steps <= max_steps:
+                return f"Can only rewind 1-{max_steps} steps."
+            snapshot = snapshots[max_steps - steps]
+        
+        current = self._load_state(starlog_path)
+        restored = ThreePassState(**snapshot.state)
+        restored.phase_entered_at = datetime.now()
+        self._save_state(starlog_path, restored)
+        old_notation = current.get_notation() if current else "completed"
+        logger.info(f"Rewound {starlog_path} from {old_notation} to {restored.get_notation()}")
+        return f"Rewound from {old_notation} to {restored.get_notation()} (snapshot {snapshot.at[:19]})"
+    
+    def get_phase_analytics(self, domain: Optional[str] = None, pass_num: Optional[int] = None,
+                            phase: Optional[int] = None) -> str:
+        """Dwell-time aggregates per pass and phase, for one domain or across all journeys"""
+        rows = self.analytics.query(domain, pass_num, phase)
+        scope = f"domain '{domain}'" if domain is not None else "all domains"
+        if not rows:
+            return f"No phase transitions recorded for {scope}."
+        
+        lines = [f"Phase Dwell Times ({scope})",
+                 f"  {'Phase':<27} {'count':>6} {'mean':>7} {'p50':>7} {'p95':>7} {'max':>7}"]
+        for row in rows:
+            stats = row.stats
+            label = f"P{row.pass_num} ({row.phase})[{PhasePrompts.PHASE_NAMES.get(row.phase, row.phase)}]"
+            lines.append(
+                f"  {label:<27} {stats.count:>6} {format_duration(stats.mean):>7} "
+                f"{format_duration(stats.percentile(50)):>7} {format_duration(stats.percentile(95)):>7} "
+                f"{format_duration(stats.max):>7}"
+            )
+        return "\n".join(lines)
+    
     def abandon_journey(self, starlog_path: str) -> str:
         """Abandon and clean up journey state"""
         state = self._load_state(starlog_path)
@@ -292,8 +641,9 @@ Next: Use get_instructions() for detailed guidance
         domain = state.domain
         last_notation = state.get_notation()
         
-        # Remove state file
+        # Remove state file, artifact registry, snapshots and transition history
         state_file = self._get_state_file(starlog_path)
+        self._clear_history(starlog_path)
         if state_file.exists():
             state_file.unlink()
             logger.info(f"Abandoned and cleaned up journey for domain '{domain}' at {last_notation}")
@@ -308,13 +658,60 @@ def start_journey(domain: str, starlog_path: str) -> str:
     """Start a new 3-pass journey"""
     return _default_tracker.start_journey(domain, starlog_path)
 
-def get_current_state(starlog_path: str) -> str:
+def get_current_state(starlog_path: str, component_name: Optional[str] = None) -> str:
     """Get current state in DSL notation"""
-    return _default_tracker.get_current_state(starlog_path)
+    return _default_tracker.get_current_state(starlog_path, component_name)
 
-def next_phase(starlog_path: str) -> str:
+def next_phase(starlog_path: str, component_name: Optional[str] = None) -> str:
     """Advance to next phase"""
-    return _default_tracker.next_phase(starlog_path)
+    return _default_tracker.next_phase(starlog_path, component_name)
+
+def seek_journey(starlog_path: str, notation: str, component_name: Optional[str] = None) -> str:
+    """
+    Move a journey directly to a position such as L1P2W[1](4) or L₁P₂W[1](4).
+    
+    Args:
+        starlog_path: STARLOG project path
+        notation: Target position in DSL notation
+        component_name: Move this component's journey instead of the global one
+        
+    Returns:
+        The old and new positions, or an error message
+    """
+    try:
+        return _default_tracker.seek(starlog_path, notation, component_name)
+    except ValueError as e:
+        return f"❌ {str(e)}"
+
+def complete_subphase(starlog_path: str, code: Optional[str] = None,
+                      component_name: Optional[str] = None) -> str:
+    """
+    Mark a subphase of the current phase complete.
+    
+    Args:
+        starlog_path: STARLOG project path
+        code: Subphase code such as "1c" (defaults to the next pending subphase)
+        component_name: Update this component's journey instead of the global one
+        
+    Returns:
+        Progress through the current phase's subphases, or an error message
+    """
+    try:
+        return _default_tracker.complete_subphase(starlog_path, code, component_name)
+    except ValueError as e:
+        return f"❌ {str(e)}"
+
+def next_subphase(starlog_path: str, component_name: Optional[str] = None) -> str:
+    """Complete the pending subphase and report the next one"""
+    return _default_tracker.next_subphase(starlog_path, component_name)
+
+def start_component(starlog_path: str, component_name: str) -> str:
+    """Start a component journey under the project's global journey"""
+    return _default_tracker.start_component(starlog_path, component_name)
+
+def get_components_status(starlog_path: str) -> str:
+    """Get the global and every component position in one report"""
+    return _default_tracker.get_components_status(starlog_path)
 
 def get_instructions(starlog_path: str) -> str:
     """Get instructions for current phase"""
@@ -332,6 +729,70 @@ def abandon_journey(starlog_path: str) -> str:
     """Abandon and clean up journey state"""
     return _default_tracker.abandon_journey(starlog_path)
 
+def get_phase_analytics(domain: Optional[str] = None, pass_num: Optional[int] = None,
+                        phase: Optional[int] = None) -> str:
+    """
+    Report dwell-time statistics (count, mean, p50, p95, max) per pass and phase.
+    
+    Args:
+        domain: Restrict to one domain (defaults to all journeys)
+        pass_num: Restrict to one pass (1-3)
+        phase: Restrict to one phase (0-6)
+        
+    Returns:
+        Table of aggregates maintained incrementally at each transition
+    """
+    return _default_tracker.get_phase_analytics(domain, pass_num, phase)
+
+def list_snapshots(starlog_path: str, limit: int = 20) -> str:
+    """List recent journey snapshots, newest first"""
+    return _default_tracker.list_snapshots(starlog_path, limit)
+
+def rewind_journey(starlog_path: str, steps: Optional[int] = None, notation: Optional[str] = None) -> str:
+    """
+    Restore an earlier journey position from a snapshot.
+    
+    Args:
+        starlog_path: STARLOG project path
+        steps: Number of saved steps to go back
+        notation: Go back to the latest snapshot at this position (e.g. L0P2W[0](3))
+        
+    Returns:
+        The old and restored positions, or an error message
+    """
+    try:
+        return _default_tracker.rewind(starlog_path, steps, notation)
+    except ValueError as e:
+        return f"❌ {str(e)}"
+
+def record_phase_file(starlog_path: str, file_path: Optional[str] = None,
+                      run_type: str = "global", component_name: str = None) -> str:
+    """
+    Record a written phase file in the project's artifact registry.
+    
+    Args:
+        starlog_path: STARLOG project path
+        file_path: Phase file to record (defaults to the current phase's file)
+        run_type: "global" or "local" (used when file_path is omitted)
+        component_name: Component name if local run
+        
+    Returns:
+        Confirmation with the recorded notation, size and hash
+    """
+    if file_path is None:
+        file_path = get_phase_file_path(starlog_path, run_type, component_name)
+        if not file_path.endswith(".md"):
+            return f"❌ {file_path}"
+    
+    try:
+        artifact = _default_tracker.record_phase_file(starlog_path, file_path)
+    except FileNotFoundError:
+        return f"❌ Phase file not found: {file_path}"
+    except ValueError as e:
+        return f"❌ {str(e)}"
+    
+    return f"📄 Recorded {artifact.notation} ({artifact.scope}): {artifact.path} ({artifact.size} bytes, sha256 {artifact.sha256[:12]})"
+
 def get_contextual_prompt(pass_num: int, phase: int, domain: str) -> str:
     """Get contextual prompt for specific pass, phase, and domain"""
     return PhasePrompts.get_phase_prompt(pass_num, phase, domain)
@@ -348,6 +809,11 @@ class MethodologyExplorer:
         self.repo_path = Path(repo_path)
         self.current_path = Path("")  # Relative to repo_path
         self._page_size = 10
+        # Rendered listing pages: (path, page, page_size) -> (dir signature, text)
+        self._page_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._page_cache_size = 256
+        # Sorted directory items: path -> (dir signature, items)
+        self._items_cache: Dict[str, tuple] = {}
         
     def explore(self, selection: Optional[int] = None, page: Optional[int] = None) -> str:
         """
@@ -373,6 +839,36 @@ class MethodologyExplorer:
         # Otherwise show current directory with pagination
         return self._show_directory(page)
     
+    @staticmethod
+    def _directory_signature(full_path: Path) -> Optional[tuple]:
+        """
+        Identify a directory's current contents with a single stat.
+        
+        Adding, removing or renaming entries changes the directory mtime, and
+        swapping in a new tree changes the inode, so either invalidates caches.
+        """
+        try:
+            st = os.stat(full_path)
+        except OSError:
+            return None
+        return (st.st_dev, st.st_ino, st.st_mtime_ns)
+    
+    def invalidate_cache(self) -> None:
+        """Drop all cached listings (e.g. after the tree was replaced)"""
+        self._page_cache.clear()
+        self._items_cache.clear()
+    
+    def _get_cached_items(self, full_path: Path, signature: Optional[tuple]) -> list:
+        """Get directory items, reusing the last listing while the directory is unchanged"""
+        key = str(full_path)
+        cached = self._items_cache.get(key)
+        if signature is not None and cached and cached[0] == signature:
+            return cached[1]
+        items = self._get_directory_items(full_path)
+        if signature is not None:
+            self._items_cache[key] = (signature, items)
+        return items
+    
     def _get_directory_items(self, full_path: Path) -> list:
         """Get sorted list of directory items (helper to reduce function size)"""
         items = []
@@ -459,13 +955,21 @@ class MethodologyExplorer:
         """Show paginated directory listing with numbers"""
         full_path = self.repo_path / self.current_path
         
+        # Serve a previously rendered page if the directory hasn't changed
+        signature = self._directory_signature(full_path)
+        cache_key = (str(self.current_path), page or 1, self._page_size)
+        cached = self._page_cache.get(cache_key)
+        if signature is not None and cached and cached[0] == signature:
+            self._page_cache.move_to_end(cache_key)
+            return cached[1]
+        
         # Validate path
         validation_error = self._validate_directory_path(full_path)
         if validation_error:
             return validation_error
         
         # Get directory items
-        items = self._get_directory_items(full_path)
+        items = self._get_cached_items(full_path, signature)
         
         if not items:
             return f"📂 {self.current_path or '/'}: Empty directory"
@@ -481,6 +985,11 @@ class MethodologyExplorer:
         result = self._format_directory_listing(page_items, start_idx, page, total_pages, len(items))
         result += self._build_navigation_help(page, total_pages)
         
+        if signature is not None:
+            self._page_cache[cache_key] = (signature, result)
+            if len(self._page_cache) > self._page_cache_size:
+                self._page_cache.popitem(last=False)
+        
         return result
     
     def _handle_go_up(self) -> str:
@@ -494,26 +1003,13 @@ class MethodologyExplorer:
     
     def _get_selected_item(self, selection: int, full_path: Path) -> Optional[Path]:
         """Get the selected item from directory (helper to reduce function size)"""
-        items = []
-        for item in full_path.iterdir():
-            if item.name.startswith('.'):
-                continue
-            items.append(item)
-        
-        # Sort with numbers first (0-9), then letters (a-z) - same as _get_directory_items
-        def sort_key(item):
-            name = item.name.lower()
-            if name[0].isdigit():
-                return (0, name)  # Numbers get priority 0
-            else:
-                return (1, name)  # Letters get priority 1
-        
-        items.sort(key=sort_key)
+        # Same ordering as the listing the selection number came from
+        items = self._get_cached_items(full_path, self._directory_signature(full_path))
         
         if selection < 1 or selection > len(items):
             return None
         
-        return items[selection - 1]
+        return full_path / items[selection - 1][0]
     
     def _handle_selection(self, selection: int) -> str:
         """Handle numbered selection - navigate or read"""
@@ -566,6 +1062,102 @@ class MethodologyExplorer:
         except Exception as e:
             logger.error(f"Error reading file {file_path}: {e}", exc_info=True)
             return f"❌ Error reading file: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
+    
+    def _resolve_relative(self, rel_path: str) -> Optional[Path]:
+        """Resolve a path relative to the repo root, refusing anything outside it"""
+        root = self.repo_path.resolve()
+        target = (root / rel_path.strip().lstrip("/")).resolve()
+        try:
+            target.relative_to(root)
+        except ValueError:
+            return None
+        return target
+    
+    @staticmethod
+    def _read_capped(file_path: Path, limit: Optional[int]) -> tuple:
+        """Read up to limit bytes, returning (text, size, truncated)"""
+        size = file_path.stat().st_size
+        with open(file_path, 'rb') as f:
+            data = f.read() if limit is None else f.read(limit)
+        truncated = limit is not None and size > limit
+        # Never split a multi-byte character at the cut point
+        return data.decode('utf-8', errors='ignore' if truncated else 'strict'), size, truncated
+    
+    def read_path(self, rel_path: str) -> str:
+        """
+        Read a file (or list a directory) directly by path relative to the repo root.
+        
+        Directories become the current explorer location, so numbered selection
+        continues from there.
+        """
+        if not self.repo_path.exists():
+            return "❌ 3-pass system not found. Use `update_3pass_system()` first."
+        
+        target = self._resolve_relative(rel_path)
+        if target is None:
+            return f"❌ Path is outside the 3-pass system: {rel_path}"
+        if not target.exists():
+            return f"❌ Path not found: {rel_path}"
+        
+        rel = target.relative_to(self.repo_path.resolve())
+        if target.is_dir():
+            self.current_path = Path("") if rel == Path(".") else rel
+            return self._show_directory(None)
+        return self._read_file(self.repo_path / rel)
+    
+    def read_paths(self, rel_paths: list, max_total_bytes: int = 200_000,
+                   max_file_bytes: Optional[int] = None) -> str:
+        """
+        Read several files in one call.
+        
+        Args:
+            rel_paths: File paths relative to the repo root
+            max_total_bytes: Cap on content bytes returned across all files
+            max_file_bytes: Optional cap per file
+            
+        Returns:
+            All file contents with per-file size and truncation flags
+        """
+        if not self.repo_path.exists():
+            return "❌ 3-pass system not found. Use `update_3pass_system()` first."
+        
+        remaining = max(max_total_bytes, 0)
+        sections = []
+        returned = 0
+        truncated_count = 0
+        
+        for rel_path in rel_paths:
+            target = self._resolve_relative(rel_path)
+            if target is None:
+                sections.append(f"❌ Path is outside the 3-pass system: {rel_path}")
+                continue
+            if not target.is_file():
+                sections.append(f"❌ File not found: {rel_path}")
+                continue
+            
+            limit = remaining if max_file_bytes is None else min(remaining, max_file_bytes)
+            try:
+                content, size, truncated = self._read_capped(target, limit)
+            except (OSError, UnicodeDecodeError) as e:
+                logger.error(f"Error reading file {target}: {e}", exc_info=True)
+                sections.append(f"❌ Error reading {rel_path}: {str(e)}")
+                continue
+            
+            shown = len(content.encode('utf-8'))
+            remaining -= shown
+            returned += shown
+            truncated_count += truncated
+            
+            section = f"📄 **File**: {rel_path}\n"
+            section += f"**Size**: {size} bytes | **Returned**: {shown} bytes | **Truncated**: {'yes' if truncated else 'no'}\n\n"
+            section += "---\n\n" + content + "\n\n---"
+            sections.append(section)
+        
+        result = f"📚 **Batch Read**: {len(rel_paths)} paths, {returned} bytes returned"
+        result += f" (cap {max_total_bytes} bytes"
+        result += f", {truncated_count} truncated)\n\n" if truncated_count else ")\n\n"
+        result += "\n\n".join(sections)
+        return result
 
 
 # Global explorer instance
@@ -585,6 +1177,35 @@ def explore_methodology(selection: Optional[int] = None, page: Optional[int] = N
     return _methodology_explorer.explore(selection, page)
 
 
+def read_methodology_file(path: str) -> str:
+    """
+    Read a methodology file (or list a directory) by path relative to its root.
+    
+    Args:
+        path: e.g. "system_design_instructions/31_DSL_Quick_Ref.md"
+        
+    Returns:
+        File content, directory listing, or error message
+    """
+    return _methodology_explorer.read_path(path)
+
+
+def read_methodology_files(paths: list, max_total_bytes: int = 200_000,
+                           max_file_bytes: Optional[int] = None) -> str:
+    """
+    Read several methodology files in one call.
+    
+    Args:
+        paths: File paths relative to the methodology root
+        max_total_bytes: Cap on content bytes returned across all files
+        max_file_bytes: Optional cap per file
+        
+    Returns:
+        File contents with per-file truncation flags
+    """
+    return _methodology_explorer.read_paths(paths, max_total_bytes, max_file_bytes)
+
+
 def inject_3pass_structure(target_dir: str, run_type: str = "global") -> str:
     """
     Create the proper 3-pass directory structure in target directory.
@@ -640,6 +1261,13 @@ def inject_3pass_structure(target_dir: str, run_type: str = "global") -> str:
         
         structure_created = f"component '{run_type}' with layer_0/1/2 each containing pass_1/2/3"
     
+    if run_type != "local":
+        tree = "global_system" if run_type == "global" else f"component_specific/{run_type}"
+        manifest = _load_scaffold_manifest(thinking_dir)
+        if tree not in manifest:
+            manifest.add(tree)
+            _save_scaffold_manifest(thinking_dir, manifest)
+    
     logger.info(f"Injected 3-pass structure into {target_dir}: {structure_created}")
     
     return f"""✅ **3-Pass Directory Structure Injected**
@@ -669,10 +1297,313 @@ def inject_3pass_structure(target_dir: str, run_type: str = "global") -> str:
 Ready for systematic thinking work!"""
 
 
+SCAFFOLD_MANIFEST = ".scaffold_manifest.json"
+
+
+def _valid_component_name(name: str) -> bool:
+    """Component names become directory names under component_specific/"""
+    return bool(name) and name not in ("global", "local", ".", "..") and "/" not in name and "\\" not in name
+
+
+def _load_scaffold_manifest(thinking_dir: Path) -> set:
+    """Read the set of completed scaffold trees (relative to 3_pass_thinking)"""
+    try:
+        with open(thinking_dir / SCAFFOLD_MANIFEST, 'r') as f:
+            return set(json.load(f).get("trees", []))
+    except (OSError, ValueError):
+        return set()
+
+
+def _save_scaffold_manifest(thinking_dir: Path, trees: set) -> None:
+    """Atomically write the scaffold manifest"""
+    tmp = thinking_dir / (SCAFFOLD_MANIFEST + ".tmp")
+    with open(tmp, 'w') as f:
+        json.dump({"version": 1, "trees": sorted(trees)}, f, indent=2)
+    os.replace(tmp, thinking_dir / SCAFFOLD_MANIFEST)
+
+
+def _scaffold_tree(tree_dir: Path) -> int:
+    """
+    Create tree_dir/layer_X/pass_Y, returning how many directories were created.
+    
+    A freshly created tree needs no existence checks below it, so the common
+    case is exactly one mkdir per directory.
+    """
+    try:
+        tree_dir.mkdir(parents=True)
+        fresh = True
+    except FileExistsError:
+        fresh = False
+    
+    created = 1 if fresh else 0
+    for layer in range(3):
+        layer_dir = tree_dir / f"layer_{layer}"
+        if fresh:
+            layer_dir.mkdir()
+            created += 1
+        else:
+            try:
+                layer_dir.mkdir()
+                created += 1
+            except FileExistsError:
+                pass
+        for pass_num in range(1, 4):
+            pass_dir = layer_dir / f"pass_{pass_num}"
+            if fresh:
+                pass_dir.mkdir()
+                created += 1
+            else:
+                try:
+                    pass_dir.mkdir()
+                    created += 1
+                except FileExistsError:
+                    pass
+    return created
+
+
+def inject_3pass_structures(target_dir: str, components: list, include_global: bool = True,
+                            verify: bool = False) -> str:
+    """
+    Create 3-pass directory structures for many components in one call.
+    
+    Trees recorded in 3_pass_thinking/.scaffold_manifest.json are skipped
+    without touching the filesystem, so repeating a call for an unchanged
+    project costs a manifest read.
+    
+    Args:
+        target_dir: Directory path where to create the structures
+        components: Component names to scaffold under component_specific/
+        include_global: Also scaffold global_system
+        verify: Re-check manifest entries on disk instead of trusting them
+        
+    Returns:
+        Compact summary of created and skipped trees
+    """
+    thinking_dir = Path(target_dir) / "3_pass_thinking"
+    
+    invalid = [name for name in components if not _valid_component_name(name)]
+    if invalid:
+        return f"❌ Invalid component names: {', '.join(repr(name) for name in invalid)}"
+    
+    trees = (["global_system"] if include_global else [])
+    trees += [f"component_specific/{name}" for name in dict.fromkeys(components)]
+    
+    manifest = _load_scaffold_manifest(thinking_dir)
+    if verify:
+        manifest = {tree for tree in manifest
+                    if all((thinking_dir / tree / f"layer_{layer}" / f"pass_{pass_num}").is_dir()
+                           for layer in range(3) for pass_num in range(1, 4))}
+    
+    pending = [tree for tree in trees if tree not in manifest]
+    if not pending:
+        return f"✅ **3-Pass Structures Up To Date**: {len(trees)} trees already complete in {target_dir}"
+    
+    created_dirs = 0
+    for tree in pending:
+        created_dirs += _scaffold_tree(thinking_dir / tree)
+        manifest.add(tree)
+    _save_scaffold_manifest(thinking_dir, manifest)
+    
+    logger.info(f"Scaffolded {len(pending)} 3-pass trees in {target_dir} ({created_dirs} directories)")
+    
+    shown = ", ".join(tree.split("/")[-1] for tree in pending[:20])
+    if len(pending) > 20:
+        shown += f", … (+{len(pending) - 20} more)"
+    return f"""✅ **3-Pass Structures Injected**
+
+**Target**: {target_dir}
+**Trees**: {len(pending)} scaffolded, {len(trees) - len(pending)} already complete
+**Directories Created**: {created_dirs}
+**Scaffolded**: {shown}
+
+Each tree contains layer_0/1/2 with pass_1/2/3."""
+
+
+SKELETON_MANIFEST = ".skeleton_manifest.json"
+
+
+def _phase_file_dir(starlog_path: str, run_type: str, component_name: Optional[str],
+                    layer: int, pass_num: int) -> Path:
+    """Directory holding the phase files of one layer/pass for the global system or a component"""
+    thinking_dir = Path(starlog_path) / "3_pass_thinking"
+    if run_type == "global":
+        tree_dir = thinking_dir / "global_system"
+    else:
+        tree_dir = thinking_dir / "component_specific" / component_name
+    return tree_dir / f"layer_{layer}" / f"pass_{pass_num}"
+
+
+def _load_skeleton_manifest(thinking_dir: Path, section: str = "files") -> Dict[str, str]:
+    """
+    Read generated skeleton hashes keyed by path relative to 3_pass_thinking.
+    
+    section "replacing" holds the hashes of skeletons that a generation run is
+    about to overwrite; they still count as unedited until the run finishes.
+    """
+    try:
+        with open(thinking_dir / SKELETON_MANIFEST, 'r') as f:
+            return dict(json.load(f).get(section, {}))
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_skeleton_manifest(thinking_dir: Path, files: Dict[str, str],
+                            replacing: Optional[Dict[str, str]] = None) -> None:
+    """Atomically write the skeleton manifest"""
+    data = {"version": 1, "files": dict(sorted(files.items()))}
+    if replacing:
+        data["replacing"] = dict(sorted(replacing.items()))
+    tmp = thinking_dir / (SKELETON_MANIFEST + ".tmp")
+    with open(tmp, 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp, thinking_dir / SKELETON_MANIFEST)
+
+
+def _is_unedited_skeleton(file_path: Path) -> bool:
+    """Check whether a phase file is byte-for-byte the skeleton generated for it"""
+    parts = file_path.parts
+    if "3_pass_thinking" not in parts:
+        return False
+    index = len(parts) - 1 - parts[::-1].index("3_pass_thinking")
+    thinking_dir = Path(*parts[:index + 1])
+    rel_path = "/".join(parts[index + 1:])
+    expected = {_load_skeleton_manifest(thinking_dir, section).get(rel_path) for section in ("files", "replacing")}
+    expected.discard(None)
+    if not expected:
+        return False
+    try:
+        return hashlib.sha256(file_path.read_bytes()).hexdigest() in expected
+    except OSError:
+        return False
+
+
+def _render_phase_skeleton(state: "ThreePassState", scope: str) -> str:
+    """Build the skeleton for one phase file: front-matter, definition and subphase headings"""
+    notation = state.get_notation()
+    lines = [
+        "---",
+        f"notation: {notation}",
+        f"domain: {state.domain}",
+        f"scope: {scope}",
+        f"layer: {state.layer}",
+        f"pass: {state.pass_num}",
+        f"phase: {state.phase}",
+        f"phase_name: {state.get_phase_name()}",
+        "---",
+        "",
+        f"# {notation} {state.get_phase_name()}: {state.domain}",
+        "",
+        f"`{PhasePrompts.get_phase_definition(state.phase)}`",
+        "",
+    ]
+    prompt = PhasePrompts.get_phase_prompt(state.pass_num, state.phase, state.domain)
+    lines += [f"> {line}" if line else ">" for line in prompt.splitlines()]
+    lines.append("")
+    
+    subphases = PhasePrompts.get_subphases(state.phase)
+    if subphases:
+        for code, name in subphases:
+            lines += [f"## {code} {name}", ""]
+    else:
+        lines += [f"## {state.phase} {state.get_phase_name()}", ""]
+    return "\n".join(lines)
+
+
+def generate_phase_skeletons(starlog_path: str, layer: Optional[int] = None, run_type: str = "global",
+                             component_name: str = None) -> str:
+    """
+    Write skeleton phase files for every pass and phase of a layer in one batch.
+    
+    Each skeleton holds front-matter with the notation, the phase's workflow
+    definition and one heading per subphase. Generated hashes are kept in
+    3_pass_thinking/.skeleton_manifest.json: files an agent has edited are
+    never overwritten, and unedited skeletons are not recorded as artifacts.
+    The manifest is saved before any file is written, so a watcher never sees
+    a skeleton that isn't marked as one.
+    
+    Args:
+        starlog_path: STARLOG project path
+        layer: Layer to generate (defaults to the journey's, or component journey's, current layer)
+        run_type: "global" or "local"
+        component_name: Component name if local run
+        
+    Returns:
+        Summary of written, unchanged and kept files
+    """
+    state = _default_tracker._load_state(starlog_path)
+    if not state:
+        return "❌ No active journey found. Use start_journey() first."
+    if run_type != "global" and not component_name:
+        return "❌ Component name required for local runs"
+    if run_type != "global" and not _valid_component_name(component_name):
+        return f"❌ Invalid component name: {component_name!r}"
+    if layer is None:
+        layer = (state.get_position(component_name if run_type != "global" else None) or state).layer
+    
+    scope = GLOBAL_SCOPE if run_type == "global" else component_name
+    thinking_dir = Path(starlog_path) / "3_pass_thinking"
+    thinking_dir.mkdir(parents=True, exist_ok=True)
+    manifest = _load_skeleton_manifest(thinking_dir)
+    replacing = _load_skeleton_manifest(thinking_dir, "replacing")  # Left behind by an interrupted run
+    
+    written, unchanged, kept = [], 0, []
+    pending: List[Tuple[Path, bytes]] = []
+    for pass_num in range(1, 4):
+        pass_dir = _phase_file_dir(starlog_path, run_type, component_name, layer, pass_num)
+        pass_dir.mkdir(parents=True, exist_ok=True)
+        for phase in range(7):
+            phase_state = ThreePassState(domain=state.domain, layer=layer, pass_num=pass_num, phase=phase)
+            content = _render_phase_skeleton(phase_state, scope).encode("utf-8")
+            digest = hashlib.sha256(content).hexdigest()
+            file_path = pass_dir / f"{phase}_{phase_state.get_phase_name()}.md"
+            rel_path = file_path.relative_to(thinking_dir).as_posix()
+            
+            try:
+                current = hashlib.sha256(file_path.read_bytes()).hexdigest()
+            except FileNotFoundError:
+                current = None
+            
+            if current == digest:
+                unchanged += 1
+                manifest[rel_path] = digest
+                continue
+            if current is not None and current not in (manifest.get(rel_path), replacing.get(rel_path)):
+                # Written (or edited) by the agent - leave it alone
+                kept.append(phase_state.get_notation())
+                continue
+            
+            if current is not None:
+                replacing[rel_path] = current
+            manifest[rel_path] = digest
+            pending.append((file_path, content))
+            written.append(phase_state.get_notation())
+    
+    # Mark every skeleton before writing any, then drop the replaced hashes
+    _save_skeleton_manifest(thinking_dir, manifest, replacing)
+    for file_path, content in pending:
+        tmp = file_path.with_name(f".{file_path.name}.tmp")
+        tmp.write_bytes(content)
+        os.replace(tmp, file_path)
+    if replacing:
+        _save_skeleton_manifest(thinking_dir, manifest)
+    logger.info(f"Generated phase skeletons for L{layer} ({scope}) in {starlog_path}: "
+                f"{len(written)} written, {unchanged} unchanged, {len(kept)} kept")
+    
+    result = f"""✅ **Phase Skeletons Generated**: Layer {layer} ({scope})
+
+**Written**: {len(written)} | **Unchanged**: {unchanged} | **Kept (edited)**: {len(kept)}"""
+    if kept:
+        result += f"\n**Edited files left alone**: {', '.join(kept)}"
+    return result
+
+
 def get_phase_file_path(starlog_path: str, run_type: str = "global", component_name: str = None) -> str:
     """
     Get the correct file path for current phase based on state and run type.
     
+    Local runs use the component's own journey position once it has been
+    started with start_component(), and the global position before that.
+    
     Args:
         starlog_path: STARLOG project path
         run_type: "global" or "local" 
@@ -685,14 +1616,12 @@ def get_phase_file_path(starlog_path: str, run_type: str = "global", component_n
     if not state:
         return "No active journey found"
     
-    base_path = Path(starlog_path)
-    
-    if run_type == "global":
-        file_dir = base_path / "3_pass_thinking" / "global_system" / f"layer_{state.layer}" / f"pass_{state.pass_num}"
-    else:
-        if not component_name:
-            return "Component name required for local runs"
-        file_dir = base_path / "3_pass_thinking" / "component_specific" / component_name / f"layer_{state.layer}" / f"pass_{state.pass_num}"
+    if run_type != "global" and not component_name:
+        return "Component name required for local runs"
+    if run_type != "global" and not _valid_component_name(component_name):
+        return f"Invalid component name: {component_name!r}"
+    position = state.get_position(component_name if run_type != "global" else None) or state
+    file_dir = _phase_file_dir(starlog_path, run_type, component_name, position.layer, position.pass_num)
     
-    filename = f"{state.phase}_{state.get_phase_name()}.md"
+    filename = f"{position.phase}_{position.get_phase_name()}.md"
     return str(file_dir / filename)
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""
+Filesystem helpers shared by the sync and archive code
+
+swap_in replaces a directory tree with a fully built staging tree in one
+step. On Linux it uses renameat2(RENAME_EXCHANGE), so readers of the target
+path see either the old tree or the new one, never neither.
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# renameat2(2) flag: atomically exchange two paths (Linux >= 3.15)
+_RENAME_EXCHANGE = 2
+_AT_FDCWD = -100
+
+
+def exchange_paths(a: Path, b: Path) -> bool:
+    """Atomically swap two directory entries; False if the platform can't"""
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        renameat2 = libc.renameat2
+    except (OSError, AttributeError):
+        return False
+    renameat2.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+    if renameat2(_AT_FDCWD, os.fsencode(str(a)), _AT_FDCWD, os.fsencode(str(b)), _RENAME_EXCHANGE) == 0:
+        return True
+    logger.debug(f"renameat2 exchange failed: {os.strerror(ctypes.get_errno())}")
+    return False
+
+
+def swap_in(staging: Path, target: Path) -> None:
+    """Put staging at target; the previous tree (if any) ends up at the staging path"""
+    if not target.exists():
+        os.rename(staging, target)
+        return
+    if exchange_paths(staging, target):
+        return
+    # Fallback: two renames with a very short window where target is absent
+    backup = staging.with_name(staging.name + ".old")
+    os.rename(target, backup)
+    os.rename(staging, target)
+    os.rename(backup, staging)
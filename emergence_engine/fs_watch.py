@@ -0,0 +1,412 @@
+"""
+Filesystem change detection for watched directory trees
+
+Uses Linux inotify (through ctypes) when available and falls back to mtime
+polling elsewhere. Either way, changes are reported per watched root as the
+set of added, changed and removed files relative to that root.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import select
+import struct
+import threading
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# inotify constants (linux/inotify.h)
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+_DIR_MASK = (IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE
+             | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+_PARENT_MASK = IN_CREATE | IN_MOVED_TO | IN_MOVED_FROM | IN_DELETE | IN_ONLYDIR
+_EVENT_HEADER = struct.Struct("iIII")
+
+# File signature used for change detection: (mtime_ns, size)
+FileStat = Tuple[int, int]
+
+
+class TreeChanges(NamedTuple):
+    """Files added, changed and removed under a watched root (relative POSIX paths)"""
+    added: FrozenSet[str]
+    changed: FrozenSet[str]
+    removed: FrozenSet[str]
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+
+def _matches(name: str, suffixes: Optional[Tuple[str, ...]]) -> bool:
+    """Check whether a file name is tracked"""
+    return not name.startswith(".") and (suffixes is None or name.endswith(suffixes))
+
+
+def stat_file(path: str) -> Optional[FileStat]:
+    """Stat a file, returning None if it is missing or not a regular file"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if not (st.st_mode & 0o170000 == 0o100000):
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def scan_tree(root: Path, suffixes: Optional[Tuple[str, ...]] = (".md",),
+              prefix: str = "") -> Dict[str, FileStat]:
+    """
+    Stat every tracked file under root (or under root/prefix).
+
+    Hidden files and directories are skipped. Keys are POSIX paths relative
+    to root.
+    """
+    result: Dict[str, FileStat] = {}
+    start = os.path.join(str(root), prefix) if prefix else str(root)
+    for dirpath, dirnames, filenames in os.walk(start):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        rel_dir = os.path.relpath(dirpath, str(root)).replace(os.sep, "/")
+        rel_dir = "" if rel_dir == "." else rel_dir + "/"
+        for name in filenames:
+            if not _matches(name, suffixes):
+                continue
+            stat = stat_file(os.path.join(dirpath, name))
+            if stat is not None:
+                result[rel_dir + name] = stat
+    return result
+
+
+def diff_snapshots(old: Dict[str, FileStat], new: Dict[str, FileStat]) -> TreeChanges:
+    """Compare two scans of the same tree"""
+    return TreeChanges(
+        added=frozenset(new.keys() - old.keys()),
+        changed=frozenset(p for p in new.keys() & old.keys() if new[p] != old[p]),
+        removed=frozenset(old.keys() - new.keys()),
+    )
+
+
+class _Inotify:
+    """Minimal ctypes binding for the inotify syscalls"""
+
+    _libc = None
+
+    @classmethod
+    def available(cls) -> bool:
+        """Check whether inotify can be used on this platform"""
+        if cls._libc is None:
+            try:
+                libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+                libc.inotify_init1  # noqa: B018 - raises AttributeError off Linux
+                libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+                libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+                cls._libc = libc
+            except (OSError, AttributeError):
+                cls._libc = False
+        return bool(cls._libc)
+
+    def __init__(self):
+        self.fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+    def add_watch(self, path: str, mask: int) -> int:
+        """Add a watch, returning the watch descriptor or -1 on failure"""
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            logger.debug(f"inotify_add_watch failed for {path}: {os.strerror(ctypes.get_errno())}")
+        return wd
+
+    def rm_watch(self, wd: int) -> None:
+        self._libc.inotify_rm_watch(self.fd, wd)
+
+    def read_events(self) -> List[Tuple[int, int, str]]:
+        """Drain pending events as (wd, mask, name) tuples"""
+        events = []
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except OSError as e:
+                if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    break
+                raise
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0").decode("utf-8", "surrogateescape")
+                offset += length
+                events.append((wd, mask, name))
+        return events
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class _WatchedRoot:
+    """Per-root bookkeeping: last known snapshot plus pending dirty paths"""
+
+    def __init__(self, root: Path, callback: Callable[[TreeChanges], None]):
+        self.root = root
+        self.callback = callback
+        self.snapshot: Dict[str, FileStat] = {}
+        self.dirty_files: Set[str] = set()
+        self.dirty_dirs: Set[str] = set()
+        self.full_rescan = False
+
+
+class FileWatcher:
+    """
+    Watch any number of directory trees from a single background thread.
+
+    Each root gets a callback that receives a TreeChanges whenever tracked
+    files under it are added, modified or removed. With inotify the watcher
+    only re-stats paths named in kernel events; with polling it re-stats the
+    trees every interval.
+    """
+
+    def __init__(self, interval: float = 1.0, suffixes: Optional[Iterable[str]] = (".md",),
+                 use_inotify: Optional[bool] = None):
+        self.interval = interval
+        self.suffixes = tuple(suffixes) if suffixes is not None else None
+        self._roots: Dict[str, _WatchedRoot] = {}
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._inotify: Optional[_Inotify] = None
+        # wd -> [(root key, relative dir or None for the root's parent watch)]
+        self._wds: Dict[int, List[Tuple[str, Optional[str]]]] = {}
+
+        if use_inotify is None:
+            use_inotify = _Inotify.available()
+        if use_inotify and _Inotify.available():
+            try:
+                self._inotify = _Inotify()
+            except OSError as e:
+                logger.warning(f"inotify unavailable, falling back to polling: {e}")
+
+    @property
+    def backend(self) -> str:
+        """'inotify' or 'polling'"""
+        return "inotify" if self._inotify else "polling"
+
+    def watch(self, root: str, callback: Callable[[TreeChanges], None],
+              snapshot: Optional[Dict[str, FileStat]] = None) -> None:
+        """
+        Start watching a root.
+
+        Args:
+            root: Directory to watch recursively
+            callback: Called with TreeChanges relative to root
+            snapshot: Known current state (defaults to a fresh scan)
+        """
+        root_path = Path(root).resolve()
+        key = str(root_path)
+        with self._lock:
+            watched = _WatchedRoot(root_path, callback)
+            watched.snapshot = dict(snapshot) if snapshot is not None else self._scan(root_path)
+            self._roots[key] = watched
+            if self._inotify:
+                self._add_tree_watches(key, "")
+                self._add_wd(self._inotify.add_watch(str(root_path.parent), _PARENT_MASK), key, None)
+
+    def unwatch(self, root: str) -> None:
+        """Stop watching a root"""
+        key = str(Path(root).resolve())
+        with self._lock:
+            self._roots.pop(key, None)
+            for wd in list(self._wds):
+                entries = [entry for entry in self._wds[wd] if entry[0] != key]
+                if entries:
+                    self._wds[wd] = entries
+                else:
+                    del self._wds[wd]
+                    if self._inotify:
+                        self._inotify.rm_watch(wd)
+
+    def _scan(self, root: Path, prefix: str = "") -> Dict[str, FileStat]:
+        if not root.is_dir():
+            return {}
+        return scan_tree(root, self.suffixes, prefix)
+
+    def _add_wd(self, wd: int, key: str, rel_dir: Optional[str]) -> None:
+        if wd < 0:
+            return
+        entries = self._wds.setdefault(wd, [])
+        if (key, rel_dir) not in entries:
+            entries.append((key, rel_dir))
+
+    def _add_tree_watches(self, key: str, rel_dir: str) -> None:
+        """Add a directory watch for rel_dir and every directory below it"""
+        root = self._roots[key].root
+        start = root / rel_dir if rel_dir else root
+        for dirpath, dirnames, _ in os.walk(str(start)):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            rel = os.path.relpath(dirpath, str(root)).replace(os.sep, "/")
+            self._add_wd(self._inotify.add_watch(dirpath, _DIR_MASK), key, "" if rel == "." else rel)
+
+    def _collect_inotify_events(self) -> None:
+        """Translate pending kernel events into dirty paths on each root"""
+        for wd, mask, name in self._inotify.read_events():
+            if mask & IN_Q_OVERFLOW:
+                for watched in self._roots.values():
+                    watched.full_rescan = True
+                continue
+            if mask & IN_IGNORED:
+                self._wds.pop(wd, None)
+                continue
+            for key, rel_dir in self._wds.get(wd, []):
+                watched = self._roots.get(key)
+                if watched is None:
+                    continue
+                if rel_dir is None:
+                    # Parent directory event: only care about the root itself being replaced
+                    if name == watched.root.name:
+                        watched.full_rescan = True
+                    continue
+                if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                    if rel_dir == "":
+                        watched.full_rescan = True
+                    continue
+                rel_path = f"{rel_dir}/{name}" if rel_dir else name
+                if mask & IN_ISDIR:
+                    if name.startswith("."):
+                        continue
+                    watched.dirty_dirs.add(rel_path)
+                    if mask & (IN_CREATE | IN_MOVED_TO):
+                        self._add_tree_watches(key, rel_path)
+                elif _matches(name, self.suffixes):
+                    watched.dirty_files.add(rel_path)
+
+    def _resolve_changes(self, watched: _WatchedRoot) -> TreeChanges:
+        """Re-stat dirty paths (or rescan) and update the root's snapshot"""
+        old = watched.snapshot
+        if watched.full_rescan:
+            new = self._scan(watched.root)
+            if self._inotify and watched.root.is_dir():
+                self._add_tree_watches(str(watched.root), "")
+            changes = diff_snapshots(old, new)
+            watched.snapshot = new
+        else:
+            touched: Dict[str, Optional[FileStat]] = {}
+            for rel_dir in watched.dirty_dirs:
+                prefix = rel_dir + "/"
+                for path in old:
+                    if path.startswith(prefix):
+                        touched[path] = None
+                if (watched.root / rel_dir).is_dir():
+                    touched.update(self._scan(watched.root, rel_dir))
+            for path in watched.dirty_files:
+                if path not in touched:
+                    touched[path] = stat_file(str(watched.root / path))
+
+            added, changed, removed = set(), set(), set()
+            new = dict(old)
+            for path, stat in touched.items():
+                if stat is None:
+                    if new.pop(path, None) is not None:
+                        removed.add(path)
+                elif path not in old:
+                    added.add(path)
+                    new[path] = stat
+                elif old[path] != stat:
+                    changed.add(path)
+                    new[path] = stat
+            changes = TreeChanges(frozenset(added), frozenset(changed), frozenset(removed))
+            watched.snapshot = new
+
+        watched.dirty_files.clear()
+        watched.dirty_dirs.clear()
+        watched.full_rescan = False
+        return changes
+
+    def check(self) -> Dict[str, TreeChanges]:
+        """
+        Detect changes since the last check and dispatch callbacks.
+
+        Returns:
+            Mapping of root path to its (non-empty) TreeChanges
+        """
+        results: Dict[str, TreeChanges] = {}
+        with self._lock:
+            if self._inotify:
+                self._collect_inotify_events()
+            else:
+                for watched in self._roots.values():
+                    watched.full_rescan = True
+
+            for key, watched in list(self._roots.items()):
+                if not (watched.full_rescan or watched.dirty_files or watched.dirty_dirs):
+                    continue
+                changes = self._resolve_changes(watched)
+                if changes:
+                    results[key] = changes
+
+        for key, changes in results.items():
+            watched = self._roots.get(key)
+            if watched is None:
+                continue
+            try:
+                watched.callback(changes)
+            except Exception as e:
+                logger.error(f"Watcher callback failed for {key}: {e}", exc_info=True)
+        return results
+
+    def _run(self) -> None:
+        """Background loop: block on inotify (or sleep) then check"""
+        while not self._stop.is_set():
+            if self._inotify:
+                try:
+                    readable, _, _ = select.select([self._inotify.fd], [], [], self.interval)
+                except (OSError, ValueError):
+                    break
+                if not readable:
+                    continue
+                # Let bursts of writes settle so one edit yields one update
+                self._stop.wait(0.05)
+            elif self._stop.wait(self.interval):
+                break
+            self.check()
+
+    def start(self) -> None:
+        """Start the background watcher thread (idempotent)"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="emergence-fs-watch", daemon=True)
+        self._thread.start()
+        logger.info(f"File watcher started ({self.backend}, {len(self._roots)} roots)")
+
+    def stop(self) -> None:
+        """Stop the background thread (watches stay registered)"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=max(self.interval, 0.1) * 2)
+            self._thread = None
+
+    def close(self) -> None:
+        """Stop watching entirely and release the inotify descriptor"""
+        self.stop()
+        with self._lock:
+            self._roots.clear()
+        if self._inotify:
+            self._inotify.close()
+            self._inotify = None
+            self._wds.clear()
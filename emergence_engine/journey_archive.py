@@ -0,0 +1,280 @@
+"""
+Journey archives - export and restore a journey as one compressed tarball
+
+An archive holds the journey's tracker files (state, artifact registry, ...)
+and its 3_pass_thinking tree. Both directions stream through tarfile's
+pipe modes, so file contents are copied in fixed-size chunks and memory use
+does not grow with the number or size of phase files.
+
+Layout:
+    journey/manifest.json            written first, read first on import
+    journey/tracker/<kind>.json      one entry per ThreePassTracker.journey_files() kind
+    journey/3_pass_thinking/...      the project's phase tree
+"""
+
+import io
+import json
+import logging
+import os
+import shutil
+import tarfile
+import time
+from datetime import datetime
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO, Dict, NamedTuple, Optional, Union
+
+from .core import ThreePassTracker, _default_tracker
+from .fs_util import swap_in
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_FORMAT = 1
+ARCHIVE_ROOT = "journey"
+MANIFEST_ENTRY = f"{ARCHIVE_ROOT}/manifest.json"
+THINKING_DIR = "3_pass_thinking"
+_CHUNK_SIZE = 1 << 20
+
+Archive = Union[str, Path, BinaryIO]
+
+
+class ArchiveSummary(NamedTuple):
+    """What an export wrote or an import restored"""
+    starlog_path: str
+    tracker_files: int
+    tree_files: int
+    tree_bytes: int
+
+
+def _open(archive: Archive, mode: str) -> tarfile.TarFile:
+    """Open a streaming gzip tarball on a path or binary file object"""
+    if hasattr(archive, "read") or hasattr(archive, "write"):
+        return tarfile.open(fileobj=archive, mode=mode, bufsize=_CHUNK_SIZE)
+    return tarfile.open(str(archive), mode=mode, bufsize=_CHUNK_SIZE)
+
+
+def _add_bytes(tar: tarfile.TarFile, name: str, data: bytes) -> None:
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mtime = int(time.time())
+    info.mode = 0o644
+    tar.addfile(info, io.BytesIO(data))
+
+
+def export_archive(starlog_path: str, archive: Archive,
+                   tracker: Optional[ThreePassTracker] = None) -> ArchiveSummary:
+    """
+    Stream a journey into a gzip tarball.
+
+    Args:
+        starlog_path: STARLOG project path of the journey
+        archive: Destination path or writable binary file object
+        tracker: Tracker holding the journey (defaults to the global tracker)
+
+    Raises:
+        FileNotFoundError: if the journey has no state file
+    """
+    tracker = tracker or _default_tracker
+    files = tracker.journey_files(starlog_path)
+    if not files["state"].exists():
+        raise FileNotFoundError(f"No journey state for {starlog_path}")
+
+    thinking_dir = Path(starlog_path) / THINKING_DIR
+    manifest = {
+        "format": ARCHIVE_FORMAT,
+        "starlog_path": starlog_path,
+        "exported_at": datetime.now().isoformat(),
+    }
+    tracker_files = tree_files = tree_bytes = 0
+
+    with _open(archive, "w|gz") as tar:
+        _add_bytes(tar, MANIFEST_ENTRY, json.dumps(manifest, indent=2).encode("utf-8"))
+
+        for kind, path in files.items():
+            if path.is_file():
+                tar.add(str(path), arcname=f"{ARCHIVE_ROOT}/tracker/{kind}.json", recursive=False)
+                tracker_files += 1
+
+        if thinking_dir.is_dir():
+            for dirpath, dirnames, filenames in os.walk(str(thinking_dir)):
+                dirnames.sort()
+                rel_dir = Path(dirpath).relative_to(thinking_dir).as_posix()
+                prefix = f"{ARCHIVE_ROOT}/{THINKING_DIR}" + ("" if rel_dir == "." else f"/{rel_dir}")
+                for name in sorted(filenames):
+                    full_path = os.path.join(dirpath, name)
+                    if not os.path.isfile(full_path) or os.path.islink(full_path):
+                        continue
+                    # tarfile copies the body in bufsize chunks
+                    tar.add(full_path, arcname=f"{prefix}/{name}", recursive=False)
+                    tree_files += 1
+                    tree_bytes += os.path.getsize(full_path)
+
+    logger.info(f"Exported journey {starlog_path}: {tracker_files} tracker files, "
+                f"{tree_files} phase tree files ({tree_bytes} bytes)")
+    return ArchiveSummary(starlog_path, tracker_files, tree_files, tree_bytes)
+
+
+def _safe_member_path(name: str) -> Optional[PurePosixPath]:
+    """Return the member path below ARCHIVE_ROOT, or None if it would escape"""
+    path = PurePosixPath(name)
+    if path.is_absolute() or ".." in path.parts or not path.parts or path.parts[0] != ARCHIVE_ROOT:
+        return None
+    return PurePosixPath(*path.parts[1:]) if len(path.parts) > 1 else None
+
+
+def _stream_to(source: BinaryIO, destination: Path) -> None:
+    """Copy a member body to destination via a temp file and atomic rename"""
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    tmp = destination.with_name(f".{destination.name}.import-{os.getpid()}")
+    try:
+        with open(tmp, "wb") as out:
+            shutil.copyfileobj(source, out, _CHUNK_SIZE)
+        os.replace(tmp, destination)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def import_archive(archive: Archive, starlog_path: Optional[str] = None, overwrite: bool = False,
+                   tracker: Optional[ThreePassTracker] = None) -> ArchiveSummary:
+    """
+    Restore a journey from a gzip tarball written by export_archive.
+
+    Everything is staged first: the phase tree into a sibling directory and
+    the tracker files next to their destinations. Nothing at the target
+    changes until the whole archive has been read, and then the tree is
+    swapped in as one directory, so an overwrite leaves no stale files behind.
+
+    Args:
+        archive: Source path or readable binary file object
+        starlog_path: Project to restore into (defaults to the exported project path)
+        overwrite: Replace an existing journey at the target
+        tracker: Tracker to restore into (defaults to the global tracker)
+
+    Raises:
+        ValueError: if the archive is not a journey archive or contains unsafe paths
+        FileExistsError: if a journey or phase tree already exists at the target and overwrite is False
+    """
+    tracker = tracker or _default_tracker
+    tracker_files = tree_files = tree_bytes = 0
+    staged: Dict[Path, Path] = {}
+    staging_tree: Optional[Path] = None
+
+    try:
+        with _open(archive, "r|gz") as tar:
+            members = iter(tar)
+            first = next(members, None)
+            if first is None or first.name != MANIFEST_ENTRY:
+                raise ValueError("Not a journey archive (manifest missing)")
+            manifest = json.load(tar.extractfile(first))
+            if manifest.get("format") != ARCHIVE_FORMAT:
+                raise ValueError(f"Unsupported journey archive format: {manifest.get('format')}")
+
+            starlog_path = starlog_path or manifest["starlog_path"]
+            files = tracker.journey_files(starlog_path)
+            if files["state"].exists() and not overwrite:
+                raise FileExistsError(f"Journey already exists for {starlog_path}")
+            thinking_dir = Path(starlog_path) / THINKING_DIR
+            if not overwrite and thinking_dir.is_dir() and any(thinking_dir.iterdir()):
+                raise FileExistsError(f"Phase tree already exists at {thinking_dir}")
+            staging_tree = thinking_dir.with_name(f".{THINKING_DIR}.import-{os.getpid()}")
+            if staging_tree.exists():
+                shutil.rmtree(staging_tree)
+            staging_tree.mkdir(parents=True)
+
+            for member in members:
+                rel = _safe_member_path(member.name)
+                if rel is None:
+                    raise ValueError(f"Unsafe path in archive: {member.name}")
+                if member.isdir():
+                    continue
+                if not member.isfile():
+                    raise ValueError(f"Unsupported archive member: {member.name}")
+
+                if rel.parts[0] == "tracker" and len(rel.parts) == 2:
+                    kind = rel.stem
+                    if kind not in files:
+                        logger.warning(f"Skipping unknown tracker file in archive: {member.name}")
+                        continue
+                    # Tracker files are staged and only swapped in once the whole archive is read
+                    tmp = files[kind].with_name(f".{files[kind].name}.import-{os.getpid()}")
+                    _stream_to(tar.extractfile(member), tmp)
+                    staged[tmp] = files[kind]
+                    tracker_files += 1
+                elif rel.parts[0] == THINKING_DIR and len(rel.parts) > 1:
+                    _stream_to(tar.extractfile(member), staging_tree.joinpath(*rel.parts[1:]))
+                    tree_files += 1
+                    tree_bytes += member.size
+                else:
+                    raise ValueError(f"Unexpected entry in journey archive: {member.name}")
+
+        # The previous tree (if any) ends up at the staging path and is removed below
+        swap_in(staging_tree, thinking_dir)
+        if overwrite:
+            for kind, path in files.items():
+                if path.exists() and path not in staged.values():
+                    path.unlink()
+        for tmp, destination in staged.items():
+            os.replace(tmp, destination)
+        staged.clear()
+    finally:
+        for tmp in staged:
+            if tmp.exists():
+                tmp.unlink()
+        if staging_tree is not None and staging_tree.exists():
+            shutil.rmtree(staging_tree, ignore_errors=True)
+
+    logger.info(f"Imported journey into {starlog_path}: {tracker_files} tracker files, {tree_files} phase tree files")
+    return ArchiveSummary(starlog_path, tracker_files, tree_files, tree_bytes)
+
+
+def export_journey(starlog_path: str, archive_path: Optional[str] = None) -> str:
+    """
+    Export a journey's state, artifact registry and 3_pass_thinking tree.
+
+    Args:
+        starlog_path: STARLOG project path
+        archive_path: Destination .tar.gz (defaults to <starlog_path>.3pass.tar.gz)
+
+    Returns:
+        Summary of what was archived
+    """
+    archive_path = archive_path or f"{str(starlog_path).rstrip('/')}.3pass.tar.gz"
+    try:
+        summary = export_archive(starlog_path, archive_path)
+    except FileNotFoundError:
+        return f"❌ No active journey found for {starlog_path}"
+
+    return f"""📦 **Journey Exported**: {archive_path}
+
+**Project**: {starlog_path}
+**Tracker Files**: {summary.tracker_files}
+**Phase Tree Files**: {summary.tree_files} ({summary.tree_bytes} bytes)
+**Archive Size**: {os.path.getsize(archive_path)} bytes"""
+
+
+def import_journey(archive_path: str, starlog_path: Optional[str] = None, overwrite: bool = False) -> str:
+    """
+    Restore a journey exported with export_journey.
+
+    Args:
+        archive_path: Source .tar.gz
+        starlog_path: Project to restore into (defaults to the exported project path)
+        overwrite: Replace an existing journey at the target
+
+    Returns:
+        Summary of what was restored
+    """
+    if not Path(archive_path).is_file():
+        return f"❌ Archive not found: {archive_path}"
+    try:
+        summary = import_archive(archive_path, starlog_path, overwrite)
+    except FileExistsError as e:
+        return f"❌ {str(e)}. Pass overwrite=True to replace it."
+    except (ValueError, tarfile.TarError) as e:
+        return f"❌ Invalid journey archive: {str(e)}"
+
+    return f"""📥 **Journey Imported**: {archive_path}
+
+**Project**: {summary.starlog_path}
+**Tracker Files**: {summary.tracker_files}
+**Phase Tree Files**: {summary.tree_files} ({summary.tree_bytes} bytes)"""
@@ -9,6 +9,7 @@ Uses the System Design DSL notation (L₀P₁W[0](3)) to track exact position in
 import logging
 import traceback
 from pathlib import Path
+from typing import List, Optional
 
 from fastmcp import FastMCP
 from pydantic import BaseModel, Field
@@ -19,14 +20,35 @@ try:
         start_journey,
         get_current_state, 
         next_phase,
+        seek_journey as seek_journey_position,
+        complete_subphase as complete_journey_subphase,
+        next_subphase as next_journey_subphase,
+        start_component,
+        get_components_status as get_components_overview,
         get_instructions,
         get_status as get_detailed_status,
         complete_journey,
         abandon_journey,
+        list_snapshots as list_journey_snapshots,
+        rewind_journey as rewind_journey_state,
+        get_phase_analytics as get_phase_dwell_analytics,
+        record_phase_file,
         get_contextual_prompt,
         explore_methodology,
+        read_methodology_file,
+        read_methodology_files,
         inject_3pass_structure,
+        inject_3pass_structures,
         get_phase_file_path,
+        generate_phase_skeletons,
+        related_docs as get_related_docs,
+        watch_methodology,
+        sync_methodology,
+        watch_phase_files,
+        unwatch_phase_files,
+        export_journey as export_journey_archive,
+        import_journey as import_journey_archive,
+        PhasePrompts,
         ThreePassTracker
     )
 except ImportError as e:
@@ -48,7 +70,7 @@ tracker = ThreePassTracker()
 
 def _get_3pass_base_path() -> Path:
     """Get the base path for the bundled 3-pass system files"""
-    package_dir = Path(__file__).parent / "emergence_engine"
+    package_dir = Path(__file__).parent
     return package_dir / "3_pass_autonomous_research_system_v01"
 
 
@@ -131,7 +153,8 @@ Ready to begin your systematic thinking journey!"""
 
 @mcp.tool
 def get_next_phase(
-    starlog_path: str = Field(description="STARLOG project path identifier")
+    starlog_path: str = Field(description="STARLOG project path identifier"),
+    component_name: str = Field(default="", description="Advance this component's journey instead of the global one")
 ) -> str:
     """
     Advance to next phase and get appropriate prompt for current pass + phase.
@@ -139,38 +162,43 @@ def get_next_phase(
     Returns contextual guidance like: "You're on Pass 2, Phase 3. Now focus on DSL for your generation system..."
     """
     try:
-        # Advance to next phase
-        advance_result = next_phase(starlog_path)
+        component = component_name or None
+        run_type = "local" if component else "global"
         
-        # Get current state
+        # Check the journey first, so nothing is recorded against the wrong position
         state = tracker._load_state(starlog_path)
         if not state:
             return "❌ No active journey found. Use `core_run()` or `expanded_run()` to start."
+        if state.get_position(component) is None:
+            return f"❌ No journey for component '{component}'. Use `start_component_journey()` first."
+        
+        # Register the phase file just finished, if it was written
+        finished_file = get_phase_file_path(starlog_path, run_type, component)
+        if Path(finished_file).is_file():
+            record_phase_file(starlog_path, finished_file)
+        
+        # Advance to next phase
+        advance_result = next_phase(starlog_path, component)
+        
+        # Get current state
+        state = tracker._load_state(starlog_path)
+        position = state.get_position(component)
         
         # Get contextual prompt
-        phase_prompt = get_contextual_prompt(state.pass_num, state.phase, state.domain)
+        phase_prompt = get_contextual_prompt(position.pass_num, position.phase, state.domain)
         
-        logger.info(f"Advanced to {state.get_notation()} for {starlog_path}")
+        logger.info(f"Advanced to {position.get_notation()} for {starlog_path}" + (f" ({component})" if component else ""))
         
         # Generate master prompt reminder
         pass_reminder = "\n⚠️ **REMINDER**: You must always apply the Emergence Engine's master prompt to the pass and phase you are on. Read it with get_master_prompt() if you haven't read it recently."
 
         # Get the exact phase definition from master prompt
-        phase_definitions = {
-            1: "(1)[SystemsDesign→(1a)[PurposeCapture]→(1b)[ContextMap]→(1c)[StakeholderGoals]→(1d)[SuccessMetrics]→(1e)[ConstraintScan]→(1f)[ResourceLimits]→(1g)[RegulatoryBounds]→(1h)[RiskAssumptions]→(1i)[ConceptModel]→(1j)[OntologySketch]→(1k)[BoundarySet]→(1l)[DesignBrief]]",
-            2: "(2)[SystemsArchitecture→(2a)[FunctionDecomposition]→(2b)[ModuleGrouping]→(2c)[InterfaceDefinition]→(2d)[LayerStack]→(2e)[ControlFlow]→(2f)[DataFlow]→(2g)[RedundancyPlan]→(2h)[ArchitectureSpec]]",
-            3: "(3)[DSL→(3a)[ConceptTokenize]→(3b)[SyntaxDefine]→(3c)[SemanticRules]→(3d)[OperatorSet]→(3e)[ValidationTests]→(3f)[DSLSpec]]",
-            4: "(4)[Topology→(4a)[NodeIdentify]→(4b)[EdgeMapping]→(4c)[FlowWeights]→(4d)[GraphBuild]→(4e)[Simulation]→(4f)[LoadBalance]→(4g)[TopologyMap]]",
-            5: "(5)[EngineeredSystem→(5a)[ResourceAllocate]→(5b)[PrototypeBuild]→(5c)[IntegrationTest]→(5d)[Deploy]→(5e)[Monitor]→(5f)[StressTest]→(5g)[OperationalSystem]]",
-            6: "(6)[FeedbackLoop→(6a)[TelemetryCapture]→(6b)[AnomalyDetection]→(6c)[DriftAnalysis]→(6d)[ConstraintRefit]→(6e)[DSLAdjust]→(6f)[ArchitecturePatch]→(6g)[TopologyRewire]→(6h)[Redeploy]→(6i)[GoalAlignmentCheck]]"
-        }
-        
-        phase_def = phase_definitions.get(state.phase, f"Phase {state.phase}")
+        phase_def = PhasePrompts.get_phase_definition(position.phase)
         
         # Get the proper file path
-        file_path = get_phase_file_path(starlog_path, "global")
+        file_path = get_phase_file_path(starlog_path, run_type, component)
         
-        return f"""{state.get_notation()}
+        return f"""{position.get_notation()}
 
 {phase_def}
 
@@ -182,6 +210,41 @@ Write file: {file_path}
         return f"❌ Error advancing phase: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
 
 
+@mcp.tool
+def next_subphase(
+    starlog_path: str = Field(description="STARLOG project path identifier"),
+    component_name: str = Field(default="", description="Update this component's journey instead of the global one")
+) -> str:
+    """
+    Mark the current subphase (e.g. (1c)[StakeholderGoals]) done and get the next one.
+    
+    Once every subphase of the phase is done, use `get_next_phase()` to move to the next phase.
+    """
+    try:
+        result = next_journey_subphase(starlog_path, component_name or None)
+        return result if result.startswith(("Completed", "All")) else f"❌ {result}"
+    except Exception as e:
+        logger.error(f"Error advancing subphase: {e}", exc_info=True)
+        return f"❌ Error advancing subphase: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
+
+
+@mcp.tool
+def complete_subphase(
+    starlog_path: str = Field(description="STARLOG project path identifier"),
+    subphase: str = Field(description="Subphase code in the current phase, e.g. '1c'"),
+    component_name: str = Field(default="", description="Update this component's journey instead of the global one")
+) -> str:
+    """
+    Mark a specific subphase of the current phase complete (subphases may be done in any order).
+    """
+    try:
+        result = complete_journey_subphase(starlog_path, subphase.strip("()") or None, component_name or None)
+        return result if result.startswith(("Completed", "All", "❌")) else f"❌ {result}"
+    except Exception as e:
+        logger.error(f"Error completing subphase: {e}", exc_info=True)
+        return f"❌ Error completing subphase: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
+
+
 @mcp.tool
 def get_status(
     starlog_path: str = Field(description="STARLOG project path identifier")
@@ -240,6 +303,112 @@ def get_status(
         return f"❌ Error getting status: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
 
 
+@mcp.tool
+def start_component_journey(
+    starlog_path: str = Field(description="STARLOG project path identifier"),
+    component_name: str = Field(description="Component to track under the project's global journey")
+) -> str:
+    """
+    Start a component journey with its own position, stored with the global journey.
+    
+    Advance it with `get_next_phase(starlog_path, component_name)`; its phase files go under
+    3_pass_thinking/component_specific/<component_name>/.
+    """
+    try:
+        result = start_component(starlog_path, component_name)
+        if not result.startswith("Started"):
+            return f"❌ {result}"
+        return f"✅ {result}"
+    except Exception as e:
+        logger.error(f"Error starting component journey: {e}", exc_info=True)
+        return f"❌ Error starting component journey: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
+
+
+@mcp.tool
+def get_components_status(
+    starlog_path: str = Field(description="STARLOG project path identifier")
+) -> str:
+    """
+    Show the global journey and every component journey's position and artifact count in one report.
+    """
+    try:
+        return get_components_overview(starlog_path)
+    except Exception as e:
+        logger.error(f"Error getting components status: {e}", exc_info=True)
+        return f"❌ Error getting components status: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
+
+
+@mcp.tool
+def get_phase_analytics(
+    domain: str = Field(default="", description="Restrict to one domain (empty for all journeys)"),
+    pass_num: int = Field(default=0, description="Restrict to one pass (1-3, 0 for all)"),
+    phase: int = Field(default=-1, description="Restrict to one phase (0-6, -1 for all)")
+) -> str:
+    """
+    Show how long journeys spend in each phase: count, mean, p50, p95 and max dwell time.
+    
+    Aggregates are updated at every phase transition, so this never scans journey histories.
+    """
+    try:
+        return get_phase_dwell_analytics(domain or None, pass_num or None, None if phase < 0 else phase)
+    except Exception as e:
+        logger.error(f"Error getting phase analytics: {e}", exc_info=True)
+        return f"❌ Error getting phase analytics: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
+
+
+@mcp.tool
+def record_phase_artifact(
+    starlog_path: str = Field(description="STARLOG project path identifier"),
+    file_path: str = Field(default="", description="Phase file to record (defaults to the current phase's file)"),
+    run_type: str = Field(default="global", description="'global' or 'local' (used when file_path is empty)"),
+    component_name: str = Field(default="", description="Component name if local run")
+) -> str:
+    """
+    Record a written phase file (path, size, content hash, notation) in the project's artifact registry.
+    
+    `get_status()` reports which of the 63 expected phase artifacts exist from this registry.
+    """
+    try:
+        return record_phase_file(starlog_path, file_path or None, run_type, component_name or None)
+    except Exception as e:
+        logger.error(f"Error recording phase artifact: {e}", exc_info=True)
+        return f"❌ Error recording phase artifact: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
+
+
+@mcp.tool
+def watch_phase_completion(
+    starlog_path: str = Field(description="STARLOG project path identifier"),
+    auto_advance: bool = Field(default=False, description="Advance the journey automatically when the current phase file is written"),
+    run_type: str = Field(default="global", description="'global' or 'local'"),
+    component_name: str = Field(default="", description="Component name if local run")
+) -> str:
+    """
+    Watch the project's 3_pass_thinking tree and record phase files as they are written.
+    
+    With auto_advance the journey moves on as soon as the current phase file appears,
+    so use `get_status()` instead of `get_next_phase()` to see the new position.
+    """
+    try:
+        return watch_phase_files(starlog_path, auto_advance, run_type, component_name or None)
+    except Exception as e:
+        logger.error(f"Error watching phase files: {e}", exc_info=True)
+        return f"❌ Error watching phase files: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
+
+
+@mcp.tool
+def unwatch_phase_completion(
+    starlog_path: str = Field(description="STARLOG project path identifier")
+) -> str:
+    """
+    Stop watching a project's phase files.
+    """
+    try:
+        return unwatch_phase_files(starlog_path)
+    except Exception as e:
+        logger.error(f"Error unwatching phase files: {e}", exc_info=True)
+        return f"❌ Error unwatching phase files: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
+
+
 @mcp.tool
 def reset_journey(
     starlog_path: str = Field(description="STARLOG project path identifier")
@@ -274,6 +443,70 @@ Ready to begin again! Use `get_next_phase()` to get your first prompt."""
         return f"❌ Error resetting journey: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
 
 
+@mcp.tool
+def seek_journey(
+    starlog_path: str = Field(description="STARLOG project path identifier"),
+    notation: str = Field(description="Target position, e.g. 'L1P2W[1](4)' or 'L₁P₂W[1](4)'"),
+    component_name: str = Field(default="", description="Move this component's journey instead of the global one")
+) -> str:
+    """
+    Jump directly to any position (e.g. after a crash, or to line up with existing artifacts).
+    
+    The target is validated and applied in a single state write.
+    """
+    try:
+        result = seek_journey_position(starlog_path, notation, component_name or None)
+        if not result.startswith("Moved"):
+            return result if result.startswith("❌") else f"❌ {result}"
+        
+        file_path = get_phase_file_path(starlog_path, "local" if component_name else "global", component_name or None)
+        return f"""🎯 **Journey Repositioned**
+
+**{result}**
+
+Write file: {file_path}"""
+    except Exception as e:
+        logger.error(f"Error seeking journey: {e}", exc_info=True)
+        return f"❌ Error seeking journey: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
+
+
+@mcp.tool
+def rewind_journey(
+    starlog_path: str = Field(description="STARLOG project path identifier"),
+    steps: int = Field(default=0, description="Number of saved steps to go back (use this or notation)"),
+    notation: str = Field(default="", description="Go back to the latest snapshot at this position, e.g. 'L0P2W[0](3)'")
+) -> str:
+    """
+    Roll a journey back to an earlier position after a bad phase.
+    
+    Restores the saved state directly from a snapshot (also after `complete_3pass_journey()`).
+    A rewind can itself be undone with `rewind_journey(steps=1)`.
+    """
+    try:
+        result = rewind_journey_state(starlog_path, steps or None, notation or None)
+        if not result.startswith("Rewound"):
+            return result if result.startswith("❌") else f"❌ {result}"
+        return f"⏪ **Journey Rewound**\n\n{result}\n\nUse `get_status()` to review the restored position."
+    except Exception as e:
+        logger.error(f"Error rewinding journey: {e}", exc_info=True)
+        return f"❌ Error rewinding journey: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
+
+
+@mcp.tool
+def list_snapshots(
+    starlog_path: str = Field(description="STARLOG project path identifier"),
+    limit: int = Field(default=20, description="Maximum number of snapshots to list")
+) -> str:
+    """
+    List the journey's retained snapshots, newest first, numbered by steps back.
+    """
+    try:
+        return list_journey_snapshots(starlog_path, limit)
+    except Exception as e:
+        logger.error(f"Error listing snapshots: {e}", exc_info=True)
+        return f"❌ Error listing snapshots: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
+
+
 @mcp.tool
 def complete_3pass_journey(
     starlog_path: str = Field(description="STARLOG project path identifier")
@@ -323,35 +556,58 @@ State cleaned up. Use `core_run()` or `expanded_run()` to start a new journey.""
 
 
 @mcp.tool
-def update_3pass_system() -> str:
+def export_journey(
+    starlog_path: str = Field(description="STARLOG project path identifier"),
+    archive_path: str = Field(default="", description="Destination .tar.gz (defaults to <starlog_path>.3pass.tar.gz)")
+) -> str:
     """
-    Pull the latest 3-pass system from the source repository.
+    Export a journey's state, artifact registry and 3_pass_thinking tree into one compressed archive.
     
-    Updates the local copy to get the freshest methodology and docs.
+    Files are streamed into the archive, so large projects export in constant memory.
     """
     try:
-        import subprocess
-        import shutil
-        
-        # Use bundled files from package
-        repo_path = _get_3pass_base_path()
-        
-        # Remove old copy if exists
-        if repo_path.exists():
-            shutil.rmtree(repo_path)
-        
-        # This would be a git clone in real usage - for now we assume it exists
-        # subprocess.run(["git", "clone", "repo_url", str(repo_path)], check=True)
-        
-        logger.info("Updated 3-pass system repository")
-        return f"""✅ **3-Pass System Updated**
+        return export_journey_archive(starlog_path, archive_path or None)
+    except Exception as e:
+        logger.error(f"Error exporting journey: {e}", exc_info=True)
+        return f"❌ Error exporting journey: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
+
 
-Repository location: {repo_path}
+@mcp.tool
+def import_journey(
+    archive_path: str = Field(description="Journey archive written by export_journey()"),
+    starlog_path: str = Field(default="", description="Project to restore into (defaults to the exported project path)"),
+    overwrite: bool = Field(default=False, description="Replace an existing journey at the target")
+) -> str:
+    """
+    Restore a journey (state, artifact registry and 3_pass_thinking tree) from an exported archive.
+    """
+    try:
+        return import_journey_archive(archive_path, starlog_path or None, overwrite)
+    except Exception as e:
+        logger.error(f"Error importing journey: {e}", exc_info=True)
+        return f"❌ Error importing journey: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
 
-Use `browse_3pass_system()` to explore the file structure.
-Use `read_3pass_file(filename)` to read specific files.
 
-Available now: Latest methodology, examples, and documentation."""
+@mcp.tool
+def update_3pass_system(
+    source: str = Field(default="", description="Local directory or git mirror to sync from (defaults to $EMERGENCE_ENGINE_3PASS_SOURCE)"),
+    subdir: str = Field(default="", description="Path of the methodology tree inside the source (auto-detected if empty)"),
+    ref: str = Field(default="HEAD", description="Git ref to sync from when source is a git mirror")
+) -> str:
+    """
+    Sync the 3-pass system from a local directory or git mirror.
+    
+    Only files whose content changed are copied; the updated tree is swapped in
+    atomically, so exploration keeps working during the update.
+    """
+    try:
+        result = sync_methodology(source or None, subdir or None, ref)
+        if result.startswith("❌"):
+            return result
+        logger.info("Updated 3-pass system repository")
+        return f"""{result}
+
+Use `explore_methodology_interface()` to explore the file structure."""
         
     except Exception as e:
         logger.error(f"Error updating 3-pass system: {e}", exc_info=True)
@@ -473,6 +729,68 @@ def explore_methodology_interface(
         return f"❌ Error exploring methodology: {str(e)}\\n\\nTraceback:\\n{traceback.format_exc()}"
 
 
+@mcp.tool
+def read_methodology_path(
+    path: str = Field(description="Path relative to the 3-pass system root (e.g. 'system_design_instructions/31_DSL_Quick_Ref.md')")
+) -> str:
+    """
+    Read a methodology file directly by path, without numbered navigation.
+    
+    Directories are listed and become the current location for
+    `explore_methodology_interface`.
+    
+    Returns:
+        File content, directory listing, or error message
+    """
+    try:
+        return read_methodology_file(path)
+    except Exception as e:
+        logger.error(f"Error reading methodology path: {e}", exc_info=True)
+        return f"❌ Error reading path: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
+
+
+@mcp.tool
+def read_methodology_paths(
+    paths: List[str] = Field(description="File paths relative to the 3-pass system root"),
+    max_total_bytes: int = Field(default=200000, description="Maximum content bytes returned across all files"),
+    max_file_bytes: Optional[int] = Field(default=None, description="Optional maximum content bytes per file")
+) -> str:
+    """
+    Read several methodology files in one call.
+    
+    Each file reports its size and whether it was truncated to fit the caps.
+    
+    Returns:
+        Contents of all requested files
+    """
+    try:
+        return read_methodology_files(paths, max_total_bytes, max_file_bytes)
+    except Exception as e:
+        logger.error(f"Error reading methodology paths: {e}", exc_info=True)
+        return f"❌ Error reading paths: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
+
+
+@mcp.tool
+def related_docs(
+    path: str = Field(description="Document path relative to the 3-pass system root (e.g. 'system_design_instructions/15_Reading_Guide.md')"),
+    k: int = Field(default=5, description="Maximum number of related documents to return")
+) -> str:
+    """
+    List documents linked to, linked from, or sharing references with a methodology document.
+    
+    Answers from the precomputed link graph, so no directory browsing is needed
+    to find adjacent material (reading guides, timelines, diagrams).
+    
+    Returns:
+        Ranked list of related document paths with the relation that connects them
+    """
+    try:
+        return get_related_docs(path, k)
+    except Exception as e:
+        logger.error(f"Error finding related docs: {e}", exc_info=True)
+        return f"❌ Error finding related docs: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
+
+
 @mcp.tool
 def inject_directory_structure(
     target_dir: str = Field(description="Directory path where to create the 3-pass structure"),
@@ -492,6 +810,47 @@ def inject_directory_structure(
         return f"❌ Error injecting structure: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
 
 
+@mcp.tool
+def inject_directory_structures(
+    target_dir: str = Field(description="Directory path where to create the 3-pass structures"),
+    components: List[str] = Field(default_factory=list, description="Component names to scaffold under component_specific/"),
+    include_global: bool = Field(default=True, description="Also scaffold global_system"),
+    verify: bool = Field(default=False, description="Re-check previously scaffolded trees on disk")
+) -> str:
+    """
+    Inject 3-pass directory structures for many components in one call.
+    
+    Already complete trees are skipped using a manifest, so repeated calls are cheap.
+    """
+    try:
+        result = inject_3pass_structures(target_dir, components, include_global, verify)
+        logger.info(f"Injected 3-pass structures: {target_dir} ({len(components)} components)")
+        return result
+    except Exception as e:
+        logger.error(f"Error injecting structures: {e}", exc_info=True)
+        return f"❌ Error injecting structures: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
+
+
+@mcp.tool
+def generate_phase_file_skeletons(
+    starlog_path: str = Field(description="STARLOG project path identifier"),
+    layer: int = Field(default=-1, description="Layer to generate (-1 for the journey's current layer)"),
+    run_type: str = Field(default="global", description="'global' or 'local'"),
+    component_name: str = Field(default="", description="Component name if local run")
+) -> str:
+    """
+    Write skeletons for all 21 phase files of a layer (3 passes × 7 phases) in one call.
+    
+    Each skeleton has front-matter with its notation and a heading per subphase
+    (e.g. `1a PurposeCapture` … `1l DesignBrief`). Files you have already edited are never overwritten.
+    """
+    try:
+        return generate_phase_skeletons(starlog_path, None if layer < 0 else layer, run_type, component_name or None)
+    except Exception as e:
+        logger.error(f"Error generating phase skeletons: {e}", exc_info=True)
+        return f"❌ Error generating phase skeletons: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
+
+
 @mcp.tool
 def get_master_prompt() -> str:
     """
@@ -525,6 +884,8 @@ Expected location: <package>/emergence_engine/3_pass_autonomous_research_system_
 
 def main():
     """Main entry point for the MCP server"""
+    # Keep methodology indexes current when docs are edited in place
+    watch_methodology()
     mcp.run()
 
 
@@ -0,0 +1,340 @@
+"""
+Link and reference graph over the bundled 3-pass methodology documents
+"""
+
+import logging
+import re
+import threading
+from pathlib import Path, PurePosixPath
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Set, Tuple
+
+from .fs_watch import FileStat, FileWatcher, TreeChanges, diff_snapshots, scan_tree, stat_file
+from .methodology_sync import on_methodology_synced
+
+logger = logging.getLogger(__name__)
+
+# Markdown links: [text](target) - target may carry an #anchor
+_MARKDOWN_LINK = re.compile(r"\]\(([^)\s]+)\)")
+# Bare file mentions: "see 05_Common_Pitfalls.md", "diagrams/00_complete_system_topology.md"
+_FILE_MENTION = re.compile(r"(?<![\w/.-])((?:[\w-]+/)*[\w-]+\.md)\b")
+
+# Absolute links into this repository (e.g. GitHub blob URLs) are resolved as local docs
+_TREE_MARKER = "3_pass_autonomous_research_system_v01/"
+
+# Relation weights used to rank related documents
+_LINK_WEIGHT = 2.0
+_SHARED_NEIGHBOUR_WEIGHT = 1.0
+_MAX_RELATED = 20  # Precomputed per document; larger k is ranked on demand
+
+
+def _default_repo_path() -> Path:
+    """Bundled methodology directory shipped with the package"""
+    return Path(__file__).parent / _TREE_MARKER.rstrip("/")
+
+
+def _extract_references(text: str) -> FrozenSet[str]:
+    """Extract raw (unresolved) document references from markdown text"""
+    refs = set()
+    for target in _MARKDOWN_LINK.findall(text):
+        if "://" in target or target.startswith("mailto:"):
+            if _TREE_MARKER not in target:
+                continue
+            target = target.split(_TREE_MARKER, 1)[1]
+        target = target.split("#", 1)[0]
+        if target.endswith(".md"):
+            refs.add(target)
+    refs.update(_FILE_MENTION.findall(text))
+    return frozenset(refs)
+
+
+class LinkGraph:
+    """
+    Immutable snapshot of the document link graph.
+
+    Built once per index and never mutated afterwards, so readers can hold a
+    reference while a newer snapshot is being built.
+    """
+
+    def __init__(self, references: Dict[str, FrozenSet[str]]):
+        self.documents: Tuple[str, ...] = tuple(sorted(references))
+        self.outgoing: Dict[str, Set[str]] = {doc: set() for doc in self.documents}
+        self.incoming: Dict[str, Set[str]] = {doc: set() for doc in self.documents}
+        self._related: Dict[str, List[Tuple[str, float, str]]] = {}  # Top _MAX_RELATED per document
+
+        by_name: Dict[str, List[str]] = {}
+        for doc in self.documents:
+            by_name.setdefault(PurePosixPath(doc).name, []).append(doc)
+
+        for doc, refs in references.items():
+            for ref in refs:
+                target = self._resolve(doc, ref, by_name)
+                if target and target != doc:
+                    self.outgoing[doc].add(target)
+                    self.incoming[target].add(doc)
+
+        for doc in self.documents:
+            self._related[doc] = self._rank_related(doc)
+
+    def related(self, doc: str, k: int = 5) -> Optional[List[Tuple[str, float, str]]]:
+        """Up to k related documents as (path, score, reason), or None if doc is not in the graph"""
+        related = self._related.get(doc)
+        if related is None:
+            return None
+        if k > len(related) == _MAX_RELATED:
+            # The precomputed list may be truncated; rank everything for this query
+            related = self._rank_related(doc, limit=None)
+        return related[:max(k, 0)]
+
+    def _resolve(self, source: str, ref: str, by_name: Dict[str, List[str]]) -> Optional[str]:
+        """Resolve a raw reference to a document path, or None if ambiguous/unknown"""
+        source_dir = PurePosixPath(source).parent
+        for base in (source_dir, PurePosixPath("")):
+            candidate = _normalize(base / ref)
+            if candidate in self.outgoing:
+                return candidate
+
+        # Fall back to matching by file name / path suffix anywhere in the tree
+        matches = [
+            doc for doc in by_name.get(PurePosixPath(ref).name, [])
+            if doc == ref or doc.endswith("/" + ref.lstrip("./"))
+        ]
+        if len(matches) == 1:
+            return matches[0]
+        same_dir = [doc for doc in matches if PurePosixPath(doc).parent == source_dir]
+        if len(same_dir) == 1:
+            return same_dir[0]
+        return None
+
+    def _rank_related(self, doc: str, limit: Optional[int] = _MAX_RELATED) -> List[Tuple[str, float, str]]:
+        """Score neighbours by direct links plus shared neighbours (co-citation)"""
+        neighbours = self.outgoing[doc] | self.incoming[doc]
+        scores: Dict[str, float] = {}
+        shared: Dict[str, int] = {}
+
+        for other in neighbours:
+            scores[other] = scores.get(other, 0.0)
+            if other in self.outgoing[doc]:
+                scores[other] += _LINK_WEIGHT
+            if other in self.incoming[doc]:
+                scores[other] += _LINK_WEIGHT
+            for second in self.outgoing[other] | self.incoming[other]:
+                if second != doc:
+                    shared[second] = shared.get(second, 0) + 1
+
+        for other, count in shared.items():
+            scores[other] = scores.get(other, 0.0) + count * _SHARED_NEIGHBOUR_WEIGHT
+
+        ranked = []
+        for other, score in scores.items():
+            reasons = []
+            if other in self.outgoing[doc]:
+                reasons.append("links to")
+            if other in self.incoming[doc]:
+                reasons.append("linked from")
+            if shared.get(other):
+                reasons.append(f"{shared[other]} shared")
+            ranked.append((other, score, ", ".join(reasons)))
+
+        ranked.sort(key=lambda entry: (-entry[1], entry[0]))
+        return ranked[:limit]
+
+
+def _normalize(path: PurePosixPath) -> str:
+    """Collapse '.' and '..' segments without touching the filesystem"""
+    parts: List[str] = []
+    for part in path.parts:
+        if part == ".":
+            continue
+        if part == "..":
+            if parts:
+                parts.pop()
+            continue
+        parts.append(part)
+    return "/".join(parts)
+
+
+class _IndexState(NamedTuple):
+    """Everything a reader needs, swapped in as one object"""
+    references: Dict[str, FrozenSet[str]]
+    stats: Dict[str, FileStat]
+    graph: LinkGraph
+
+
+class MethodologyIndex:
+    """
+    In-memory index of the methodology markdown with precomputed related documents.
+
+    The index can be kept current incrementally: only added, changed or removed
+    documents are re-read, and the new state replaces the old one in a single
+    assignment so concurrent readers never see a half-built index.
+    """
+
+    def __init__(self, repo_path: Optional[str] = None):
+        self.repo_path = Path(repo_path) if repo_path else _default_repo_path()
+        self._state: Optional[_IndexState] = None
+        self._write_lock = threading.RLock()
+        self._watcher: Optional[FileWatcher] = None
+
+    def _read_references(self, rel_path: str) -> Optional[FrozenSet[str]]:
+        """Read one document and extract its raw references"""
+        file_path = self.repo_path / rel_path
+        try:
+            text = file_path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning(f"Skipping unreadable document {file_path}: {e}")
+            return None
+        return _extract_references(text)
+
+    def build(self) -> LinkGraph:
+        """Build the whole index from disk and make it the active snapshot"""
+        with self._write_lock:
+            stats = scan_tree(self.repo_path) if self.repo_path.is_dir() else {}
+            references = {}
+            for rel_path in list(stats):
+                refs = self._read_references(rel_path)
+                if refs is None:
+                    del stats[rel_path]
+                else:
+                    references[rel_path] = refs
+
+            graph = LinkGraph(references)
+            self._state = _IndexState(references, stats, graph)
+
+        edges = sum(len(targets) for targets in graph.outgoing.values())
+        logger.info(f"Indexed {len(graph.documents)} methodology documents ({edges} links)")
+        return graph
+
+    def apply_changes(self, changes: TreeChanges) -> LinkGraph:
+        """Re-index only the documents named in changes and swap the result in"""
+        with self._write_lock:
+            state = self._state
+            if state is None:
+                return self.build()
+
+            references = dict(state.references)
+            stats = dict(state.stats)
+            for rel_path in changes.removed:
+                references.pop(rel_path, None)
+                stats.pop(rel_path, None)
+            for rel_path in changes.added | changes.changed:
+                stat = stat_file(str(self.repo_path / rel_path))
+                refs = self._read_references(rel_path) if stat else None
+                if refs is None:
+                    references.pop(rel_path, None)
+                    stats.pop(rel_path, None)
+                    continue
+                references[rel_path] = refs
+                stats[rel_path] = stat
+
+            graph = LinkGraph(references)
+            self._state = _IndexState(references, stats, graph)
+
+        logger.info(
+            f"Re-indexed methodology: {len(changes.added)} added, "
+            f"{len(changes.changed)} changed, {len(changes.removed)} removed"
+        )
+        return graph
+
+    def refresh(self) -> TreeChanges:
+        """Stat the tree once and re-index whatever changed since the last update"""
+        state = self._state
+        if state is None:
+            self.build()
+            return TreeChanges(frozenset(), frozenset(), frozenset())
+
+        current = scan_tree(self.repo_path) if self.repo_path.is_dir() else {}
+        changes = diff_snapshots(state.stats, current)
+        if changes:
+            self.apply_changes(changes)
+        return changes
+
+    def watch(self, watcher: Optional[FileWatcher] = None, interval: float = 1.0) -> FileWatcher:
+        """
+        Keep the index current in the background.
+
+        Args:
+            watcher: Shared FileWatcher to register with (a private one is started otherwise)
+            interval: Polling interval when inotify is unavailable
+
+        Returns:
+            The watcher the index is registered with
+        """
+        if self._state is None:
+            self.build()
+        if watcher is None:
+            watcher = FileWatcher(interval=interval)
+        watcher.watch(str(self.repo_path), self.apply_changes, snapshot=self._state.stats)
+        watcher.start()
+        self._watcher = watcher
+        return watcher
+
+    def unwatch(self) -> None:
+        """Stop background re-indexing"""
+        if self._watcher:
+            self._watcher.unwatch(str(self.repo_path))
+            self._watcher = None
+
+    @property
+    def graph(self) -> LinkGraph:
+        """Active link graph, built on first access"""
+        state = self._state
+        if state is None:
+            return self.build()
+        return state.graph
+
+    def related(self, path: str, k: int = 5) -> Optional[List[Tuple[str, float, str]]]:
+        """Return up to k related documents as (path, score, reason), or None if unknown"""
+        return self.graph.related(_normalize(PurePosixPath(path.strip().lstrip("/"))), k)
+
+
+# Global index instance
+_methodology_index = MethodologyIndex()
+
+
+def _refresh_after_sync(result) -> None:
+    """Pick up a synced tree immediately, even when no watcher is running"""
+    if _methodology_index._state is not None:
+        _methodology_index.refresh()
+
+
+on_methodology_synced(_refresh_after_sync)
+
+
+def related_docs(path: str, k: int = 5) -> str:
+    """
+    List the documents most closely related to a methodology document.
+
+    Args:
+        path: Document path relative to the methodology root
+        k: Maximum number of related documents to return
+
+    Returns:
+        Ranked list of related documents with the relation that connects them
+    """
+    if not _methodology_index.repo_path.exists():
+        return "❌ 3-pass system not found. Use `update_3pass_system()` first."
+
+    related = _methodology_index.related(path, k)
+    if related is None:
+        return f"❌ Document not found in index: {path}"
+
+    if not related:
+        return f"🔗 **Related Documents**: {path}\n\nNo linked documents found."
+
+    result = f"🔗 **Related Documents**: {path}\n\n"
+    for i, (doc, score, reason) in enumerate(related, 1):
+        result += f"{i}. 📄 {doc} ({reason}; score {score:g})\n"
+    return result
+
+
+def watch_methodology(interval: float = 1.0) -> FileWatcher:
+    """
+    Re-index the methodology incrementally whenever its files change.
+
+    Args:
+        interval: Polling interval in seconds when inotify is unavailable
+
+    Returns:
+        The running watcher
+    """
+    return _methodology_index.watch(interval=interval)
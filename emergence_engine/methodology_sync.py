@@ -0,0 +1,335 @@
+"""
+Sync the bundled 3-pass methodology tree from a local source
+
+The source can be a plain directory or a local git mirror (bare or not).
+Files are compared by git blob hash, only changed files are copied into a
+staging directory (unchanged files are hard-linked), and the staging tree is
+swapped in with a single rename so readers never see a partial update.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, NamedTuple, Optional, Tuple
+
+from .fs_util import swap_in
+from .fs_watch import stat_file
+
+logger = logging.getLogger(__name__)
+
+TREE_NAME = "3_pass_autonomous_research_system_v01"
+MANIFEST_NAME = ".sync_manifest.json"
+SOURCE_ENV_VAR = "EMERGENCE_ENGINE_3PASS_SOURCE"
+
+_sync_lock = threading.Lock()
+
+
+class SyncResult(NamedTuple):
+    """Outcome of a methodology sync"""
+    added: FrozenSet[str]
+    changed: FrozenSet[str]
+    removed: FrozenSet[str]
+    unchanged: int
+    swapped: bool
+    elapsed_ms: float
+
+
+def _default_target() -> Path:
+    """Bundled methodology directory shipped with the package"""
+    return Path(__file__).parent / TREE_NAME
+
+
+def blob_hash(data: bytes) -> str:
+    """Content hash compatible with `git hash-object` so git sources need no reads"""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def _is_tracked(rel_path: str) -> bool:
+    """Skip hidden files/directories and bytecode caches"""
+    return not any(part.startswith(".") or part == "__pycache__" for part in rel_path.split("/"))
+
+
+def _load_manifest(tree: Path) -> Dict[str, Dict]:
+    """Read the hash manifest stored alongside a synced tree"""
+    try:
+        with open(tree / MANIFEST_NAME, "r") as f:
+            return json.load(f).get("files", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def _current_hashes(tree: Path, known_entries: Dict[str, Dict]) -> Tuple[Dict[str, str], Dict[str, Dict]]:
+    """
+    Hash every file in a tree, trusting known entries when size and mtime are
+    unchanged so a no-op sync only stats files.
+    """
+    hashes: Dict[str, str] = {}
+    entries: Dict[str, Dict] = {}
+    if not tree.is_dir():
+        return hashes, entries
+
+    for dirpath, dirnames, filenames in os.walk(str(tree)):
+        dirnames[:] = [d for d in dirnames if _is_tracked(d)]
+        rel_dir = os.path.relpath(dirpath, str(tree)).replace(os.sep, "/")
+        for name in filenames:
+            rel_path = name if rel_dir == "." else f"{rel_dir}/{name}"
+            if not _is_tracked(rel_path):
+                continue
+            stat = stat_file(os.path.join(dirpath, name))
+            if stat is None:
+                continue
+            known = known_entries.get(rel_path)
+            if known and known.get("mtime_ns") == stat[0] and known.get("size") == stat[1]:
+                digest = known["hash"]
+            else:
+                with open(os.path.join(dirpath, name), "rb") as f:
+                    digest = blob_hash(f.read())
+            hashes[rel_path] = digest
+            entries[rel_path] = {"hash": digest, "mtime_ns": stat[0], "size": stat[1]}
+    return hashes, entries
+
+
+class DirectorySource:
+    """
+    Methodology source backed by a plain directory.
+
+    known holds the (path -> hash, mtime, size) entries of an earlier scan of
+    this directory; files whose size and mtime still match aren't re-read.
+    It is updated in place after each scan.
+    """
+
+    def __init__(self, root: Path, known: Optional[Dict[str, Dict]] = None):
+        self.root = root
+        self._known: Dict[str, Dict] = known if known is not None else {}
+
+    def describe(self) -> str:
+        return f"directory {self.root}"
+
+    def hashes(self) -> Dict[str, str]:
+        hashes, entries = _current_hashes(self.root, self._known or _load_manifest(self.root))
+        self._known.clear()
+        self._known.update(entries)
+        return hashes
+
+    def read(self, rel_path: str) -> bytes:
+        with open(self.root / rel_path, "rb") as f:
+            return f.read()
+
+
+class GitSource:
+    """Methodology source backed by a local git mirror (hashes come from the tree object)"""
+
+    def __init__(self, repo: Path, subdir: str, ref: str = "HEAD"):
+        self.repo = repo
+        self.subdir = subdir.strip("/")
+        self.ref = ref
+
+    def describe(self) -> str:
+        location = f":{self.subdir}" if self.subdir else ""
+        return f"git mirror {self.repo} ({self.ref}{location})"
+
+    def _git(self, *args: str) -> bytes:
+        return subprocess.run(
+            ["git", "-C", str(self.repo), *args],
+            check=True, capture_output=True
+        ).stdout
+
+    def hashes(self) -> Dict[str, str]:
+        args = ["ls-tree", "-r", "-z", self.ref]
+        if self.subdir:
+            args += ["--", self.subdir + "/"]
+        prefix = self.subdir + "/" if self.subdir else ""
+        self._blobs: Dict[str, str] = {}
+        for entry in self._git(*args).split(b"\0"):
+            if not entry:
+                continue
+            meta, path = entry.decode("utf-8", "surrogateescape").split("\t", 1)
+            _mode, obj_type, sha = meta.split()
+            if obj_type != "blob":
+                continue
+            rel_path = path[len(prefix):]
+            if _is_tracked(rel_path):
+                self._blobs[rel_path] = sha
+        return dict(self._blobs)
+
+    def read(self, rel_path: str) -> bytes:
+        return self._git("cat-file", "blob", self._blobs[rel_path])
+
+
+def open_source(source: str, subdir: Optional[str] = None, ref: str = "HEAD"):
+    """
+    Resolve a source path to a DirectorySource or GitSource.
+
+    When subdir is not given, the methodology tree is located automatically:
+    either the source is the tree itself, or it contains the tree at
+    `emergence_engine/3_pass_autonomous_research_system_v01` or at `3_pass_autonomous_research_system_v01`.
+    """
+    root = Path(source).expanduser()
+    if not root.exists():
+        raise FileNotFoundError(f"Sync source not found: {source}")
+
+    candidates = [f"emergence_engine/{TREE_NAME}", TREE_NAME, ""]
+    is_git = (root / ".git").exists() or ((root / "HEAD").is_file() and (root / "objects").is_dir())
+
+    if is_git:
+        if subdir is not None:
+            return GitSource(root, subdir, ref)
+        source_git = GitSource(root, "", ref)
+        paths = source_git._git("ls-tree", "-r", "--name-only", ref).decode("utf-8", "surrogateescape").splitlines()
+        for candidate in candidates[:-1]:
+            if any(path.startswith(candidate + "/") for path in paths):
+                return GitSource(root, candidate, ref)
+        return source_git
+
+    if subdir is not None:
+        return _directory_source(root / subdir)
+    for candidate in candidates:
+        tree = root / candidate if candidate else root
+        if tree.is_dir() and (not candidate or any(tree.iterdir())):
+            return _directory_source(tree)
+    return _directory_source(root)
+
+
+# Resolved source directory -> entries from its previous scan, so repeated syncs only stat files
+_directory_entries: Dict[str, Dict[str, Dict]] = {}
+
+
+def _directory_source(root: Path) -> DirectorySource:
+    return DirectorySource(root, _directory_entries.setdefault(str(root.resolve()), {}))
+
+
+def _place(src: Path, dest: Path) -> None:
+    """Hard-link an unchanged file into the staging tree, copying if linking fails"""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copy2(src, dest)
+
+
+class MethodologySync:
+    """Diff-based, atomically swapped sync of the methodology tree"""
+
+    def __init__(self, target: Optional[str] = None):
+        self.target = Path(target) if target else _default_target()
+
+    def sync(self, source) -> SyncResult:
+        """
+        Bring the target tree in line with source.
+
+        Args:
+            source: DirectorySource or GitSource (see open_source)
+
+        Returns:
+            SyncResult describing what changed
+        """
+        started = time.perf_counter()
+        with _sync_lock:
+            wanted = source.hashes()
+            current, entries = _current_hashes(self.target, _load_manifest(self.target))
+
+            added = frozenset(wanted.keys() - current.keys())
+            removed = frozenset(current.keys() - wanted.keys())
+            changed = frozenset(p for p in wanted.keys() & current.keys() if wanted[p] != current[p])
+            unchanged = len(wanted) - len(added) - len(changed)
+
+            if not (added or changed or removed):
+                if entries != _load_manifest(self.target):
+                    self._write_manifest(self.target, entries)
+                return SyncResult(added, changed, removed, unchanged, False,
+                                  (time.perf_counter() - started) * 1000)
+
+            staging = self.target.with_name(f".{self.target.name}.staging-{os.getpid()}")
+            if staging.exists():
+                shutil.rmtree(staging)
+            staging.mkdir(parents=True)
+            try:
+                manifest: Dict[str, Dict] = {}
+                for rel_path, digest in wanted.items():
+                    dest = staging / rel_path
+                    if rel_path in added or rel_path in changed:
+                        dest.parent.mkdir(parents=True, exist_ok=True)
+                        data = source.read(rel_path)
+                        with open(dest, "wb") as f:
+                            f.write(data)
+                    else:
+                        _place(self.target / rel_path, dest)
+                    stat = stat_file(str(dest))
+                    manifest[rel_path] = {"hash": digest, "mtime_ns": stat[0], "size": stat[1]}
+                self._write_manifest(staging, manifest)
+                swap_in(staging, self.target)
+            finally:
+                if staging.exists():
+                    shutil.rmtree(staging, ignore_errors=True)
+
+        elapsed = (time.perf_counter() - started) * 1000
+        logger.info(
+            f"Synced methodology from {source.describe()}: {len(added)} added, "
+            f"{len(changed)} changed, {len(removed)} removed in {elapsed:.1f}ms"
+        )
+        return SyncResult(added, changed, removed, unchanged, True, elapsed)
+
+    @staticmethod
+    def _write_manifest(tree: Path, files: Dict[str, Dict]) -> None:
+        tmp = tree / (MANIFEST_NAME + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump({"files": files}, f, indent=2, sort_keys=True)
+        os.replace(tmp, tree / MANIFEST_NAME)
+
+
+# Called after a sync that swapped in a new tree (e.g. to refresh indexes)
+_after_sync_hooks = []
+
+
+def on_methodology_synced(hook: Callable[[SyncResult], None]) -> None:
+    """Register a callback run after every sync that changed the tree"""
+    _after_sync_hooks.append(hook)
+
+
+def sync_methodology(source: Optional[str] = None, subdir: Optional[str] = None, ref: str = "HEAD") -> str:
+    """
+    Update the bundled 3-pass methodology from a local directory or git mirror.
+
+    Args:
+        source: Directory or git mirror path (defaults to $EMERGENCE_ENGINE_3PASS_SOURCE)
+        subdir: Path of the methodology tree inside the source (auto-detected if omitted)
+        ref: Git ref to sync from when source is a git mirror
+
+    Returns:
+        Summary of added, changed and removed files
+    """
+    source = source or os.environ.get(SOURCE_ENV_VAR)
+    if not source:
+        return (f"❌ No sync source configured. Pass `source` or set {SOURCE_ENV_VAR} "
+                "to a local directory or git mirror.")
+
+    syncer = MethodologySync()
+    origin = open_source(source, subdir, ref)
+    result = syncer.sync(origin)
+
+    if result.swapped:
+        for hook in _after_sync_hooks:
+            try:
+                hook(result)
+            except Exception as e:
+                logger.error(f"Post-sync hook failed: {e}", exc_info=True)
+
+    summary = f"""✅ **3-Pass System Updated**
+
+**Source**: {origin.describe()}
+**Location**: {syncer.target}
+**Added**: {len(result.added)} | **Changed**: {len(result.changed)} | **Removed**: {len(result.removed)} | **Unchanged**: {result.unchanged}
+**Time**: {result.elapsed_ms:.1f}ms"""
+    if not result.swapped:
+        summary += "\n\nAlready up to date."
+    else:
+        touched = sorted(result.added | result.changed)[:20]
+        if touched:
+            summary += "\n\n**Updated files**:\n" + "\n".join(f"• {path}" for path in touched)
+    return summary
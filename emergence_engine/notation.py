@@ -0,0 +1,59 @@
+"""
+System Design DSL position notation: L{layer}P{pass}W[{layer}]({phase})
+
+Parsing accepts plain or subscript digits (L₀P₁W[0](3)); formatting emits
+plain digits unless asked for subscripts.
+"""
+
+import re
+from typing import NamedTuple
+
+MAX_PASS = 3
+MAX_PHASE = 6
+
+_SUBSCRIPT_DIGITS = "₀₁₂₃₄₅₆₇₈₉"
+_FROM_SUBSCRIPT = str.maketrans(_SUBSCRIPT_DIGITS, "0123456789")
+_TO_SUBSCRIPT = str.maketrans("0123456789", _SUBSCRIPT_DIGITS)
+
+_NOTATION = re.compile(
+    r"^L(?P<layer>\d+)\s*P(?P<pass_num>\d+)\s*W\s*\[(?P<workflow>\d+)\]\s*\((?P<phase>\d+)\)$"
+)
+
+
+class Notation(NamedTuple):
+    """A parsed journey position"""
+    layer: int
+    pass_num: int
+    phase: int
+
+    def __str__(self) -> str:
+        return format_notation(self.layer, self.pass_num, self.phase)
+
+
+def format_notation(layer: int, pass_num: int, phase: int, subscript: bool = False) -> str:
+    """Format a position, e.g. L1P2W[1](4) or (subscript=True) L₁P₂W[1](4)"""
+    if subscript:
+        return f"L{str(layer).translate(_TO_SUBSCRIPT)}P{str(pass_num).translate(_TO_SUBSCRIPT)}W[{layer}]({phase})"
+    return f"L{layer}P{pass_num}W[{layer}]({phase})"
+
+
+def parse_notation(text: str) -> Notation:
+    """
+    Parse and validate a position in DSL notation.
+
+    Raises:
+        ValueError: if the text is malformed or names a position outside the workflow
+    """
+    normalized = text.strip().translate(_FROM_SUBSCRIPT)
+    match = _NOTATION.match(normalized)
+    if not match:
+        raise ValueError(f"Invalid notation '{text}': expected L{{layer}}P{{pass}}W[{{layer}}]({{phase}}), e.g. L1P2W[1](4)")
+
+    layer, pass_num, phase = int(match.group("layer")), int(match.group("pass_num")), int(match.group("phase"))
+    if int(match.group("workflow")) != layer:
+        raise ValueError(f"Invalid notation '{text}': workflow index W[{match.group('workflow')}] must match layer {layer}")
+    if not 1 <= pass_num <= MAX_PASS:
+        raise ValueError(f"Invalid notation '{text}': pass must be 1-{MAX_PASS}")
+    if not 0 <= phase <= MAX_PHASE:
+        raise ValueError(f"Invalid notation '{text}': phase must be 0-{MAX_PHASE}")
+    return Notation(layer, pass_num, phase)
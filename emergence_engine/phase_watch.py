@@ -0,0 +1,189 @@
+"""
+Phase file watcher - detects completed phase files in STARLOG projects
+
+Registered projects have their 3_pass_thinking tree watched by one shared
+FileWatcher (inotify, or polling as a fallback). When the file for a
+journey's current phase is written, the watcher records it in the artifact
+registry and can advance the journey without waiting for get_next_phase().
+"""
+
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+from .artifacts import GLOBAL_SCOPE, parse_phase_path
+from .core import ThreePassTracker, _default_tracker
+from .fs_watch import FileWatcher, TreeChanges
+
+logger = logging.getLogger(__name__)
+
+THINKING_DIR = "3_pass_thinking"
+
+
+class _Registration(NamedTuple):
+    """A watched STARLOG project"""
+    starlog_path: str
+    scope: str
+    auto_advance: bool
+
+
+class PhaseWatcher:
+    """
+    Watch the 3_pass_thinking trees of many STARLOG projects from one thread.
+
+    Every phase file written under a registered tree is recorded in the
+    project's artifact registry. When the file matches the journey's current
+    position (for the registered scope) and auto_advance is set, the journey
+    is advanced, repeatedly if the following phase files were written in the
+    same batch.
+    """
+
+    def __init__(self, tracker: Optional[ThreePassTracker] = None,
+                 watcher: Optional[FileWatcher] = None, interval: float = 1.0):
+        self.tracker = tracker or _default_tracker
+        self._watcher = watcher
+        self._interval = interval
+        self._registrations: Dict[str, _Registration] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def watcher(self) -> FileWatcher:
+        """The shared FileWatcher, started on first use"""
+        with self._lock:
+            if self._watcher is None:
+                self._watcher = FileWatcher(interval=self._interval)
+            self._watcher.start()
+            return self._watcher
+
+    def _root(self, starlog_path: str) -> str:
+        return str((Path(starlog_path) / THINKING_DIR).resolve())
+
+    def register(self, starlog_path: str, auto_advance: bool = False,
+                 component_name: Optional[str] = None) -> str:
+        """
+        Start watching a project's 3_pass_thinking tree.
+
+        The tree does not need to exist yet; it is picked up once created.
+
+        Args:
+            starlog_path: STARLOG project path (same identifier as the tracker uses)
+            auto_advance: Advance the journey when the current phase file appears
+            component_name: Component whose files drive the journey (global if None)
+
+        Returns:
+            The watched root
+        """
+        root = self._root(starlog_path)
+        registration = _Registration(starlog_path, component_name or GLOBAL_SCOPE, auto_advance)
+        with self._lock:
+            self._registrations[root] = registration
+        self.watcher.watch(root, lambda changes: self._on_changes(root, changes))
+        logger.info(f"Watching phase files under {root} (auto_advance={auto_advance})")
+        return root
+
+    def unregister(self, starlog_path: str) -> bool:
+        """Stop watching a project. Returns False if it was not registered."""
+        root = self._root(starlog_path)
+        with self._lock:
+            if self._registrations.pop(root, None) is None:
+                return False
+        if self._watcher is not None:
+            self._watcher.unwatch(root)
+        return True
+
+    def registrations(self) -> List[str]:
+        """STARLOG paths currently being watched"""
+        with self._lock:
+            return sorted(r.starlog_path for r in self._registrations.values())
+
+    def _on_changes(self, root: str, changes: TreeChanges) -> None:
+        """Record written phase files and advance the journey when its current file is done"""
+        with self._lock:
+            registration = self._registrations.get(root)
+        if registration is None:
+            return
+
+        written = {}
+        for rel_path in sorted(changes.added | changes.changed):
+            full_path = Path(root) / rel_path
+            parsed = parse_phase_path(f"{THINKING_DIR}/{rel_path}")
+            if parsed is None:
+                continue
+            try:
+                if full_path.stat().st_size == 0:
+                    continue  # created but not written yet
+                self.tracker.record_phase_file(registration.starlog_path, str(full_path))
+            except (OSError, ValueError) as e:
+                logger.debug(f"Could not record {full_path}: {e}")
+                continue
+            written[parsed] = full_path
+
+        if written and registration.auto_advance:
+            self._advance(registration, written)
+
+    def _advance(self, registration: _Registration, written: Dict[tuple, Path]) -> None:
+        """Advance past every consecutive current-phase file in this batch"""
+        while True:
+            state = self.tracker._load_state(registration.starlog_path)
+            if state is None:
+                return
+            component = None if registration.scope == GLOBAL_SCOPE else registration.scope
+            position = state.get_position(component)
+            if position is None:
+                return
+            if (registration.scope, position.layer, position.pass_num, position.phase) not in written:
+                return
+            result = self.tracker.next_phase(registration.starlog_path, component)
+            logger.info(f"Auto-advanced {registration.starlog_path}: {result}")
+
+
+# Global watcher instance (created lazily so importing never starts a thread)
+_phase_watcher: Optional[PhaseWatcher] = None
+_phase_watcher_lock = threading.Lock()
+
+
+def _get_phase_watcher() -> PhaseWatcher:
+    global _phase_watcher
+    with _phase_watcher_lock:
+        if _phase_watcher is None:
+            _phase_watcher = PhaseWatcher()
+        return _phase_watcher
+
+
+def watch_phase_files(starlog_path: str, auto_advance: bool = False,
+                      run_type: str = "global", component_name: Optional[str] = None) -> str:
+    """
+    Watch a STARLOG project for completed phase files.
+
+    Args:
+        starlog_path: STARLOG project path
+        auto_advance: Advance the journey when the current phase file is written
+        run_type: "global" or "local"
+        component_name: Component name if local run
+
+    Returns:
+        Confirmation with the watched directory and backend
+    """
+    if not Path(starlog_path).is_dir():
+        return f"❌ STARLOG project not found: {starlog_path}"
+    if run_type != "global" and not component_name:
+        return "❌ Component name required for local runs"
+
+    phase_watcher = _get_phase_watcher()
+    root = phase_watcher.register(
+        starlog_path, auto_advance, component_name if run_type != "global" else None
+    )
+    mode = "records and advances" if auto_advance else "records"
+    return f"""👁️ **Watching Phase Files**: {root}
+
+**Backend**: {phase_watcher.watcher.backend}
+**Mode**: {mode} completed phase files
+**Projects Watched**: {len(phase_watcher.registrations())}"""
+
+
+def unwatch_phase_files(starlog_path: str) -> str:
+    """Stop watching a STARLOG project for phase files"""
+    if _phase_watcher is None or not _phase_watcher.unregister(starlog_path):
+        return f"❌ Not watching: {starlog_path}"
+    return f"✅ Stopped watching phase files for {starlog_path}"
@@ -0,0 +1,87 @@
+"""
+Journey snapshots - a bounded log of every saved journey state
+
+Each save appends one compact JSON line, so recording a snapshot is a single
+O(1) append. Restoring an earlier position reads the (bounded) log and
+writes the chosen state back directly, so no transitions are replayed.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SNAPSHOTS = 100
+DEFAULT_MAX_BYTES = 256 * 1024
+
+
+class Snapshot(NamedTuple):
+    """A saved journey state"""
+    at: str  # ISO timestamp of the save
+    state: Dict[str, Any]
+
+
+class SnapshotLog:
+    """
+    Append-only JSONL snapshot log for one journey with bounded retention.
+
+    Only the newest max_snapshots entries are visible. When the file grows
+    past max_bytes it is compacted to the newest entries that fit in half of
+    max_bytes, which caps disk use per journey while keeping compaction rare.
+    """
+
+    def __init__(self, log_file: Path, max_snapshots: int = DEFAULT_MAX_SNAPSHOTS,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.log_file = Path(log_file)
+        self.max_snapshots = max_snapshots
+        self.max_bytes = max_bytes
+
+    def append(self, at: str, state: Dict[str, Any]) -> None:
+        """Record a state, compacting the log if it has outgrown its cap"""
+        line = json.dumps({"at": at, "state": state}, default=str, separators=(",", ":")) + "\n"
+        with open(self.log_file, "a", encoding="utf-8") as f:
+            f.write(line)
+            size = f.tell()
+        if size > self.max_bytes:
+            self._compact()
+
+    def load(self) -> List[Snapshot]:
+        """Return retained snapshots, oldest first"""
+        if not self.log_file.exists():
+            return []
+        snapshots = []
+        with open(self.log_file, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    snapshots.append(Snapshot(entry["at"], entry["state"]))
+                except (ValueError, KeyError):
+                    logger.warning(f"Skipping corrupt snapshot line in {self.log_file}")
+        return snapshots[-self.max_snapshots:]
+
+    def _compact(self) -> None:
+        """Rewrite the log with the newest snapshots that fit in half the byte cap"""
+        budget = self.max_bytes // 2
+        kept: List[str] = []
+        used = 0
+        for snapshot in reversed(self.load()):
+            line = json.dumps({"at": snapshot.at, "state": snapshot.state},
+                              default=str, separators=(",", ":")) + "\n"
+            if kept and used + len(line) > budget:
+                break
+            kept.append(line)
+            used += len(line)
+
+        tmp = self.log_file.with_name(self.log_file.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.writelines(reversed(kept))
+        os.replace(tmp, self.log_file)
+        logger.debug(f"Compacted snapshot log {self.log_file} to {len(kept)} entries ({used} bytes)")
+
+    def delete(self) -> None:
+        """Remove the snapshot log"""
+        if self.log_file.exists():
+            self.log_file.unlink()
@@ -0,0 +1,140 @@
+"""
+Workflow model parsed from the master prompt's notation
+
+The chain (0)[AbstractGoal]→(1)[SystemsDesign→(1a)[PurposeCapture]→…]→…→loop→(0)
+is parsed once into phases and their subphases. The parsed tree is cached and
+only re-parsed when MASTER_PROMPT.md changes on disk (e.g. after a sync).
+"""
+
+import logging
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MASTER_PROMPT_PATH = (Path(__file__).parent / "3_pass_autonomous_research_system_v01"
+                      / "system_design_instructions" / "MASTER_PROMPT.md")
+
+# Built-in copy of the workflow, used when the bundled master prompt is missing or unparseable
+DEFAULT_WORKFLOW = (
+    "(0)[AbstractGoal]"
+    "→(1)[SystemsDesign→(1a)[PurposeCapture]→(1b)[ContextMap]→(1c)[StakeholderGoals]→(1d)[SuccessMetrics]→(1e)[ConstraintScan]→(1f)[ResourceLimits]→(1g)[RegulatoryBounds]→(1h)[RiskAssumptions]→(1i)[ConceptModel]→(1j)[OntologySketch]→(1k)[BoundarySet]→(1l)[DesignBrief]]"
+    "→(2)[SystemsArchitecture→(2a)[FunctionDecomposition]→(2b)[ModuleGrouping]→(2c)[InterfaceDefinition]→(2d)[LayerStack]→(2e)[ControlFlow]→(2f)[DataFlow]→(2g)[RedundancyPlan]→(2h)[ArchitectureSpec]]"
+    "→(3)[DSL→(3a)[ConceptTokenize]→(3b)[SyntaxDefine]→(3c)[SemanticRules]→(3d)[OperatorSet]→(3e)[ValidationTests]→(3f)[DSLSpec]]"
+    "→(4)[Topology→(4a)[NodeIdentify]→(4b)[EdgeMapping]→(4c)[FlowWeights]→(4d)[GraphBuild]→(4e)[Simulation]→(4f)[LoadBalance]→(4g)[TopologyMap]]"
+    "→(5)[EngineeredSystem→(5a)[ResourceAllocate]→(5b)[PrototypeBuild]→(5c)[IntegrationTest]→(5d)[Deploy]→(5e)[Monitor]→(5f)[StressTest]→(5g)[OperationalSystem]]"
+    "→(6)[FeedbackLoop→(6a)[TelemetryCapture]→(6b)[AnomalyDetection]→(6c)[DriftAnalysis]→(6d)[ConstraintRefit]→(6e)[DSLAdjust]→(6f)[ArchitecturePatch]→(6g)[TopologyRewire]→(6h)[Redeploy]→(6i)[GoalAlignmentCheck]]"
+    "→loop→(0)"
+)
+
+_STEP = re.compile(r"\((\w+)\)\[(\w+)")
+_CHAIN_START = "(0)["
+
+
+class Subphase(NamedTuple):
+    """One step inside a phase, e.g. (1a)[PurposeCapture]"""
+    code: str
+    name: str
+    bit: int  # position within its phase, used as the completion bit
+
+
+class Phase(NamedTuple):
+    """A workflow phase and its subphases"""
+    number: int
+    name: str
+    definition: str  # the phase's own notation, e.g. (3)[DSL→(3a)[ConceptTokenize]→…]
+    subphases: Tuple[Subphase, ...]
+
+
+class WorkflowTree(NamedTuple):
+    """Parsed workflow: phases in order plus a subphase lookup by code"""
+    phases: Tuple[Phase, ...]
+    by_code: Dict[str, Subphase]
+
+    def phase(self, number: int) -> Optional[Phase]:
+        return self.phases[number] if 0 <= number < len(self.phases) else None
+
+
+def parse_workflow(text: str) -> WorkflowTree:
+    """
+    Parse workflow notation into phases and subphases.
+
+    Raises:
+        ValueError: if no well-formed (0)[...]→...→(6)[...] chain is found
+    """
+    start = text.find(_CHAIN_START)
+    if start < 0:
+        raise ValueError("Workflow notation not found")
+    chain = text[start:].split("\n", 1)[0]
+
+    phases = []
+    i = 0
+    while True:
+        match = _STEP.match(chain, i)
+        if not match:
+            break
+        begin, (code, name), i = i, match.groups(), match.end()
+        if not code.isdigit() or int(code) != len(phases):
+            raise ValueError(f"Unexpected phase ({code}) at position {len(phases)}")
+
+        subphases = []
+        while chain.startswith("→", i):
+            sub = _STEP.match(chain, i + 1)
+            if not sub or not chain.startswith("]", sub.end()):
+                break
+            subphases.append(Subphase(sub.group(1), sub.group(2), len(subphases)))
+            i = sub.end() + 1
+
+        if not chain.startswith("]", i):
+            raise ValueError(f"Unterminated phase ({code})[{name}")
+        i += 1
+        phases.append(Phase(int(code), name, chain[begin:i], tuple(subphases)))
+        if not chain.startswith("→", i):
+            break
+        i += 1
+
+    if not phases:
+        raise ValueError("Workflow notation contains no phases")
+    by_code = {sub.code: sub for phase in phases for sub in phase.subphases}
+    return WorkflowTree(tuple(phases), by_code)
+
+
+_cache_lock = threading.Lock()
+_cache: Dict[str, Tuple[Optional[tuple], WorkflowTree]] = {}
+
+
+def get_workflow(path: Optional[Path] = None) -> WorkflowTree:
+    """
+    Return the parsed workflow tree, re-parsing only when the master prompt changes.
+
+    Args:
+        path: Master prompt to parse (defaults to the bundled MASTER_PROMPT.md)
+    """
+    path = Path(path) if path else MASTER_PROMPT_PATH
+    try:
+        st = os.stat(path)
+        signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+    except OSError:
+        signature = None
+
+    key = str(path)
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+    tree = None
+    if signature is not None:
+        try:
+            tree = parse_workflow(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not parse workflow from {path}, using built-in copy: {e}")
+    if tree is None:
+        tree = parse_workflow(DEFAULT_WORKFLOW)
+
+    with _cache_lock:
+        _cache[key] = (signature, tree)
+    return tree
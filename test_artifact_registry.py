@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test the phase artifact registry and status reporting
+"""
+
+import sys
+import tempfile
+import traceback
+from pathlib import Path
+
+from emergence_engine import ThreePassTracker
+from emergence_engine.artifacts import parse_phase_path
+
+
+def test_parse_phase_path():
+    """Test phase files are recognised for global and component scopes"""
+    print("\n1. Parsing phase paths...")
+    assert parse_phase_path("/p/3_pass_thinking/global_system/layer_1/pass_2/3_DSL.md") == ("global", 1, 2, 3)
+    assert parse_phase_path("3_pass_thinking/component_specific/auth/layer_0/pass_3/6_FeedbackLoop.md") == ("auth", 0, 3, 6)
+    assert parse_phase_path("/p/notes/3_DSL.md") is None
+
+
+def test_record_and_status():
+    """Test recorded files appear in status from the registry"""
+    print("\n2. Recording phase files...")
+    with tempfile.TemporaryDirectory() as states, tempfile.TemporaryDirectory() as project:
+        tracker = ThreePassTracker(states)
+        tracker.start_journey("Registry Test", project)
+
+        pass_dir = Path(project) / "3_pass_thinking" / "global_system" / "layer_0" / "pass_1"
+        pass_dir.mkdir(parents=True)
+        for phase, name in [(0, "AbstractGoal"), (1, "SystemsDesign")]:
+            phase_file = pass_dir / f"{phase}_{name}.md"
+            phase_file.write_text(f"# {name}\n")
+            artifact = tracker.record_phase_file(project, str(phase_file))
+            assert artifact.notation == f"L0P1W[0]({phase})"
+            assert artifact.size == len(f"# {name}\n")
+
+        artifacts = tracker.get_registry(project).load()
+        assert len(artifacts) == 2
+
+        status = tracker.get_status(project)
+        print(f"   {status.strip().splitlines()[-6]}")
+        assert "Phase Artifacts (global): 2/63" in status
+        assert "L0  P1 01·····" in status
+
+        tracker.abandon_journey(project)
+        assert tracker.get_registry(project).load() == {}
+
+
+def test_rejects_non_phase_files():
+    """Test files outside 3_pass_thinking are refused"""
+    print("\n3. Rejecting non-phase files...")
+    with tempfile.TemporaryDirectory() as states, tempfile.TemporaryDirectory() as project:
+        tracker = ThreePassTracker(states)
+        stray = Path(project) / "notes.md"
+        stray.write_text("notes")
+        try:
+            tracker.record_phase_file(project, str(stray))
+        except ValueError:
+            return
+        raise AssertionError("Expected ValueError for non-phase file")
+
+
+if __name__ == "__main__":
+    try:
+        test_parse_phase_path()
+        test_record_and_status()
+        test_rejects_non_phase_files()
+        print("\n✅ All artifact registry tests passed!")
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        print(f"Traceback: {traceback.format_exc()}")
+        sys.exit(1)
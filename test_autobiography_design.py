@@ -0,0 +1,689 @@
+#!/usr/bin/env python3
+"""
+Test the autobiography generator design's data structures
+
+The design lives in fenced python blocks of the pass-2 docs. The models and
+Agent base come from system_architecture.py and the implementation from the
+first block of detailed_implementation.py. Both are executed into one module,
+so the tests exercise exactly the code in the docs.
+"""
+
+import inspect
+import os
+import random
+import re
+import sys
+import tempfile
+import threading
+import traceback
+import types
+import warnings
+from pathlib import Path
+
+DESIGN_DIR = (Path(__file__).parent / "emergence_engine" / "3_pass_autonomous_research_system_v01"
+              / "systems_design_test_2" / "pass2_autobiography_generator")
+_CODE_BLOCK = re.compile(r"```python\n(.*?)```", re.S)
+
+
+def load_design() -> types.ModuleType:
+    """Execute the design's code blocks as an importable module"""
+    if "autobiography_design" in sys.modules:
+        return sys.modules["autobiography_design"]
+    architecture = _CODE_BLOCK.findall((DESIGN_DIR / "system_architecture.py").read_text())[0]
+    implementation = _CODE_BLOCK.findall((DESIGN_DIR / "detailed_implementation.py").read_text())[0]
+    source = architecture.split("# Tool Functions")[0] + implementation
+
+    module = types.ModuleType("autobiography_design")
+    sys.modules[module.__name__] = module
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)  # The docs use pydantic's v1-style validators
+        exec(compile(source, str(DESIGN_DIR / "detailed_implementation.py"), "exec"), module.__dict__)
+    return module
+
+
+design = load_design()
+
+
+def memory(content: str, year=None, age=None, people=(), memory_id=None, **fields):
+    """Build a Memory with just the fields a test cares about"""
+    if memory_id is not None:
+        fields["id"] = memory_id
+    return design.Memory(content=content, memory_type=design.MemoryType.MILESTONE, significance="test",
+                         year=year, age=age, people=list(people), **fields)
+
+
+def test_timeline_index_order():
+    """Test keys come out by year, then insertion order, with undated memories last"""
+    print("\n1. Ordering the timeline index...")
+    index = design.TimelineIndex()
+    for key, year in [(0, 1990), (1, None), (2, 1980), (3, 1990), (4, 1985)]:
+        index.insert(key, year)
+    assert list(index) == [2, 4, 0, 3, 1]
+    assert index.range(1981, 1990) == [4, 0, 3]
+    assert index.range(1991, 2000) == []
+
+    index.remove(4, 1985)
+    index.remove(1, None)
+    assert list(index) == [2, 0, 3] and len(index) == 3
+    assert index._years == [1980, 1990]
+
+
+def test_bank_timeline_follows_restores():
+    """Test re-storing a memory with a new year moves it in the timeline and period queries"""
+    print("\n2. Re-dating a stored memory...")
+    bank = design.MemoryBank()
+    bank.store(memory("Started school in the village", 1960, memory_id="school"))
+    bank.store(memory("Moved to the city with my parents", 1972, memory_id="move"))
+    bank.store(memory("A summer at the lake house", memory_id="lake"))
+    assert bank.timeline == ["school", "move", "lake"]
+
+    bank.store(memory("Moved to the city with my parents", 1958, memory_id="move"))
+    assert bank.timeline == ["move", "school", "lake"]
+    assert [m.id for m in bank.get_by_period(1955, 1965)] == ["move", "school"]
+    assert bank.get_by_period(1970, 1975) == []
+
+
+def _overlapping_count(text: str, keyword: str) -> int:
+    return sum(text.startswith(keyword, i) for i in range(len(text)))
+
+
+def test_theme_matcher_counts_every_keyword():
+    """Test one automaton scan matches counting each keyword separately, overlaps included"""
+    print("\n3. Scanning with the theme automaton...")
+    keywords = {"family": ["he", "she", "hers", "his"], "travel": ["trip", "ship", "hi"], "empty": []}
+    matcher = design.ThemeMatcher(keywords)
+    assert matcher.scan("Ushers; she sailed on HIS ship") == {"family": 6, "travel": 3}
+
+    rng = random.Random(5)
+    for _ in range(200):
+        text = "".join(rng.choice("hesirpt ") for _ in range(60))
+        expected = {theme: sum(_overlapping_count(text, k) for k in words) for theme, words in keywords.items()}
+        assert matcher.scan(text) == {theme: n for theme, n in expected.items() if n}
+
+
+def test_theme_matcher_cache_follows_content():
+    """Test cached scores are reused per memory until its content changes"""
+    print("\n4. Caching theme scores...")
+    matcher = design.ThemeMatcher({"loss": ["funeral", "grief"], "joy": ["wedding"]})
+    first = memory("The funeral was on a grey morning", memory_id="m1")
+    assert matcher.match(first) == {"loss": 1}
+    assert matcher.match(first) is matcher.match(first)
+
+    edited = memory("The wedding was on a bright morning", memory_id="m1")
+    assert matcher.match(edited) == {"joy": 1}
+    assert matcher.frequency([edited, memory("Grief came later, at the funeral")]) == {"loss": 1, "joy": 1}
+    assert "loss" in matcher and "travel" not in matcher
+
+
+def test_register_theme_on_existing_bank():
+    """Test registering a theme indexes stored memories, substring keywords included, and stays current"""
+    print("\n5. Registering a theme on a populated bank...")
+    bank = design.MemoryBank()
+    bank.store(memory("We sailed to the islands that summer", 1975, memory_id="sail"))
+    bank.store(memory("Grandmother taught me to bake bread", 1962, memory_id="bake"))
+    bank.store(memory("Our first trip abroad, by overnight ferry", 1968, memory_id="ferry"))
+    bank.store(memory("A quiet winter at home with the radio", memory_id="radio"))
+
+    # "ail" only occurs inside "sailed"; "ferry" and "trip" are whole words
+    assert bank.register_theme("travel", ["ail", "ferry", "trip abroad"]) == 2
+    assert bank.theme_index["travel"] == ["sail", "ferry"]
+    assert [m.id for m in bank.theme_timeline("travel")] == ["ferry", "sail"]
+
+    # Later stores and edits are matched against the registered vocabulary
+    bank.store(memory("The road trip abroad in a borrowed van", 1959, memory_id="van"))
+    bank.store(memory("We stayed home and sold the boat instead", 1975, memory_id="sail"))
+    assert [m.id for m in bank.theme_timeline("travel")] == ["van", "ferry"]
+
+    # Redefining a theme replaces its members; a theme with no members reads as empty
+    assert bank.register_theme("travel", ["ferry"]) == 1
+    assert bank.theme_index["travel"] == ["ferry"]
+    assert bank.register_theme("music", ["piano"]) == 0
+    assert bank.theme_index["music"] == [] and bank.theme_timeline("music") == []
+    assert "music" not in set(bank.theme_index)
+
+
+def test_indexes_drop_empty_entries():
+    """Test people, theme and word index entries are removed once no memory holds them"""
+    print("\n6. Dropping emptied index entries...")
+    bank = design.MemoryBank()
+    bank.register_theme("school", ["classroom"])
+    bank.store(memory("Mrs Reed ran the classroom like a ship", 1960, people=["Mrs Reed"], memory_id="m1"))
+    assert "Mrs Reed" in bank.people_index and "school" in set(bank.theme_index)
+
+    bank.store(memory("Summer afternoons fishing off the dock", 1960, people=["Dad"], memory_id="m1"))
+    assert "Mrs Reed" not in bank.people_index
+    assert list(bank.people_index) == ["Dad"]
+    assert "school" not in bank._themes and "school" not in bank._theme_timelines
+    assert "classroom" not in bank._token_index
+    try:
+        bank.people_index["Mrs Reed"]
+        raise AssertionError("Expected KeyError")
+    except KeyError:
+        pass
+
+
+_PEOPLE = ["Mom", "Dad", "Ana", "Uncle Joe", "Mrs Reed"]
+_WORDS = ["lake", "school", "ferry", "bread", "piano", "winter", "garden", "letters", "train", "radio"]
+
+
+def _random_memories(rng: random.Random, count: int, ids: int):
+    """Memories over a small ID space, so some of them re-store (and re-date) earlier IDs"""
+    for i in range(count):
+        yield memory(
+            " ".join(rng.choices(_WORDS, k=6)) + f" number {i}",
+            rng.choice([None, *range(1950, 1990, 3)]),
+            rng.choice([None, *range(0, 60, 4)]),
+            rng.sample(_PEOPLE, rng.randint(0, 3)),
+            memory_id=f"m{rng.randrange(ids)}",
+        )
+
+
+def _bank_snapshot(bank) -> dict:
+    """Everything the two bank implementations should agree on"""
+    graph = bank.people_graph
+    return {
+        "memories": sorted(bank.memories),
+        "timeline": bank.timeline,
+        "period": [m.id for m in bank.get_by_period(1960, 1975)],
+        "people": {p: bank.people_index[p] for p in bank.people_index},
+        "by_person": {p: [m.id for m in bank.get_by_person(p)] for p in _PEOPLE},
+        "themes": {t: [m.id for m in bank.get_by_theme(t)] for t in bank.theme_vocabulary},
+        "theme_timelines": {t: [m.id for m in bank.theme_timeline(t)] for t in bank.theme_vocabulary},
+        "graph": {p: graph.top_relationships(p, 10) for p in _PEOPLE},
+        "clusters": graph.clusters(),
+        "segments": bank.segmenter.segment(),
+        "type_counts": bank.columns.type_counts(),
+        "span": bank.columns.year_span(),
+    }
+
+
+def test_sqlite_and_memory_banks_agree():
+    """Test the SQLite bank answers every query like the in-memory bank on the same stores"""
+    print("\n7. Comparing SQLite and in-memory banks...")
+    rng = random.Random(11)
+    stores = list(_random_memories(rng, 300, 120))
+    with tempfile.TemporaryDirectory() as tmp:
+        in_memory = design.MemoryBank()
+        stored = design.SQLiteMemoryBank(os.path.join(tmp, "memories.db"))
+        for bank in (in_memory, stored):
+            bank.register_theme("water", ["lake", "ferry"])
+            for m in stores[:150]:
+                bank.store(m)
+            bank.register_theme("home", ["bread", "garden", "radio"])
+        # Derived structures are built lazily by the SQLite bank; build them mid-stream too
+        _bank_snapshot(stored)
+        for m in stores[150:]:
+            in_memory.store(m)
+        stored.store_many(stores[150:])
+
+        expected = _bank_snapshot(in_memory)
+        assert _bank_snapshot(stored) == expected
+        stored.close()
+
+        # Reopening reads everything back from disk
+        with design.SQLiteMemoryBank(os.path.join(tmp, "memories.db")) as reopened:
+            assert _bank_snapshot(reopened) == expected
+
+
+def test_sqlite_theme_registration_uses_trigram_index():
+    """Test registering a theme on a filled SQLite bank only checks the trigram index's candidates"""
+    print("\n8. Registering a theme on a stored bank...")
+    with tempfile.TemporaryDirectory() as tmp, \
+            design.SQLiteMemoryBank(os.path.join(tmp, "memories.db")) as bank:
+        assert bank.substring_index
+        bank.store_many([memory(f"an ordinary afternoon number {i}", 1970) for i in range(300)])
+        bank.store_many([memory("the preschool by the LIGHTHOUSE", 1971, memory_id="a"),
+                         memory("we rowed the ox cart to the lighthouse", 1972, memory_id="b"),
+                         memory("an ox in the field behind the barn", 1973, memory_id="c")])
+        calls = []
+        bank._conn.create_function("contains_keyword", 2,
+                                   lambda text, keyword: calls.append(keyword) or keyword in text.lower())
+
+        assert bank.register_theme("coast", ["lighthouse", "school"]) == 2
+        assert [m.id for m in bank.get_by_theme("coast")] == ["a", "b"]
+        assert len(calls) <= 4  # Candidates only, never the 300 other rows
+
+        # Keywords under three characters cannot use trigrams and are scanned
+        del calls[:]
+        assert bank.register_theme("farm", ["ox"]) == 2 and len(calls) == 303
+
+
+def test_columns_match_memory_loops():
+    """Test column analytics agree with plain loops, with and without NumPy, after re-stores"""
+    print("\n9. Checking columnar analytics...")
+    rng = random.Random(3)
+    latest = {}
+    columns = design.MemoryColumns()
+    for m in _random_memories(rng, 400, 150):
+        m = m.model_copy(update={"emotions": rng.sample(["joy", "fear", "love"], rng.randint(0, 3))})
+        columns.append(m)
+        latest[m.id] = m
+    live = list(latest.values())
+    dated = [m for m in live if m.year is not None]
+
+    expected_intensity = {}
+    for year in sorted({m.year for m in dated}):
+        in_year = [len(m.emotions) for m in dated if m.year == year]
+        expected_intensity[year] = sum(in_year) / len(in_year)
+    expected_people = {}
+    for m in live:
+        for person in m.people:
+            expected_people[person] = expected_people.get(person, 0) + 1
+    expected_brackets = []
+    for start_age, end_age in [(0, 12), (13, 40), (41, 100)]:
+        in_bracket = [m for m in live if m.age is not None and start_age <= m.age <= end_age]
+        years = [m.year for m in in_bracket if m.year is not None]
+        expected_brackets.append((len(in_bracket), min(years, default=None), max(years, default=None)))
+
+    saved_np = design.np
+    for np in {saved_np, None}:
+        design.np = np
+        try:
+            assert len(columns) == len(live)
+            assert columns.year_span() == (min(m.year for m in dated), max(m.year for m in dated))
+            assert columns.dated_years() == sorted({m.year for m in dated})
+            assert columns.age_bracket_stats([(0, 12), (13, 40), (41, 100)]) == expected_brackets
+            assert columns.type_counts()[design.MemoryType.MILESTONE] == len(live)
+            assert columns.people_counts() == expected_people
+            intensity = columns.emotion_intensity()
+            assert intensity.keys() == expected_intensity.keys()
+            assert all(abs(intensity[y] - expected_intensity[y]) < 1e-9 for y in intensity)
+        finally:
+            design.np = saved_np
+
+
+_STORY = ("the summer we drove to the coast in the old blue car my father had bought from a neighbour "
+          "and the engine overheated twice before we reached the ferry so we sat on the verge eating "
+          "bread and cheese while he waited for it to cool and my mother read to us from a paperback")
+
+
+def test_near_duplicates_merge_and_link():
+    """Test both banks fold retellings into the stored memory and keep their IDs resolvable"""
+    print("\n10. Folding near-duplicate memories...")
+    original = memory(_STORY, people=["Dad"], memory_id="first")
+    retelling = memory(_STORY + " again", year=1975, people=["Mom", "Dad"], memory_id="retold",
+                       emotions=["joy"])
+    unrelated = memory("my first day at the new school and the teacher who knew my name", 1976,
+                       memory_id="school")
+    with tempfile.TemporaryDirectory() as tmp:
+        for policy in ("merge", "link"):
+            db_path = os.path.join(tmp, f"{policy}.db")
+            banks = [design.MemoryBank(duplicate_threshold=0.8, duplicate_policy=policy),
+                     design.SQLiteMemoryBank(db_path, duplicate_threshold=0.8, duplicate_policy=policy)]
+            for bank in banks:
+                assert bank.store(original) == "first"
+                assert bank.store(retelling) == "first"
+                assert bank.store(unrelated) == "school"
+                assert "retold" not in bank.memories and len(bank.memories) == 2
+                assert bank.resolve("retold") == "first" and bank.resolve("school") == "school"
+                assert bank.duplicate_of == {"retold": "first"}
+                stored = bank.memories["first"]
+                if policy == "merge":
+                    assert (stored.people, stored.year, stored.emotions) == (["Dad", "Mom"], 1975, ["joy"])
+                    assert bank.people_index["Mom"] == ["first"]
+                    assert [m.id for m in bank.get_by_period(1975, 1975)] == ["first"]
+                else:
+                    assert stored == original and "Mom" not in bank.people_index
+            assert _bank_snapshot(banks[1]) == _bank_snapshot(banks[0])
+            banks[1].close()
+
+            # Aliases persist, and the rebuilt index still catches retellings
+            with design.SQLiteMemoryBank(db_path, duplicate_threshold=0.8, duplicate_policy=policy) as reopened:
+                assert reopened.resolve("retold") == "first"
+                assert reopened.store(memory(_STORY + " once more", memory_id="third")) == "first"
+                assert "third" not in reopened.memories
+
+    # Without a threshold every memory is stored
+    bank = design.MemoryBank()
+    bank.store(original)
+    assert bank.store(retelling) == "retold" and len(bank.memories) == 2
+
+
+def _scripted_interviewee(agent, answers):
+    """Make agent.run answer interview prompts from a script; returns the prompts it was sent"""
+    prompts, answers = [], iter(answers)
+
+    def run(prompt):
+        prompts.append(prompt)
+        if prompt.startswith("The person just shared"):
+            return {}
+        messages = [{"role": "user", "content": next(answers)}]
+        return {"history_id": f"h{len(prompts)}", "history": types.SimpleNamespace(messages=messages)}
+    agent.run = run
+    return prompts
+
+
+def test_interview_with_dedup_collects_every_distinct_answer():
+    """Test a multi-answer interview with dedup on keeps each distinct answer and connects them"""
+    print("\n11. Interviewing with duplicate detection on...")
+    bank = design.MemoryBank(duplicate_threshold=0.8)
+    agent = design.InterviewAgent(bank)
+    answers = ["the smell of the bakery on the corner where my aunt worked every saturday",
+               "the night the river flooded and we carried the chickens upstairs",
+               "learning to ride a bicycle on the gravel lane behind the church",
+               "my grandfather teaching me to whistle with a blade of grass"]
+    prompts = _scripted_interviewee(agent, answers)
+
+    collected = agent.conduct_interview("childhood", target_memories=4)
+    assert [m.content for m in collected] == answers
+    assert sorted(bank.memories) == sorted(m.id for m in collected) and bank.duplicate_of == {}
+    assert len([p for p in prompts if p.startswith("The person just shared")]) == 3
+
+    # No response, no memory: a stubbed run never becomes a placeholder that dedup would fold together
+    agent.run = lambda prompt: None
+    assert agent.conduct_interview("adolescence", target_memories=3) == [] and len(bank.memories) == 4
+
+
+def test_reinterview_overlapping_period():
+    """Test an interview whose answers repeat stored memories still collects and connects the new ones"""
+    print("\n12. Re-interviewing an overlapping period...")
+    bank = design.MemoryBank(duplicate_threshold=0.8)
+    bank.store(memory(_STORY, 1975, memory_id="first"))
+    agent = design.InterviewAgent(bank)
+    prompts = _scripted_interviewee(agent, [
+        _STORY + " again",
+        "the night the river flooded and we carried the chickens upstairs",
+        "learning to ride a bicycle on the gravel lane behind the church",
+    ])
+
+    collected = agent.conduct_interview("childhood", target_memories=3)
+    assert [m.content[:9] for m in collected] == ["the night", "learning "]
+    assert len(bank.memories) == 3 and list(bank.duplicate_of.values()) == ["first"]
+    connections = [p for p in prompts if p.startswith("The person just shared")]
+    assert len(connections) == 1 and "learning to ride" in connections[0] and "river flooded" in connections[0]
+
+
+def test_memory_ids_are_unique_and_ordered():
+    """Test IDs stay unique and increasing under a stalled clock, a clock step back and threads"""
+    print("\n13. Generating memory IDs...")
+    generator = design.MemoryIdGenerator("t_")
+    saved_time = design.time
+    clock = types.SimpleNamespace(time_ns=lambda: 5_000)
+    design.time = clock
+    try:
+        stalled = [generator() for _ in range(3)]
+        clock.time_ns = lambda: 1_000  # Clock stepped backwards
+        stalled.append(generator())
+    finally:
+        design.time = saved_time
+    assert stalled == ["t_1388", "t_1389", "t_138a", "t_138b"]
+
+    issued = []
+    threads = [threading.Thread(target=lambda: issued.extend(generator() for _ in range(500)))
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    numbers = [int(memory_id[2:], 16) for memory_id in issued]
+    assert len(set(numbers)) == 2000 and min(numbers) > 0x138b
+    assert len({memory("a memory made in a loop").id for _ in range(1000)}) == 1000
+
+
+def test_packed_index_keys():
+    """Test indices hold packed store-order keys and re-stores move a memory to a fresh key"""
+    print("\n14. Packing index keys...")
+    bank = design.MemoryBank()
+    for memory_id, people in [("a", ["Ana", "Mom"]), ("b", ["Mom"]), ("c", ["Ana"])]:
+        bank.store(memory(f"a day with {' and '.join(people)}", 1980, people=people, memory_id=memory_id))
+    assert bank._people["Mom"].typecode == design._KEY_TYPE and list(bank._people["Mom"]) == [0, 1]
+    assert bank.people_index["Ana"] == ["a", "c"]
+
+    bank.store(memory("a day with Ana and Mom", 1980, people=["Mom", "Ana", "Mom"], memory_id="a"))
+    assert bank._keys["a"] == 3 and bank._ids == {1: "b", 2: "c", 3: "a"}  # Key 0 is released
+    assert list(bank._people["Mom"]) == [1, 3] and bank.people_index["Mom"] == ["b", "a"]
+    assert bank.people_index["Ana"] == ["c", "a"]
+    assert dict(bank.people_index) == {"Ana": ["c", "a"], "Mom": ["b", "a"]}
+    assert bank.people_index.get("Nobody") is None and "Nobody" not in bank.people_index
+
+
+def test_people_graph_follows_restores():
+    """Test edge weights, pair years, appearances and clusters match a rebuild after removals"""
+    print("\n15. Maintaining the people graph...")
+    rng = random.Random(5)
+    bank = design.MemoryBank()
+    for m in _random_memories(rng, 300, 100):
+        bank.store(m)
+    graph = bank.people_graph
+    graph.clusters()  # Cached; later updates must invalidate it
+    for m in _random_memories(rng, 100, 100):
+        bank.store(m.model_copy(update={"people": m.people[:1]}))  # Re-stores break up ties
+
+    live = list(bank.memories.values())
+    appearances, weights, pair_years = {}, {}, {}
+    for m in live:
+        people = list(dict.fromkeys(m.people))
+        for person in people:
+            appearances[person] = appearances.get(person, 0) + 1
+        for a in people:
+            for b in people:
+                if a < b:
+                    weights[a, b] = weights.get((a, b), 0) + 1
+                    if m.year is not None:
+                        years = pair_years.setdefault((a, b), {})
+                        years[m.year] = years.get(m.year, 0) + 1
+    assert graph.appearances == appearances
+    for a in _PEOPLE:
+        for b in _PEOPLE:
+            pair = (min(a, b), max(a, b))
+            expected = weights.get(pair, 0) if a != b else 0
+            assert graph.weight(a, b) == expected
+            if a != b:
+                assert graph.relationship_timeline(a, b) == sorted(pair_years.get(pair, {}).items())
+        ties = [(b if x == a else x, w) for (x, b), w in weights.items() if a in (x, b)]
+        assert graph.top_relationships(a, 2) == sorted(ties, key=lambda tie: (tie[1], tie[0]), reverse=True)[:2]
+    assert graph.clusters() == design.PeopleGraph.from_memories(live).clusters()
+
+    # Removing the last shared memory drops the edge, its years and the person
+    graph = design.PeopleGraph()
+    graph.add(["Ana", "Mom"], 1980)
+    graph.add(["Ana", "Mom", "Ana"], 1981)
+    graph.add(["Dad"], None)
+    assert graph.weight("Ana", "Mom") == 2 and graph.appearances == {"Ana": 2, "Mom": 2, "Dad": 1}
+    assert graph.clusters() == [["Ana", "Mom"]] and graph.clusters(min_size=1)[-1] == ["Dad"]
+    graph.remove(["Ana", "Mom"], 1980)
+    assert graph.relationship_timeline("Mom", "Ana") == [(1981, 1)]
+    graph.remove(["Mom", "Ana"], 1981)
+    assert graph.weight("Ana", "Mom") == 0 and graph.relationship_timeline("Ana", "Mom") == []
+    assert graph.appearances == {"Dad": 1} and graph.clusters() == []
+    assert graph._adjacency == {"Dad": {}} and graph._pair_years == {}
+
+
+def test_relationship_tool_reads_the_graph():
+    """Test identify_relationships ranks people from the graph, and the architecture sketch keeps its signature"""
+    print("\n16. Identifying relationships...")
+    bank = design.MemoryBank()
+    for memory_id, year, people in [("a", 1970, ["Mom", "Ana"]), ("b", 1975, ["Mom", "Dad"]),
+                                    ("c", 1980, ["Mom", "Ana"]), ("d", None, ["Dad"])]:
+        bank.store(memory(f"a day with {' and '.join(people)}", year, people=people, memory_id=memory_id))
+    relationships = design.identify_relationships(bank.people_graph, bank.people_index, top_k=2)
+    # Ana and Dad tie on appearances; the first seen is kept
+    assert [r.person for r in relationships] == ["Mom", "Ana"]
+    assert relationships[0].key_moments == ["a", "b", "c"]
+    assert relationships[0].impact == "Appears in 3 memories (1970-1980); closest to Ana (2), Dad (1)"
+    assert relationships[1].impact == "Appears in 2 memories (1970-1980); closest to Mom (2)"
+
+    architecture = _CODE_BLOCK.findall((DESIGN_DIR / "system_architecture.py").read_text())[0]
+    namespace = dict(design.__dict__)
+    exec(re.search(r"^def identify_relationships\(.*?(?=^def )", architecture, re.S | re.M).group(0), namespace)
+    def parameters(function):
+        return [(p.name, p.default) for p in inspect.signature(function).parameters.values()]
+    assert parameters(namespace["identify_relationships"]) == parameters(design.identify_relationships)
+
+
+def test_frequent_items_bounds():
+    """Test Misra-Gries counts are exact when everything fits and within n/(capacity+1) otherwise"""
+    print("\n17. Counting frequent items...")
+    rng = random.Random(9)
+    items = [f"w{i}" for i in range(300)]
+    stream = rng.choices(items, weights=[1 / (i + 1) for i in range(300)], k=5000)
+    truth = {}
+    for item in stream:
+        truth[item] = truth.get(item, 0) + 1
+
+    exact = design.FrequentItems(capacity=300)
+    small = design.FrequentItems(capacity=20)
+    for item in stream:
+        exact.add(item)
+        small.add(item)
+    expected_top = sorted(truth.items(), key=lambda i: (i[1], i[0]), reverse=True)
+    assert exact.top(5) == expected_top[:5]
+    assert exact.top(300, min_count=10) == [i for i in expected_top if i[1] >= 10]
+
+    error = len(stream) / (small.capacity + 1)
+    tracked = dict(small.top(small.capacity))
+    assert len(small._counts) <= small.capacity
+    assert all(truth[item] - error <= count <= truth[item] for item, count in tracked.items())
+    assert all(item in tracked for item, count in truth.items() if count > error)
+    assert small.top(1)[0][0] == expected_top[0][0]
+
+
+def test_profiler_features_and_patterns():
+    """Test one streaming pass yields hand-counted features and repeated patterns"""
+    print("\n18. Profiling a writing voice...")
+    samples = ["I walked to the old school. We were SO happy!",
+               "I walked to the old school again... It was really good.",
+               "Honestly, we were SO tired!"]
+    profiler = design.profile_text(sample for sample in samples)
+    assert (profiler.words, profiler.sentences, profiler.exclamations) == (26, 5, 2)
+
+    features = profiler.features()
+    assert features["avg_sentence_length"] == 26 / 5
+    assert features["vocabulary_richness"] == 17 / 26  # Shorter than one window: plain type-token ratio
+    assert features["emotional_words_ratio"] == 1 / 26  # happy
+    assert features["personal_pronouns_ratio"] == 4 / 26  # I, we, I, we
+    assert features["past_tense_ratio"] == 6 / 26  # walked x2, were x2, was, tired
+    assert features["exclamations_per_sentence"] == 2 / 5
+
+    patterns = profiler.patterns()
+    assert patterns["sentence_starters"] == ["i walked"]
+    assert patterns["emphasis_patterns"] == ["SO"]  # "so happy" and "so tired" are seen once each
+    assert {"the old school", "we were so", "i walked to"} <= set(patterns["common_phrases"])
+    assert "school again" not in patterns["common_phrases"] and len(patterns["common_phrases"]) == 10
+    assert design.identify_speech_patterns(samples) == patterns
+    assert design.extract_linguistic_features(samples) == features
+
+    # Sentences never run across samples, and the moving-average window kicks in past ttr_window words
+    split = design.profile_text(["I walked", "to the old school"])
+    assert split.sentences == 2 and "walked to" not in dict(split.phrases.top(10))
+    windowed = design.profile_text(["one two three four " * 5], ttr_window=4)
+    assert windowed.features()["vocabulary_richness"] == 1.0
+    assert design.profile_text([]).features()["avg_sentence_length"] == 0
+
+
+def test_segmenter_stage_boundaries():
+    """Test ages split at the stage bounds, out-of-range ages are ignored and empty spans are placed"""
+    print("\n19. Segmenting life stages...")
+    segmenter = design.TimelineSegmenter()
+    for year, age in [(1962, 12), (1963, 13), (1961, 11), (1990, 101), (None, 30), (1970, None)]:
+        segmenter.add(year, age)
+    phases = {phase.name: phase for phase in segmenter.phases()}
+    assert list(phases) == ["childhood", "adolescence", "early_career"]
+    assert (phases["childhood"].start_year, phases["childhood"].end_year) == (1961, 1962)
+    assert (phases["adolescence"].start_year, phases["adolescence"].end_year) == (1963, 1963)
+    assert phases["childhood"].description.startswith("Phase containing 2 memories")
+    # Only undated memories in this stage: placed from the birth year the dated ones agree on (1950)
+    assert (phases["early_career"].start_year, phases["early_career"].end_year) == (1976, 1990)
+
+    undated_only = design.TimelineSegmenter()
+    undated_only.add(None, 45)
+    assert undated_only.birth_year() is None
+    [phase] = undated_only.phases()
+    assert (phase.name, phase.start_year, phase.end_year) == ("midlife", 1900, 2024)
+
+    segmenter.remove(1962, 12)
+    segmenter.remove(1961, 11)
+    assert [phase.name for phase in segmenter.phases()] == ["adolescence", "early_career"]
+    assert len(segmenter) == 4
+
+
+def test_segmenter_gaps_and_coverage_follow_updates():
+    """Test gaps and coverage match a recount from scratch after every add and remove"""
+    print("\n20. Tracking timeline gaps...")
+    segmenter = design.TimelineSegmenter()
+    for year in (1970, 1980):
+        segmenter.add(year, None)
+    assert segmenter.gaps() == [(1970, 1980)]
+    segmenter.add(1975, None)  # Exactly gap_years apart on both sides: not a gap
+    assert segmenter.gaps() == []
+    segmenter.add(1975, None)
+    segmenter.remove(1975, None)
+    assert segmenter.gaps() == []
+    segmenter.remove(1975, None)
+    assert segmenter.gaps() == [(1970, 1980)]
+
+    rng = random.Random(13)
+    segmenter, years = design.TimelineSegmenter(), []
+    for _ in range(400):
+        if years and rng.random() < 0.4:
+            year = years.pop(rng.randrange(len(years)))
+            segmenter.remove(year, None)
+        else:
+            year = rng.choice([None, *range(1940, 2020, 3)])
+            years.append(year)
+            segmenter.add(year, None)
+        dated = sorted(y for y in years if y is not None)
+        distinct = sorted(set(dated))
+        assert segmenter.gaps() == [(a, b) for a, b in zip(distinct, distinct[1:]) if b - a > 5]
+        coverage = segmenter.coverage()
+        assert (coverage["dated"], coverage["undated"]) == (len(dated), len(years) - len(dated))
+        if distinct:
+            span = distinct[-1] - distinct[0] + 1
+            assert (coverage["first_year"], coverage["last_year"]) == (distinct[0], distinct[-1])
+            assert coverage["years_covered"] == len(distinct)
+            assert coverage["density"] == len(distinct) / span
+            assert coverage["memories_per_year"] == len(dated) / span
+        else:
+            assert coverage["first_year"] is None and coverage["density"] == 0.0
+
+
+def test_build_timeline_without_llm():
+    """Test build_timeline(use_llm=False) reads the bank's segmenter and never calls the agent"""
+    print("\n21. Building a timeline without the LLM...")
+    bank = design.MemoryBank()
+    for memory_id, year, age in [("a", 1958, 8), ("b", 1966, 16), ("c", 1980, 30), ("d", 1966, 16)]:
+        bank.store(memory(f"a memory from age {age}", year, age, memory_id=memory_id))
+    bank.store(memory("a memory from age 40 after all", 1990, 40, memory_id="c"))  # Re-dated
+    agent = design.TimelineAgent(bank)
+
+    def no_llm(prompt):
+        raise AssertionError("build_timeline(use_llm=False) called the agent")
+    agent.run = no_llm
+
+    phases, gaps = agent.build_timeline(use_llm=False)
+    assert [phase.name for phase in phases] == ["childhood", "adolescence", "early_career"]
+    assert phases[2].start_year == phases[2].end_year == 1990
+    assert gaps == [(1958, 1966), (1966, 1990)]
+    assert agent.coverage["dated"] == 4 and agent.coverage["years_covered"] == 3
+    assert design.identify_life_phases(list(bank.memories.values())) == phases
+    assert design.detect_timeline_gaps(columns=bank.columns) == gaps
+
+
+if __name__ == "__main__":
+    try:
+        test_timeline_index_order()
+        test_bank_timeline_follows_restores()
+        test_theme_matcher_counts_every_keyword()
+        test_theme_matcher_cache_follows_content()
+        test_register_theme_on_existing_bank()
+        test_indexes_drop_empty_entries()
+        test_sqlite_and_memory_banks_agree()
+        test_sqlite_theme_registration_uses_trigram_index()
+        test_columns_match_memory_loops()
+        test_near_duplicates_merge_and_link()
+        test_interview_with_dedup_collects_every_distinct_answer()
+        test_reinterview_overlapping_period()
+        test_memory_ids_are_unique_and_ordered()
+        test_packed_index_keys()
+        test_people_graph_follows_restores()
+        test_relationship_tool_reads_the_graph()
+        test_frequent_items_bounds()
+        test_profiler_features_and_patterns()
+        test_segmenter_stage_boundaries()
+        test_segmenter_gaps_and_coverage_follow_updates()
+        test_build_timeline_without_llm()
+        print("\n✅ All autobiography design tests passed!")
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        print(f"Traceback: {traceback.format_exc()}")
+        sys.exit(1)
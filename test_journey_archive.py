@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Test journey export and import round trips
+"""
+
+import io
+import sys
+import tarfile
+import tempfile
+import traceback
+from pathlib import Path
+
+from emergence_engine import ThreePassTracker
+from emergence_engine.journey_archive import export_archive, import_archive
+
+
+def _make_journey(tracker: ThreePassTracker, project: str) -> Path:
+    tracker.start_journey("Archive Test", project)
+    tracker.next_phase(project)
+    pass_dir = Path(project) / "3_pass_thinking" / "global_system" / "layer_0" / "pass_1"
+    pass_dir.mkdir(parents=True)
+    phase_file = pass_dir / "0_AbstractGoal.md"
+    phase_file.write_bytes(b"# Goal\n" + b"x" * 3_000_000)
+    tracker.record_phase_file(project, str(phase_file))
+    (Path(project) / "unrelated.txt").write_text("not exported")
+    return phase_file
+
+
+def test_round_trip_to_new_project():
+    """Test a journey restores into another project path"""
+    print("\n1. Exporting and importing a journey...")
+    with tempfile.TemporaryDirectory() as states, tempfile.TemporaryDirectory() as work:
+        tracker = ThreePassTracker(states)
+        source, target = str(Path(work) / "source"), str(Path(work) / "target")
+        Path(source).mkdir()
+        _make_journey(tracker, source)
+
+        archive = Path(work) / "journey.tar.gz"
+        summary = export_archive(source, archive, tracker)
+        print(f"   Exported {summary.tree_files} files, archive {archive.stat().st_size} bytes")
+        assert summary.tracker_files == 4 and summary.tree_files == 1
+
+        with tarfile.open(str(archive)) as tar:
+            names = tar.getnames()
+        assert names[0] == "journey/manifest.json"
+        assert not any("unrelated" in name for name in names)
+
+        import_archive(archive, target, tracker=tracker)
+        assert tracker.get_current_state(target) == "L0P1W[0](1)"
+        restored = Path(target) / "3_pass_thinking" / "global_system" / "layer_0" / "pass_1" / "0_AbstractGoal.md"
+        assert restored.stat().st_size == 3_000_007
+        assert "Phase Artifacts (global): 1/63" in tracker.get_status(target)
+        assert [t["to"] for t in tracker.get_transitions(target)] == ["L0P1W[0](1)"]
+        assert "to L0P1W[0](0)" in tracker.rewind(target, steps=1)
+
+
+def test_import_refuses_existing_and_unsafe():
+    """Test imports don't clobber journeys or write outside the project"""
+    print("\n2. Refusing existing journeys and unsafe archives...")
+    with tempfile.TemporaryDirectory() as states, tempfile.TemporaryDirectory() as project:
+        tracker = ThreePassTracker(states)
+        _make_journey(tracker, project)
+        buffer = io.BytesIO()
+        export_archive(project, buffer, tracker)
+
+        buffer.seek(0)
+        try:
+            import_archive(buffer, tracker=tracker)
+            raise AssertionError("Expected FileExistsError")
+        except FileExistsError:
+            pass
+
+        evil = io.BytesIO()
+        with tarfile.open(fileobj=evil, mode="w:gz") as tar:
+            manifest = b'{"format": 1, "starlog_path": "/tmp/x"}'
+            info = tarfile.TarInfo("journey/manifest.json")
+            info.size = len(manifest)
+            tar.addfile(info, io.BytesIO(manifest))
+            info = tarfile.TarInfo("journey/3_pass_thinking/../../escape.md")
+            tar.addfile(info, io.BytesIO(b""))
+        evil.seek(0)
+        try:
+            import_archive(evil, project, overwrite=True, tracker=tracker)
+            raise AssertionError("Expected ValueError")
+        except ValueError:
+            pass
+        assert tracker.get_current_state(project) == "L0P1W[0](1)"
+
+
+def test_overwrite_replaces_tree_and_failed_import_changes_nothing():
+    """Test overwrite drops stale phase files and a broken archive leaves the target untouched"""
+    print("\n3. Overwriting and failing part-way...")
+    with tempfile.TemporaryDirectory() as states, tempfile.TemporaryDirectory() as work:
+        tracker = ThreePassTracker(states)
+        source, target = str(Path(work) / "source"), str(Path(work) / "target")
+        Path(source).mkdir()
+        _make_journey(tracker, source)
+        archive = Path(work) / "journey.tar.gz"
+        export_archive(source, archive, tracker)
+
+        import_archive(archive, target, tracker=tracker)
+        stale = Path(target) / "3_pass_thinking" / "stale.md"
+        stale.write_text("not in the archive")
+        import_archive(archive, target, overwrite=True, tracker=tracker)
+        assert not stale.exists()
+        assert len(list((Path(target) / "3_pass_thinking").rglob("*.md"))) == 1
+
+        # Valid tree entry followed by an unsafe one: the import must fail without touching the target
+        broken = io.BytesIO()
+        with tarfile.open(fileobj=broken, mode="w:gz") as tar:
+            manifest = b'{"format": 1, "starlog_path": "/tmp/x"}'
+            info = tarfile.TarInfo("journey/manifest.json")
+            info.size = len(manifest)
+            tar.addfile(info, io.BytesIO(manifest))
+            info = tarfile.TarInfo("journey/3_pass_thinking/partial.md")
+            info.size = 4
+            tar.addfile(info, io.BytesIO(b"half"))
+            info = tarfile.TarInfo("journey/../escape.md")
+            tar.addfile(info, io.BytesIO(b""))
+        broken.seek(0)
+        try:
+            import_archive(broken, target, overwrite=True, tracker=tracker)
+            raise AssertionError("Expected ValueError")
+        except ValueError:
+            pass
+        thinking = Path(target) / "3_pass_thinking"
+        assert not (thinking / "partial.md").exists()
+        assert len(list(thinking.rglob("*.md"))) == 1
+        assert sorted(p.name for p in Path(target).iterdir()) == ["3_pass_thinking"]
+
+
+if __name__ == "__main__":
+    try:
+        test_round_trip_to_new_project()
+        test_import_refuses_existing_and_unsafe()
+        test_overwrite_replaces_tree_and_failed_import_changes_nothing()
+        print("\n✅ All journey archive tests passed!")
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        print(f"Traceback: {traceback.format_exc()}")
+        sys.exit(1)
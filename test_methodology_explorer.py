@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Test path-addressed methodology reads and the listing page cache
+"""
+
+import sys
+import tempfile
+import traceback
+from pathlib import Path
+
+from emergence_engine.core import MethodologyExplorer
+
+
+def _write_tree(root: Path):
+    """Create a small methodology tree"""
+    (root / "docs").mkdir()
+    (root / "README.md").write_text("# Root\n")
+    (root / "docs" / "00_Overview.md").write_text("Overview " * 50)
+    (root / "docs" / "01_Guide.md").write_text("Guide ✓ " * 50)
+
+
+def test_read_path():
+    """Test reading by path and refusing paths outside the tree"""
+    print("\n1. Reading by path...")
+    with tempfile.TemporaryDirectory() as tmp:
+        _write_tree(Path(tmp))
+        explorer = MethodologyExplorer(tmp)
+
+        result = explorer.read_path("docs/00_Overview.md")
+        assert "**File**: docs/00_Overview.md" in result
+        assert "Overview Overview" in result
+
+        listing = explorer.read_path("docs")
+        assert "**Current Path**: docs" in listing
+        assert "01_Guide.md" in explorer.explore(2)
+
+        assert explorer.read_path("../outside.md").startswith("❌")
+        assert explorer.read_path("docs/missing.md").startswith("❌")
+
+
+def test_read_paths_caps():
+    """Test batch reads respect total and per-file caps"""
+    print("\n2. Batch reading with caps...")
+    with tempfile.TemporaryDirectory() as tmp:
+        _write_tree(Path(tmp))
+        explorer = MethodologyExplorer(tmp)
+
+        result = explorer.read_paths(["README.md", "docs/00_Overview.md", "docs/missing.md"])
+        print(f"   {result.splitlines()[0]}")
+        assert result.count("**Truncated**: no") == 2
+        assert "❌ File not found: docs/missing.md" in result
+
+        result = explorer.read_paths(["README.md", "docs/01_Guide.md"], max_total_bytes=100)
+        assert "100 bytes returned" in result
+        assert result.count("**Truncated**: yes") == 1
+
+        result = explorer.read_paths(["docs/01_Guide.md"], max_file_bytes=8)
+        assert "**Returned**: 6 bytes | **Truncated**: yes" in result
+
+
+def test_page_cache_invalidation():
+    """Test cached pages are reused until the directory changes"""
+    print("\n3. Listing page cache...")
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _write_tree(root)
+        explorer = MethodologyExplorer(tmp)
+        explorer.read_path("docs")
+
+        first = explorer.explore()
+        assert "(2 items)" in first
+        assert explorer.explore() is first
+
+        (root / "docs" / "02_Example.md").write_text("Example\n")
+        updated = explorer.explore()
+        print(f"   {updated.splitlines()[3]}")
+        assert "(3 items)" in updated
+        assert "02_Example.md" in explorer.explore(3)
+
+
+if __name__ == "__main__":
+    try:
+        test_read_path()
+        test_read_paths_caps()
+        test_page_cache_invalidation()
+        print("\n✅ All methodology explorer tests passed!")
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        print(f"Traceback: {traceback.format_exc()}")
+        sys.exit(1)
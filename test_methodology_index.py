@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Test the methodology link graph and related document lookup
+"""
+
+import sys
+import tempfile
+import traceback
+from pathlib import Path
+
+from emergence_engine import FileWatcher, MethodologyIndex, related_docs
+
+
+def _write_tree(root: Path):
+    """Create a small methodology tree with cross references"""
+    docs = root / "docs"
+    docs.mkdir()
+    (docs / "00_Overview.md").write_text("Start with [the guide](01_Guide.md) and 02_Example.md\n")
+    (docs / "01_Guide.md").write_text("See [overview](00_Overview.md#intro)\n")
+    (docs / "02_Example.md").write_text("Nothing links out from here\n")
+    (root / "README.md").write_text("Read docs/00_Overview.md and [web](https://example.com/x.md)\n")
+
+
+def test_link_graph():
+    """Test links and mentions are resolved into graph edges"""
+    print("\n1. Building link graph...")
+    with tempfile.TemporaryDirectory() as tmp:
+        _write_tree(Path(tmp))
+        graph = MethodologyIndex(tmp).build()
+        print(f"   Documents: {len(graph.documents)}")
+
+        assert graph.outgoing["docs/00_Overview.md"] == {"docs/01_Guide.md", "docs/02_Example.md"}
+        assert graph.outgoing["docs/01_Guide.md"] == {"docs/00_Overview.md"}
+        assert graph.incoming["docs/00_Overview.md"] == {"docs/01_Guide.md", "README.md"}
+        assert graph.outgoing["README.md"] == {"docs/00_Overview.md"}
+
+
+def test_related_ranking():
+    """Test mutual links outrank one-way links and shared neighbours"""
+    print("\n2. Ranking related documents...")
+    with tempfile.TemporaryDirectory() as tmp:
+        _write_tree(Path(tmp))
+        index = MethodologyIndex(tmp)
+        related = index.related("docs/00_Overview.md", k=2)
+        print(f"   Related: {related}")
+
+        assert related[0][0] == "docs/01_Guide.md"
+        assert len(related) == 2
+        assert index.related("missing.md") is None
+
+
+def test_incremental_refresh():
+    """Test edits are picked up without a full rebuild"""
+    print("\n3. Refreshing after edits...")
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _write_tree(root)
+        index = MethodologyIndex(tmp)
+        before = index.graph
+
+        (root / "docs" / "02_Example.md").write_text("Now links to [guide](01_Guide.md) and more\n")
+        (root / "docs" / "03_New.md").write_text("Back to 00_Overview.md\n")
+        (root / "README.md").unlink()
+        changes = index.refresh()
+        print(f"   Changes: {changes}")
+
+        assert changes.added == {"docs/03_New.md"}
+        assert changes.changed == {"docs/02_Example.md"}
+        assert changes.removed == {"README.md"}
+        assert index.graph is not before
+        assert "docs/02_Example.md" in index.graph.incoming["docs/01_Guide.md"]
+        assert index.graph.incoming["docs/00_Overview.md"] == {"docs/01_Guide.md", "docs/03_New.md"}
+        assert not index.refresh()
+
+
+def test_watcher_reindexes():
+    """Test the polling watcher feeds changes into the index"""
+    print("\n4. Watching for changes...")
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _write_tree(root)
+        index = MethodologyIndex(tmp)
+        watcher = FileWatcher(use_inotify=False)
+        index.build()
+        watcher.watch(tmp, index.apply_changes)
+
+        (root / "docs" / "04_Later.md").write_text("See 01_Guide.md\n")
+        results = watcher.check()
+        print(f"   Backend: {watcher.backend}, results: {results}")
+
+        assert "docs/04_Later.md" in index.graph.documents
+        assert "docs/04_Later.md" in index.graph.incoming["docs/01_Guide.md"]
+        watcher.close()
+
+
+def test_related_beyond_precomputed():
+    """Test k larger than the precomputed list is honoured, not clamped"""
+    print("\n5. Asking for more related documents than are precomputed...")
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        links = " ".join(f"[d{i}](doc_{i:02d}.md)" for i in range(30))
+        (root / "hub.md").write_text(links + "\n")
+        for i in range(30):
+            (root / f"doc_{i:02d}.md").write_text("leaf\n")
+        index = MethodologyIndex(tmp)
+
+        assert len(index.related("hub.md", k=5)) == 5
+        related = index.related("hub.md", k=25)
+        print(f"   Returned {len(related)} of 25")
+        assert len(related) == 25
+        assert len(index.related("hub.md", k=100)) == 30
+
+        # The graph answers directly, for the same keys the index normalizes to
+        graph = index.graph
+        assert graph.related("hub.md", k=25) == related
+        assert graph.related("doc_00.md", k=3) == [
+            ("hub.md", 2.0, "linked from"), ("doc_01.md", 1.0, "1 shared"), ("doc_02.md", 1.0, "1 shared")]
+        assert graph.related("missing.md") is None
+
+
+def test_bundled_related_docs():
+    """Test related_docs against the bundled methodology"""
+    print("\n6. Querying bundled methodology...")
+    result = related_docs("diagrams/README.md", 3)
+    print(f"   {result.splitlines()[0]}")
+    assert "diagrams/00_complete_system_topology.md" in result
+
+
+if __name__ == "__main__":
+    try:
+        test_link_graph()
+        test_related_ranking()
+        test_incremental_refresh()
+        test_watcher_reindexes()
+        test_related_beyond_precomputed()
+        test_bundled_related_docs()
+        print("\n✅ All methodology index tests passed!")
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        print(f"Traceback: {traceback.format_exc()}")
+        sys.exit(1)
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Test diff-based methodology sync with atomic swap
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import traceback
+from pathlib import Path
+
+from emergence_engine import MethodologySync, fs_util
+from emergence_engine.methodology_sync import SOURCE_ENV_VAR, DirectorySource, open_source
+
+
+def _write_source(root: Path):
+    """Create a small methodology source tree"""
+    (root / "docs").mkdir(parents=True)
+    (root / "README.md").write_text("# Methodology\n")
+    (root / "docs" / "00_Overview.md").write_text("Overview\n")
+    (root / "docs" / "01_Guide.md").write_text("Guide\n")
+
+
+def test_initial_and_noop_sync():
+    """Test first sync copies everything and a repeat sync swaps nothing"""
+    print("\n1. Initial sync...")
+    with tempfile.TemporaryDirectory() as tmp:
+        source, target = Path(tmp) / "source", Path(tmp) / "target"
+        _write_source(source)
+        syncer = MethodologySync(str(target))
+
+        result = syncer.sync(open_source(str(source)))
+        print(f"   Added {len(result.added)} in {result.elapsed_ms:.1f}ms")
+        assert result.swapped and len(result.added) == 3
+        assert (target / "docs" / "01_Guide.md").read_text() == "Guide\n"
+
+        print("\n2. No-op sync...")
+        result = syncer.sync(open_source(str(source)))
+        assert not result.swapped and result.unchanged == 3
+
+
+def test_incremental_sync():
+    """Test only changed files are rewritten and removed files disappear"""
+    print("\n3. Incremental sync...")
+    with tempfile.TemporaryDirectory() as tmp:
+        source, target = Path(tmp) / "source", Path(tmp) / "target"
+        _write_source(source)
+        syncer = MethodologySync(str(target))
+        syncer.sync(open_source(str(source)))
+        unchanged_inode = os.stat(target / "docs" / "00_Overview.md").st_ino
+
+        (source / "docs" / "01_Guide.md").write_text("Guide, revised\n")
+        (source / "README.md").unlink()
+        (source / "docs" / "02_New.md").write_text("New\n")
+        result = syncer.sync(open_source(str(source)))
+        print(f"   {result}")
+
+        assert result.changed == {"docs/01_Guide.md"}
+        assert result.removed == {"README.md"}
+        assert result.added == {"docs/02_New.md"}
+        assert not (target / "README.md").exists()
+        assert (target / "docs" / "01_Guide.md").read_text() == "Guide, revised\n"
+        assert os.stat(target / "docs" / "00_Overview.md").st_ino == unchanged_inode
+        assert sorted(os.listdir(tmp)) == ["source", "target"]
+
+
+def test_sources_keep_separate_state():
+    """Test directory sources don't share scan state, and a failed update gets no follow-up hint"""
+    print("\n4. Independent sources and update errors...")
+    with tempfile.TemporaryDirectory() as tmp:
+        first, second = Path(tmp) / "first", Path(tmp) / "second"
+        _write_source(first)
+        second.mkdir()
+        (second / "only.md").write_text("Only\n")
+
+        assert len(DirectorySource(first).hashes()) == 3
+        fresh = DirectorySource(second)
+        assert fresh._known == {}
+        assert list(fresh.hashes()) == ["only.md"]
+
+    from emergence_engine.mcp_server import update_3pass_system
+    saved = os.environ.pop(SOURCE_ENV_VAR, None)
+    try:
+        result = update_3pass_system("", "", "HEAD")
+    finally:
+        if saved is not None:
+            os.environ[SOURCE_ENV_VAR] = saved
+    assert result.startswith("❌") and "explore_methodology_interface" not in result
+
+
+
+def test_swap_in_replaces_tree():
+    """Test a staged tree replaces the target, with and without the atomic exchange"""
+    print("\n5. Swapping in a staged tree...")
+    with tempfile.TemporaryDirectory() as tmp:
+        target, staging = Path(tmp) / "tree", Path(tmp) / ".tree.staging"
+
+        def stage(name: str):
+            staging.mkdir()
+            (staging / name).write_text(name)
+
+        stage("first.md")
+        fs_util.swap_in(staging, target)  # No target yet: a plain rename
+        assert os.listdir(target) == ["first.md"] and not staging.exists()
+
+        # The previous tree is left at the staging path for the caller to remove
+        stage("second.md")
+        fs_util.swap_in(staging, target)
+        assert os.listdir(target) == ["second.md"] and os.listdir(staging) == ["first.md"]
+        shutil.rmtree(staging)
+
+        stage("third.md")
+        saved = fs_util.exchange_paths
+        fs_util.exchange_paths = lambda a, b: False  # Platform without renameat2
+        try:
+            fs_util.swap_in(staging, target)
+        finally:
+            fs_util.exchange_paths = saved
+        assert os.listdir(target) == ["third.md"] and os.listdir(staging) == ["second.md"]
+        assert not Path(str(staging) + ".old").exists()
+
+
+if __name__ == "__main__":
+    try:
+        test_initial_and_noop_sync()
+        test_incremental_sync()
+        test_sources_keep_separate_state()
+        test_swap_in_replaces_tree()
+        print("\n✅ All methodology sync tests passed!")
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        print(f"Traceback: {traceback.format_exc()}")
+        sys.exit(1)
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test DSL notation parsing and direct journey seeks
+"""
+
+import sys
+import tempfile
+import traceback
+
+from emergence_engine import ThreePassTracker, format_notation, parse_notation
+
+
+def test_parse_and_format():
+    """Test plain and subscript notation round trips and validation"""
+    print("\n1. Parsing notation...")
+    assert parse_notation("L1P2W[1](4)") == (1, 2, 4)
+    assert parse_notation(" L₁P₂W[1](4) ") == (1, 2, 4)
+    assert parse_notation("L12P3W[12](6)") == (12, 3, 6)
+    assert format_notation(1, 2, 4) == "L1P2W[1](4)"
+    assert format_notation(0, 1, 3, subscript=True) == "L₀P₁W[0](3)"
+    assert str(parse_notation("L₀P₁W[0](3)")) == "L0P1W[0](3)"
+
+    for bad in ["L1P4W[1](0)", "L1P2W[0](4)", "L1P2W[1](7)", "L1P2(4)", "next"]:
+        try:
+            parse_notation(bad)
+        except ValueError as e:
+            print(f"   {bad}: {e}")
+            continue
+        raise AssertionError(f"Expected ValueError for {bad}")
+
+
+def test_seek_journey():
+    """Test seeking moves global and component journeys in one step"""
+    print("\n2. Seeking journeys...")
+    with tempfile.TemporaryDirectory() as states, tempfile.TemporaryDirectory() as project:
+        tracker = ThreePassTracker(states)
+        tracker.start_journey("Seek Test", project)
+        tracker.start_component(project, "auth")
+
+        assert tracker.seek(project, "L₁P₂W[1](4)") == "Moved from L0P1W[0](0) to L1P2W[1](4)"
+        assert tracker.get_current_state(project) == "L1P2W[1](4)"
+        tracker.next_phase(project)
+        assert tracker.get_current_state(project) == "L1P2W[1](5)"
+
+        tracker.seek(project, "L0P3W[0](6)", "auth")
+        assert tracker.get_current_state(project, "auth") == "L0P3W[0](6)"
+        assert tracker.get_current_state(project) == "L1P2W[1](5)"
+
+        try:
+            tracker.seek(project, "L1P2W[1](9)")
+            raise AssertionError("Expected ValueError")
+        except ValueError:
+            pass
+        assert tracker.get_current_state(project) == "L1P2W[1](5)"
+
+
+if __name__ == "__main__":
+    try:
+        test_parse_and_format()
+        test_seek_journey()
+        print("\n✅ All notation tests passed!")
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        print(f"Traceback: {traceback.format_exc()}")
+        sys.exit(1)
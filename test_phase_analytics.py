@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Test transition timestamps and incremental dwell-time analytics
+"""
+
+import os
+import sys
+import tempfile
+import traceback
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from emergence_engine import DwellStats, ThreePassTracker
+from emergence_engine import analytics
+from emergence_engine.analytics import PhaseAnalytics
+
+
+def test_dwell_stats():
+    """Test histogram percentiles stay within a bucket of the true value"""
+    print("\n1. Aggregating dwell times...")
+    stats = DwellStats()
+    for seconds in range(1, 1001):
+        stats.add(float(seconds))
+    assert stats.count == 1000 and stats.max == 1000.0
+    assert abs(stats.mean - 500.5) < 1e-9
+    assert abs(stats.percentile(50) - 500) / 500 < 0.1
+    assert abs(stats.percentile(95) - 950) / 950 < 0.1
+
+    other = DwellStats()
+    other.add(5000.0)
+    stats.merge(other)
+    assert stats.count == 1001 and stats.max == 5000.0
+
+
+def test_transitions_feed_analytics():
+    """Test each transition is timestamped and aggregated per (pass, phase, domain)"""
+    print("\n2. Recording transitions...")
+    with tempfile.TemporaryDirectory() as states, tempfile.TemporaryDirectory() as a, \
+            tempfile.TemporaryDirectory() as b:
+        tracker = ThreePassTracker(states)
+        for project, domain, minutes in [(a, "Autobiography", 10), (b, "Compiler", 30)]:
+            tracker.start_journey(domain, project)
+            state = tracker._load_state(project)
+            state.phase_entered_at = datetime.now() - timedelta(minutes=minutes)
+            tracker._save_state(project, state)
+            tracker.next_phase(project)
+            tracker.next_phase(project)
+
+        transitions = tracker.get_transitions(a)
+        assert [t["to"] for t in transitions] == ["L0P1W[0](1)", "L0P1W[0](2)"]
+        assert 599 < transitions[0]["dwell_seconds"] < 610
+
+        report = tracker.get_phase_analytics(phase=0)
+        print("   " + report.replace("\n", "\n   "))
+        row = report.splitlines()[2].split()
+        assert row[:2] == ["P1", "(0)[AbstractGoal]"] and row[2] == "2"
+        assert row[3] == "20.0m" and row[-1] == "30.0m"
+
+        assert "P1 (1)[SystemsDesign]" in tracker.get_phase_analytics("Compiler")
+        assert tracker.get_phase_analytics("Unknown").startswith("No phase transitions")
+
+
+def test_failed_write_keeps_aggregates():
+    """Test a write that dies part-way leaves the previous aggregates intact"""
+    print("\n3. Failing a write part-way...")
+    with tempfile.TemporaryDirectory() as states:
+        store = PhaseAnalytics(Path(states) / "phase_analytics.json")
+        store.record(1, 0, "Compiler", 60.0)
+
+        original = analytics.json.dump
+
+        def dump_then_fail(data, f, **kwargs):
+            f.write('{"phases": {')
+            raise OSError("No space left on device")
+
+        analytics.json.dump = dump_then_fail
+        try:
+            store.record(1, 0, "Compiler", 120.0)
+            raise AssertionError("Expected OSError")
+        except OSError:
+            pass
+        finally:
+            analytics.json.dump = original
+
+        rows = store.query()
+        assert len(rows) == 1 and rows[0].stats.count == 1 and rows[0].stats.max == 60.0
+        assert sorted(os.listdir(states)) == ["phase_analytics.json", "phase_analytics.json.lock"]
+        store.record(1, 0, "Compiler", 120.0)
+        assert store.query()[0].stats.count == 2
+
+
+if __name__ == "__main__":
+    try:
+        test_dwell_stats()
+        test_transitions_feed_analytics()
+        test_failed_write_keeps_aggregates()
+        print("\n✅ All phase analytics tests passed!")
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        print(f"Traceback: {traceback.format_exc()}")
+        sys.exit(1)
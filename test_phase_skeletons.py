@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Test batch generation of phase file skeletons
+"""
+
+import json
+import sys
+import tempfile
+import traceback
+from pathlib import Path
+
+from emergence_engine import (abandon_journey, generate_phase_skeletons, get_phase_file_path, record_phase_file,
+                              start_journey)
+
+
+def test_generate_layer_skeletons():
+    """Test all 21 skeletons of a layer are written with front-matter and subphases"""
+    print("\n1. Generating layer skeletons...")
+    with tempfile.TemporaryDirectory() as project:
+        start_journey("Skeleton Test", project)
+        try:
+            result = generate_phase_skeletons(project)
+            print(f"   {result.splitlines()[-1]}")
+            assert "**Written**: 21" in result
+
+            pass_dir = Path(project) / "3_pass_thinking" / "global_system" / "layer_0" / "pass_2"
+            design = (pass_dir / "1_SystemsDesign.md").read_text()
+            assert design.startswith("---\nnotation: L0P2W[0](1)\n")
+            assert "## 1a PurposeCapture" in design and "## 1l DesignBrief" in design
+            assert len(list(pass_dir.glob("*.md"))) == 7
+
+            # Unedited skeletons are not phase artifacts yet
+            assert record_phase_file(project, str(pass_dir / "1_SystemsDesign.md")).startswith("❌")
+        finally:
+            abandon_journey(project)
+
+
+def test_regeneration_keeps_edits():
+    """Test regeneration only rewrites missing or untouched skeletons"""
+    print("\n2. Regenerating around edited files...")
+    with tempfile.TemporaryDirectory() as project:
+        start_journey("Skeleton Test", project)
+        try:
+            generate_phase_skeletons(project, run_type="local", component_name="auth")
+            pass_dir = Path(project) / "3_pass_thinking" / "component_specific" / "auth" / "layer_0" / "pass_1"
+            edited = pass_dir / "3_DSL.md"
+            edited.write_text(edited.read_text() + "\nTokens: user, session\n")
+            (pass_dir / "4_Topology.md").unlink()
+
+            result = generate_phase_skeletons(project, run_type="local", component_name="auth")
+            assert "**Written**: 1 | **Unchanged**: 19 | **Kept (edited)**: 1" in result
+            assert "Tokens: user, session" in edited.read_text()
+            assert record_phase_file(project, str(edited)).startswith("📄")
+        finally:
+            abandon_journey(project)
+
+
+def test_manifest_written_before_skeletons():
+    """Test each skeleton is already in the manifest when it appears, so watchers skip it"""
+    print("\n3. Checking manifest is saved before files...")
+    with tempfile.TemporaryDirectory() as project:
+        start_journey("Skeleton Test", project)
+        thinking_dir = Path(project) / "3_pass_thinking"
+        unmarked = []
+        original = Path.write_bytes
+
+        def checked_write(path, data):
+            manifest = json.loads((thinking_dir / ".skeleton_manifest.json").read_text())
+            target = path.with_name(path.name[1:-len(".tmp")])
+            if target.relative_to(thinking_dir).as_posix() not in manifest["files"]:
+                unmarked.append(target)
+            return original(path, data)
+
+        Path.write_bytes = checked_write
+        try:
+            assert "**Written**: 21" in generate_phase_skeletons(project)
+        finally:
+            Path.write_bytes = original
+            abandon_journey(project)
+        assert not unmarked, unmarked
+
+
+def test_rejects_escaping_component_names():
+    """Test component names can't point outside the component tree"""
+    print("\n4. Rejecting unsafe component names...")
+    with tempfile.TemporaryDirectory() as project:
+        start_journey("Skeleton Test", project)
+        try:
+            for name in ("../escape", "..", "a/b"):
+                assert generate_phase_skeletons(project, run_type="local", component_name=name).startswith("❌")
+                assert get_phase_file_path(project, "local", name).startswith("Invalid component name")
+            assert not (Path(project) / "3_pass_thinking" / "escape").exists()
+        finally:
+            abandon_journey(project)
+
+
+if __name__ == "__main__":
+    try:
+        test_generate_layer_skeletons()
+        test_regeneration_keeps_edits()
+        test_manifest_written_before_skeletons()
+        test_rejects_escaping_component_names()
+        print("\n✅ All phase skeleton tests passed!")
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        print(f"Traceback: {traceback.format_exc()}")
+        sys.exit(1)
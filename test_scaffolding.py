@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test bulk 3-pass directory scaffolding
+"""
+
+import shutil
+import sys
+import tempfile
+import traceback
+from pathlib import Path
+
+from emergence_engine import inject_3pass_structure, inject_3pass_structures
+
+
+def test_bulk_scaffolding():
+    """Test many components are scaffolded in one call and skipped afterwards"""
+    print("\n1. Scaffolding 50 components...")
+    with tempfile.TemporaryDirectory() as tmp:
+        components = [f"component_{i}" for i in range(50)]
+        result = inject_3pass_structures(tmp, components)
+        print(f"   {result.splitlines()[3]}")
+
+        thinking = Path(tmp) / "3_pass_thinking"
+        assert "51 scaffolded" in result
+        assert (thinking / "global_system" / "layer_2" / "pass_3").is_dir()
+        assert (thinking / "component_specific" / "component_49" / "layer_0" / "pass_1").is_dir()
+
+        print("\n2. Repeating the call...")
+        result = inject_3pass_structures(tmp, components)
+        assert "Up To Date" in result
+
+
+def test_verify_repairs_missing_dirs():
+    """Test verify mode recreates directories removed after scaffolding"""
+    print("\n3. Verifying after manual deletion...")
+    with tempfile.TemporaryDirectory() as tmp:
+        inject_3pass_structures(tmp, ["auth"], include_global=False)
+        layer = Path(tmp) / "3_pass_thinking" / "component_specific" / "auth" / "layer_1"
+        shutil.rmtree(layer)
+
+        result = inject_3pass_structures(tmp, ["auth"], include_global=False, verify=True)
+        assert "**Directories Created**: 4" in result
+        assert (layer / "pass_2").is_dir()
+
+
+def test_single_inject_records_manifest():
+    """Test single-tree injection is recognised by bulk mode"""
+    print("\n4. Mixing single and bulk injection...")
+    with tempfile.TemporaryDirectory() as tmp:
+        inject_3pass_structure(tmp, "global")
+        inject_3pass_structure(tmp, "billing")
+        assert "Up To Date" in inject_3pass_structures(tmp, ["billing"])
+        assert inject_3pass_structures(tmp, ["../escape"]).startswith("❌")
+
+
+if __name__ == "__main__":
+    try:
+        test_bulk_scaffolding()
+        test_verify_repairs_missing_dirs()
+        test_single_inject_records_manifest()
+        print("\n✅ All scaffolding tests passed!")
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        print(f"Traceback: {traceback.format_exc()}")
+        sys.exit(1)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Test journey snapshots, rewinds and retention
+"""
+
+import sys
+import tempfile
+import traceback
+
+from emergence_engine import ThreePassTracker
+
+
+def test_rewind_by_steps_and_notation():
+    """Test rewinds restore earlier positions and can be undone"""
+    print("\n1. Rewinding a journey...")
+    with tempfile.TemporaryDirectory() as states, tempfile.TemporaryDirectory() as project:
+        tracker = ThreePassTracker(states)
+        tracker.start_journey("Snapshot Test", project)
+        for _ in range(9):
+            tracker.next_phase(project)
+        assert tracker.get_current_state(project) == "L0P2W[0](2)"
+
+        print(f"   {tracker.rewind(project, steps=3)}")
+        assert tracker.get_current_state(project) == "L0P1W[0](6)"
+        tracker.rewind(project, steps=1)
+        assert tracker.get_current_state(project) == "L0P2W[0](2)"
+
+        tracker.rewind(project, notation="L₀P₁W[0](3)")
+        assert tracker.get_current_state(project) == "L0P1W[0](3)"
+        assert tracker.rewind(project, notation="L2P1W[2](0)").startswith("No retained snapshot")
+
+        listing = tracker.list_snapshots(project, limit=3)
+        print("   " + listing.replace("\n", "\n   "))
+        assert listing.splitlines()[1].split()[:2] == ["0", "L0P1W[0](3)"]
+
+
+def test_rewind_after_complete():
+    """Test a completed journey can be brought back"""
+    print("\n2. Rewinding a completed journey...")
+    with tempfile.TemporaryDirectory() as states, tempfile.TemporaryDirectory() as project:
+        tracker = ThreePassTracker(states)
+        tracker.start_journey("Snapshot Test", project)
+        tracker.next_phase(project)
+        tracker.complete_journey(project)
+        assert tracker._load_state(project) is None
+
+        assert tracker.rewind(project, steps=1).startswith("Rewound from completed to L0P1W[0](1)")
+        assert tracker.get_current_state(project) == "L0P1W[0](1)"
+
+        # Without a state file every retained snapshot is reachable, and the bound says so
+        tracker.complete_journey(project)
+        assert len(tracker.get_snapshot_log(project).load()) == 3
+        assert tracker.rewind(project, steps=4) == "Can only rewind 1-3 steps."
+        assert tracker.rewind(project, steps=3).startswith("Rewound from completed to L0P1W[0](0)")
+
+
+def test_start_after_complete_drops_old_history():
+    """Test a new journey at the same path starts with no snapshots, transitions or artifacts"""
+    print("\n3. Starting over after completing a journey...")
+    with tempfile.TemporaryDirectory() as states, tempfile.TemporaryDirectory() as project:
+        tracker = ThreePassTracker(states)
+        tracker.start_journey("OldDomain", project)
+        for _ in range(5):
+            tracker.next_phase(project)
+        tracker.complete_journey(project)
+
+        tracker.start_journey("NewDomain", project)
+        assert len(tracker.get_snapshot_log(project).load()) == 1
+        assert tracker.get_transitions(project) == []
+        assert tracker.rewind(project, steps=1) == "No earlier snapshot to rewind to."
+
+        tracker.next_phase(project)
+        assert tracker.rewind(project, steps=1).startswith("Rewound from L0P1W[0](1) to L0P1W[0](0)")
+        assert tracker._load_state(project).domain == "NewDomain"
+
+
+def test_retention_caps_disk_use():
+    """Test the snapshot log stays within its byte cap"""
+    print("\n4. Capping snapshot retention...")
+    with tempfile.TemporaryDirectory() as states, tempfile.TemporaryDirectory() as project:
+        tracker = ThreePassTracker(states, max_snapshots=10, max_snapshot_bytes=4096)
+        tracker.start_journey("Snapshot Test", project)
+        for _ in range(200):
+            tracker.next_phase(project)
+
+        log = tracker.get_snapshot_log(project)
+        assert log.log_file.stat().st_size <= 4096
+        assert len(log.load()) <= 10
+        assert tracker.rewind(project, steps=50).startswith("Can only rewind")
+
+        tracker.abandon_journey(project)
+        assert not log.log_file.exists()
+
+
+if __name__ == "__main__":
+    try:
+        test_rewind_by_steps_and_notation()
+        test_rewind_after_complete()
+        test_start_after_complete_drops_old_history()
+        test_retention_caps_disk_use()
+        print("\n✅ All snapshot tests passed!")
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        print(f"Traceback: {traceback.format_exc()}")
+        sys.exit(1)
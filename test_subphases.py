@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test the parsed workflow model and subphase tracking
+"""
+
+import sys
+import tempfile
+import traceback
+
+from emergence_engine import ThreePassTracker, get_workflow, parse_workflow
+
+
+def test_master_prompt_parses():
+    """Test the bundled master prompt yields all phases and subphases"""
+    print("\n1. Parsing the master prompt workflow...")
+    workflow = get_workflow()
+    print(f"   Subphases per phase: {[len(p.subphases) for p in workflow.phases]}")
+    assert [p.name for p in workflow.phases][:2] == ["AbstractGoal", "SystemsDesign"]
+    assert [len(p.subphases) for p in workflow.phases] == [0, 12, 8, 6, 7, 7, 9]
+    assert workflow.by_code["1l"].name == "DesignBrief"
+    assert workflow.phases[3].definition.startswith("(3)[DSL→(3a)[ConceptTokenize]")
+    assert get_workflow() is workflow
+
+    try:
+        parse_workflow("(0)[AbstractGoal]→(2)[DSL]")
+        raise AssertionError("Expected ValueError for out-of-order phases")
+    except ValueError:
+        pass
+
+
+def test_subphase_tracking():
+    """Test subphases complete in order or by code and reset on advance"""
+    print("\n2. Tracking subphases...")
+    with tempfile.TemporaryDirectory() as states, tempfile.TemporaryDirectory() as project:
+        tracker = ThreePassTracker(states)
+        tracker.start_journey("Subphase Test", project)
+        assert tracker.next_subphase(project).startswith("All subphases of AbstractGoal complete")
+
+        tracker.next_phase(project)
+        result = tracker.next_subphase(project)
+        print(f"   {result}")
+        assert result.startswith("Completed (1a)[PurposeCapture] at L0P1W[0](1) (1/12)")
+        assert result.endswith("Next: (1b)[ContextMap]")
+
+        assert tracker.complete_subphase(project, "1c").endswith("(2/12). Next: (1b)[ContextMap]")
+        assert tracker.next_subphase(project).startswith("Completed (1b)[ContextMap]")
+        assert tracker._load_state(project).subphases_done == 0b111
+        assert "Subphases: 3/12 ✓✓✓········· | next: (1d)[SuccessMetrics]" in tracker.get_status(project)
+
+        try:
+            tracker.complete_subphase(project, "2a")
+            raise AssertionError("Expected ValueError for subphase outside the current phase")
+        except ValueError:
+            pass
+
+        tracker.next_phase(project)
+        assert tracker._load_state(project).subphases_done == 0
+
+
+if __name__ == "__main__":
+    try:
+        test_master_prompt_parses()
+        test_subphase_tracking()
+        print("\n✅ All subphase tests passed!")
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        print(f"Traceback: {traceback.format_exc()}")
+        sys.exit(1)